@@ -0,0 +1,4 @@
+"""
+Benchmarks - standalone performance checks for Timer App components.
+Run a module directly, e.g. `python -m benchmarks.playlist_bench --tracks 100000`.
+"""
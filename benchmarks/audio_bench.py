@@ -0,0 +1,147 @@
+"""
+Audio Stack Benchmark - drives ModularAudioSystem headless with a SimulatedAudioPlayer.
+
+For every repeat/shuffle combination it measures the real time from a track ending
+(on the virtual clock) to the next track playing, how often the process wakes up
+while a track plays, and how many threads the audio stack keeps alive.
+
+Usage:
+    python -m benchmarks.audio_bench [--tracks 20] [--transitions 50] [--idle 2.0] [--json report.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import threading
+import time
+from typing import Dict, List, Optional
+
+from timer_app.audio.factory import AudioSystemFactory
+from timer_app.audio.interfaces import RepeatMode, TrackInfo
+from timer_app.audio.simulated import SimulatedAudioPlayer, VirtualClock
+
+MODES = [
+    (RepeatMode.OFF, False),
+    (RepeatMode.OFF, True),
+    (RepeatMode.SINGLE, False),
+    (RepeatMode.PLAYLIST, False),
+    (RepeatMode.PLAYLIST, True),
+]
+
+
+def _context_switches() -> Optional[int]:
+    """Voluntary context switches of all threads of this process (Linux only)"""
+    task_dir = "/proc/self/task"
+    if not os.path.isdir(task_dir):
+        return None
+    total = 0
+    for task in os.listdir(task_dir):
+        try:
+            with open(os.path.join(task_dir, task, "status")) as f:
+                for line in f:
+                    if line.startswith("voluntary_ctxt_switches"):
+                        total += int(line.split()[1])
+        except OSError:
+            continue  # Thread exited while we were reading
+    return total
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_mode(repeat_mode: RepeatMode, shuffle: bool, tracks: int = 20,
+             transitions: int = 50, idle_seconds: float = 2.0) -> Dict[str, object]:
+    """Play through `transitions` track endings in one mode and collect the measurements"""
+    threads_before = threading.active_count()
+    clock = VirtualClock()
+    player = SimulatedAudioPlayer(clock)
+    system = AudioSystemFactory.create_custom_audio_system(player_impl=player)
+    for i in range(tracks):
+        system.add_track(TrackInfo(path=f"/virtual/track_{i:03d}.mp3", title=f"Track {i}", duration=180.0 + i))
+    while system.get_status()['repeat_mode'] != repeat_mode.value:
+        system.cycle_repeat_mode()
+    if shuffle:
+        system.toggle_shuffle()
+
+    latencies = []
+    system.load_and_play_track(0)
+    threads_playing = threading.active_count()
+
+    # Idle window mid-track: only the monitor should be waking up
+    polls_before = player.get_call_counts().get('get_state', 0)
+    switches_before = _context_switches()
+    idle_start = time.perf_counter()
+    time.sleep(idle_seconds)
+    idle_elapsed = time.perf_counter() - idle_start
+    polls = player.get_call_counts().get('get_state', 0) - polls_before
+    switches_after = _context_switches()
+
+    for _ in range(transitions):
+        plays = player.play_count()
+        ended_at = player.finish_track()
+        if not player.wait_for_play(plays):
+            break  # Playlist ended (repeat off) or the monitor stalled
+        latencies.append(time.perf_counter() - ended_at)
+
+    system.stop_playback()
+    time.sleep(0.05)
+    threads_after = threading.active_count()
+
+    result: Dict[str, object] = {
+        'repeat_mode': repeat_mode.value,
+        'shuffle': shuffle,
+        'transitions': len(latencies),
+        'monitor_polls_per_min': round(polls / idle_elapsed * 60),
+        'context_switches_per_min': (round((switches_after - switches_before) / idle_elapsed * 60)
+                                     if switches_before is not None else None),
+        'threads_before': threads_before,
+        'threads_playing': threads_playing,
+        'threads_after_stop': threads_after,
+    }
+    if latencies:
+        result.update({
+            'transition_ms_avg': round(statistics.mean(latencies) * 1000, 3),
+            'transition_ms_p95': round(_percentile(latencies, 0.95) * 1000, 3),
+            'transition_ms_max': round(max(latencies) * 1000, 3),
+        })
+    return result
+
+
+def run_benchmark(tracks: int = 20, transitions: int = 50, idle_seconds: float = 2.0) -> List[Dict[str, object]]:
+    results = []
+    for repeat_mode, shuffle in MODES:
+        # The audio stack prints on every transition; keep that out of the measurements
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_mode(repeat_mode, shuffle, tracks, transitions, idle_seconds)
+        results.append(result)
+        label = f"{result['repeat_mode']}{' + shuffle' if shuffle else ''}"
+        print(f"{label:<20} {result['transitions']:>4} transitions  "
+              f"avg {result.get('transition_ms_avg', '-'):>8} ms  p95 {result.get('transition_ms_p95', '-'):>8} ms  "
+              f"polls/min {result['monitor_polls_per_min']:>6}  wakeups/min {result['context_switches_per_min']}  "
+              f"threads {result['threads_before']}→{result['threads_playing']}→{result['threads_after_stop']}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the audio stack with a simulated player")
+    parser.add_argument('--tracks', type=int, default=20, help="Tracks in the playlist")
+    parser.add_argument('--transitions', type=int, default=50, help="Track endings to simulate per mode")
+    parser.add_argument('--idle', type=float, default=2.0, help="Seconds to measure wakeups mid-track")
+    parser.add_argument('--json', help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    print(f"📊 Audio stack benchmark: {args.tracks} tracks, {args.transitions} transitions per mode")
+    results = run_benchmark(args.tracks, args.transitions, args.idle)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'tracks': args.tracks, 'transitions': args.transitions, 'results': results}, f, indent=2)
+        print(f"💾 Report written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
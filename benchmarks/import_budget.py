@@ -0,0 +1,146 @@
+"""
+Import Budget - checks what the timer imports before its window can appear.
+
+Runs a fresh interpreter with `python -X importtime`, importing STARTUP_MODULES (what
+main.py needs up to the first paint), and fails (exit code 1) when the cumulative
+import time exceeds the budget, when one of them fails to import, or when a heavy
+dependency (pygame, PIL, mutagen, webview, NumPy, SciPy) is executed eagerly instead
+of on first use.
+
+By default only import time is measured. --first-paint also times a fresh
+interpreter building the application the way main.py does, up to the first
+update_idletasks() - this needs a display.
+
+Usage:
+    python -m benchmarks.import_budget [--budget-ms 250] [--runs 3] [--json report.json]
+                                       [--first-paint] [--paint-budget-ms 1000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+# Modules imported on the way to the first paint of main.py
+STARTUP_MODULES = [
+    'timer_app.factories.app_factory',
+    'timer_app.ui.widgets.menu_button',
+    'timer_app.ui.widgets.media_player_button',
+    'timer_app.ui.widgets.loop_controls',
+]
+
+# Must only load when the media player or browser is first opened
+DEFERRED_MODULES = ['pygame', 'PIL.Image', 'PIL.ImageTk', 'mutagen', 'webview', 'numpy', 'scipy.signal']
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_imports(modules: List[str]) -> Dict[str, object]:
+    """Import modules in a fresh interpreter; returns per-module cumulative µs and failures"""
+    # Import each module separately so one missing dependency doesn't hide the others
+    code = "\n".join(
+        f"try:\n    import {module}\nexcept Exception as e:\n    print('FAILED {module}', e)"
+        for module in modules)
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                             capture_output=True, text=True, cwd=PROJECT_ROOT)
+
+    # Lines look like "import time:  self_us |  cumulative_us |   name" (name indented by depth)
+    executed: Dict[str, int] = {}
+    top_level: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        module = name.strip()
+        executed[module] = int(cumulative_us)
+        if len(name) - len(name.lstrip()) <= 1:
+            top_level[module] = int(cumulative_us)
+    failures = [line for line in process.stdout.splitlines() if line.startswith("FAILED")]
+    return {
+        'total_ms': round(sum(top_level.values()) / 1000, 2),
+        'top_level_ms': {module: round(us / 1000, 2) for module, us in top_level.items()},
+        'modules': executed,
+        'failures': failures,
+    }
+
+
+# Same steps as main.py, stopping once Tk has drawn the window
+_FIRST_PAINT_CODE = """
+import time
+started = time.perf_counter()
+from timer_app.factories.app_factory import TimerApplicationFactory
+root, view = TimerApplicationFactory.create_application()
+root.update_idletasks()
+print('FIRST_PAINT_MS', (time.perf_counter() - started) * 1000)
+root.destroy()
+"""
+
+
+def measure_first_paint() -> Dict[str, object]:
+    """Time from the first import to the first update_idletasks() in a fresh interpreter"""
+    process = subprocess.run([sys.executable, "-c", _FIRST_PAINT_CODE],
+                             capture_output=True, text=True, cwd=PROJECT_ROOT)
+    for line in process.stdout.splitlines():
+        if line.startswith('FIRST_PAINT_MS'):
+            return {'first_paint_ms': round(float(line.split()[1]), 2)}
+    error = process.stderr.strip().splitlines()
+    return {'first_paint_ms': None, 'first_paint_error': error[-1] if error else f"exit code {process.returncode}"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the startup import budget")
+    parser.add_argument('--budget-ms', type=float, default=250.0, help="Allowed cumulative import time")
+    parser.add_argument('--runs', type=int, default=3, help="Fresh interpreters to measure (best run counts)")
+    parser.add_argument('--json', help="Write the results to this JSON file")
+    parser.add_argument('--first-paint', action='store_true',
+                        help="Also time main.py's startup up to the first paint (needs a display)")
+    parser.add_argument('--paint-budget-ms', type=float, default=1000.0, help="Allowed time to first paint")
+    args = parser.parse_args()
+
+    runs = [measure_imports(STARTUP_MODULES) for _ in range(max(1, args.runs))]
+    best = min(runs, key=lambda run: run['total_ms'])
+    eager = [module for module in DEFERRED_MODULES if module in best['modules']]
+
+    print(f"📊 Startup imports: {best['total_ms']} ms (budget {args.budget_ms} ms, best of {len(runs)})")
+    slowest = sorted(((ms, name) for name, ms in best['top_level_ms'].items()), reverse=True)
+    for ms, name in slowest[:10]:
+        print(f"  {ms:8.2f} ms  {name}")
+    for failure in best['failures']:
+        print(f"⚠️ {failure}")
+
+    paint = {}
+    if args.first_paint:
+        paint = min((measure_first_paint() for _ in range(max(1, args.runs))),
+                    key=lambda run: run['first_paint_ms'] if run['first_paint_ms'] is not None else float('inf'))
+        if paint['first_paint_ms'] is not None:
+            print(f"🖼️ First paint: {paint['first_paint_ms']} ms (budget {args.paint_budget_ms} ms)")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'budget_ms': args.budget_ms, 'eager_heavy_modules': eager, **best, **paint}, f, indent=2)
+        print(f"💾 Report written to {args.json}")
+
+    ok = True
+    if best['failures']:
+        print(f"❌ {len(best['failures'])} startup module(s) failed to import - the time above is incomplete")
+        ok = False
+    if paint and paint['first_paint_ms'] is None:
+        print(f"❌ First paint not reached: {paint['first_paint_error']}")
+        ok = False
+    elif paint and paint['first_paint_ms'] > args.paint_budget_ms:
+        print(f"❌ First paint over budget by {paint['first_paint_ms'] - args.paint_budget_ms:.1f} ms")
+        ok = False
+    if eager:
+        print(f"❌ Loaded at startup instead of on first use: {', '.join(eager)}")
+        ok = False
+    if best['total_ms'] > args.budget_ms:
+        print(f"❌ Over budget by {best['total_ms'] - args.budget_ms:.1f} ms")
+        ok = False
+    if ok:
+        print("✅ Within budget")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Playlist Benchmark - measures AudioPlaylist operations on very large playlists.
+
+Usage:
+    python -m benchmarks.playlist_bench --tracks 100000 [--ops 2000] [--json report.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import time
+from typing import Callable, Dict
+
+from timer_app.audio.interfaces import TrackInfo
+from timer_app.audio.playlist import AudioPlaylist
+
+
+def _timed(label: str, results: Dict[str, dict], count: int, func: Callable[[], None]) -> None:
+    """Run func once (it performs `count` operations) and record per-op timings"""
+    # AudioPlaylist prints on every change; keep that out of the measurements
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+    results[label] = {
+        'operations': count,
+        'total_seconds': round(elapsed, 6),
+        'microseconds_per_op': round(elapsed / max(count, 1) * 1e6, 3),
+    }
+    print(f"{label:<24} {count:>8} ops  {elapsed:8.3f}s  {results[label]['microseconds_per_op']:10.2f} µs/op")
+
+
+def run_benchmark(tracks: int = 100000, ops: int = 2000, seed: int = 42) -> Dict[str, dict]:
+    """Build a playlist of `tracks` entries and time the common operations"""
+    rng = random.Random(seed)
+    playlist = AudioPlaylist()
+    results: Dict[str, dict] = {}
+    paths = [f"/music/artist_{i % 500}/track_{i:06d}.mp3" for i in range(tracks)]
+
+    def add_all():
+        for i, path in enumerate(paths):
+            playlist.add_track(TrackInfo(path=path, title=f"Track {i}"))
+
+    def duplicate_checks():
+        for _ in range(ops):
+            playlist.contains_path(paths[rng.randrange(tracks)])
+
+    def random_inserts():
+        for i in range(ops):
+            track = TrackInfo(path=f"/music/inserted/{i}.mp3", title=f"Inserted {i}")
+            playlist.insert_track(rng.randrange(playlist.get_playlist_size() + 1), track)
+
+    def random_moves():
+        size = playlist.get_playlist_size()
+        for _ in range(ops):
+            playlist.move_track(rng.randrange(size), rng.randrange(size))
+
+    def random_gets():
+        size = playlist.get_playlist_size()
+        for _ in range(ops):
+            playlist.get_track(rng.randrange(size))
+
+    def current_lookups():
+        playlist.set_current_index(playlist.get_playlist_size() // 2)
+        for _ in range(ops):
+            playlist.get_current_index()
+
+    def shuffle_steps():
+        playlist.enable_shuffle()
+        for _ in range(ops):
+            next_index = playlist.get_next_shuffle_index()
+            if next_index is not None:
+                playlist.set_current_index(next_index)
+        playlist.disable_shuffle()
+
+    def random_removes():
+        for _ in range(ops):
+            playlist.remove_track(rng.randrange(playlist.get_playlist_size()))
+
+    _timed('add_track', results, tracks, add_all)
+    _timed('contains_path', results, ops, duplicate_checks)
+    _timed('insert_track (random)', results, ops, random_inserts)
+    _timed('move_track (random)', results, ops, random_moves)
+    _timed('get_track (random)', results, ops, random_gets)
+    _timed('get_current_index', results, ops, current_lookups)
+    _timed('shuffle next', results, ops, shuffle_steps)
+    _timed('remove_track (random)', results, ops, random_removes)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AudioPlaylist at scale")
+    parser.add_argument('--tracks', type=int, default=100000, help="Number of tracks to load")
+    parser.add_argument('--ops', type=int, default=2000, help="Operations per measured step")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    print(f"📊 AudioPlaylist benchmark: {args.tracks} tracks, {args.ops} ops per step")
+    results = run_benchmark(args.tracks, args.ops, args.seed)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'tracks': args.tracks, 'ops': args.ops, 'results': results}, f, indent=2)
+        print(f"💾 Report written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
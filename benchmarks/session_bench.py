@@ -0,0 +1,239 @@
+"""
+Session Benchmark - measures the timer's session pipeline from 10 to 10,000 problems.
+
+For each size a session is generated on simulated time (every problem goes through
+all three stages and gets a note per stage), then the benchmark times:
+  - Session transitions (domain only) and SessionService transitions (in-memory storage)
+  - FileSessionStorage.save_session / load_session latency and bytes written
+  - the save that SessionService performs on every transition, at full size
+  - LogsPanel.update_logs against a stub Text widget (no window needed)
+  - memory per problem (tracemalloc)
+
+Usage:
+    python -m benchmarks.session_bench [--sizes 10 100 1000 10000] [--repeat 3] [--format json]
+                                       [--json report.json]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from timer_app.application.services import SessionService
+from timer_app.domain.clock import SimulatedClock
+from timer_app.domain.models import ProblemStage, Session, Stopwatch
+from timer_app.infrastructure.session_codec import SESSION_FORMATS
+from timer_app.infrastructure.storage import FileSessionStorage
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+STAGE_SECONDS = (240, 120, 90)  # Self doing, seeing solution, making note
+NOTED_STAGES = (ProblemStage.SELF_DOING, ProblemStage.SEEING_SOLUTION, ProblemStage.MAKING_NOTE)
+NOTE = "Two pointers from both ends; watch the off-by-one when the window shrinks. " * 2
+
+
+class _MemoryStorage:
+    """Storage that keeps nothing - isolates SessionService from disk"""
+    def save_session(self, session: Session, stopwatch: Stopwatch) -> None:
+        pass
+
+
+class _StubText:
+    """Just enough of tk.Text for LogsPanel.update_logs; counts what it's asked to do"""
+    def __init__(self):
+        self.inserts = 0
+        self.characters = 0
+        self.tag_binds = 0
+
+    def config(self, **kwargs):
+        pass
+
+    def delete(self, *args):
+        self.inserts = self.characters = self.tag_binds = 0
+
+    def insert(self, index, text, tags=None):
+        self.inserts += 1
+        self.characters += len(text)
+
+    def tag_bind(self, *args):
+        self.tag_binds += 1
+
+    def see(self, index):
+        pass
+
+    def yview(self, *args):
+        return (0.0, 1.0)
+
+    def yview_moveto(self, fraction):
+        pass
+
+
+class _StubLabel:
+    def config(self, **kwargs):
+        pass
+
+
+def _make_logs_panel():
+    """LogsPanel without building its Tk widgets"""
+    from timer_app.ui.widgets.logs_panel import LogsPanel
+    panel = LogsPanel.__new__(LogsPanel)
+    panel.bg_color = "black"
+    panel.is_visible = True
+    panel.current_problem = 0
+    panel.user_scrolled_manually = False
+    panel.last_scroll_position = None
+    panel.logs_text = _StubText()
+    panel.stats_label = _StubLabel()
+    return panel
+
+
+def _run_problems(session: Session, problems: int, clock: SimulatedClock, stopwatch: Stopwatch,
+                  transition: Callable[[str], None]) -> int:
+    """Walk `problems` problems through every stage; returns the number of transitions"""
+    transitions = 0
+    for _ in range(problems):
+        for step, seconds in zip(('start_self_doing', 'start_seeing_solution', 'start_making_note'), STAGE_SECONDS):
+            transition(step)
+            if session.current_problem_stage in NOTED_STAGES:
+                session.add_stage_note(session.current_problem_stage, NOTE)
+            clock.advance(seconds)
+            stopwatch.increment(seconds)
+            transitions += 1
+        transition('complete_problem')
+        transitions += 1
+    return transitions
+
+
+def build_session(problems: int) -> tuple:
+    """A finished session of `problems` problems with notes on every stage"""
+    clock = SimulatedClock()
+    session = Session(problems, clock=clock)
+    stopwatch = Stopwatch()
+    session.start_session(0)
+    _run_problems(session, problems, clock, stopwatch,
+                  lambda step: getattr(session, step)(stopwatch.time))
+    return session, stopwatch
+
+
+def _best_of(repeat: int, func: Callable[[], None]) -> float:
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def bench_size(problems: int, repeat: int, directory: str, session_format: str = 'json') -> Dict[str, object]:
+    """All measurements for one session size"""
+    result: Dict[str, object] = {'problems': problems}
+
+    # Domain transitions
+    clock = SimulatedClock()
+    session = Session(problems, clock=clock)
+    stopwatch = Stopwatch()
+    start = time.perf_counter()
+    transitions = _run_problems(session, problems, clock, stopwatch,
+                                lambda step: getattr(session, step)(stopwatch.time))
+    elapsed = time.perf_counter() - start
+    result['session_transition_us'] = round(elapsed / transitions * 1e6, 3)
+    result['log_entries'] = len(session.logs)
+
+    # Service transitions without disk
+    service_clock = SimulatedClock()
+    service_stopwatch = Stopwatch()
+    service = SessionService(Session(0, clock=service_clock), service_stopwatch, _MemoryStorage())
+    service.start_session(problems)
+    service_session, _ = service.get_session_data()
+    start = time.perf_counter()
+    transitions = _run_problems(service_session, problems, service_clock, service_stopwatch,
+                                lambda step: getattr(service, step)())
+    elapsed = time.perf_counter() - start
+    result['service_transition_us'] = round(elapsed / transitions * 1e6, 3)
+
+    # Memory per problem
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    measured, measured_stopwatch = build_session(problems)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    result['bytes_per_problem'] = round(allocated / problems)
+
+    # Storage round trip
+    storage_class = type('BenchSessionStorage', (FileSessionStorage,), {'SESSION_DIR': directory})
+    storage = storage_class(session_format)
+    result['save_ms'] = _ms(_best_of(repeat, lambda: storage.save_session(measured, measured_stopwatch)))
+    path = os.path.join(directory, f'session_{measured.session_id}.json')
+    result['bytes_written'] = os.path.getsize(path)
+    result['bytes_per_problem_on_disk'] = round(result['bytes_written'] / problems)
+    result['load_ms'] = _ms(_best_of(repeat, lambda: storage.load_session(measured.session_id)))
+
+    # What every button press costs at this size: a transition plus a full save
+    disk_service = SessionService(measured, measured_stopwatch, storage)
+    result['service_save_per_transition_ms'] = _ms(_best_of(repeat, disk_service.start_self_doing))
+    os.remove(path)
+
+    # Logs panel redraw
+    panel = _make_logs_panel()
+    result['update_logs_ms'] = _ms(_best_of(repeat, lambda: panel.update_logs(measured.logs, measured)))
+    result['update_logs_inserts'] = panel.logs_text.inserts
+    result['update_logs_tag_binds'] = panel.logs_text.tag_binds
+    return result
+
+
+def run_benchmark(sizes: List[int], repeat: int = 3, session_format: str = 'json') -> List[Dict[str, object]]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="session_bench_") as directory:
+        for problems in sizes:
+            result = bench_size(problems, repeat, directory, session_format)
+            results.append(result)
+            print(f"{problems:>6} problems  transition {result['session_transition_us']:8.2f} µs  "
+                  f"save {result['save_ms']:9.2f} ms  load {result['load_ms']:9.2f} ms  "
+                  f"{result['bytes_written'] / 1024:9.1f} KB  logs {result['update_logs_ms']:9.2f} ms  "
+                  f"{result['bytes_per_problem']:6} B/problem")
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the session pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Problems per session")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetitions per timing (best counts)")
+    parser.add_argument('--format', choices=SESSION_FORMATS, default='json', help="On-disk session format")
+    parser.add_argument('--json', help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    print(f"📊 Session benchmark: sizes {', '.join(map(str, args.sizes))}, {args.format} format")
+    results = run_benchmark(args.sizes, args.repeat, args.format)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'revision': _git_revision(),
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'repeat': args.repeat,
+                'format': args.format,
+                'results': results,
+            }, f, indent=2)
+        print(f"💾 Report written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
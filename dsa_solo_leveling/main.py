@@ -8,6 +8,7 @@ level up their programming skills.
 Following SOLID principles throughout the application architecture.
 """
 
+import logging
 import pygame
 import sys
 import os
@@ -22,6 +23,8 @@ from models.data_models import (
 )
 from ui.views import MainDashboard, QuestView, TopicDetailView
 
+logger = logging.getLogger("dsa_solo_leveling")
+
 
 class GameState(Enum):
     """Game states for navigation"""
@@ -177,7 +180,7 @@ class DSASoloLevelingApp:
             with open('player_stats.json', 'w') as f:
                 json.dump(stats_data, f, indent=2)
         except Exception as e:
-            print(f"Error saving player stats: {e}")
+            logger.error("Error saving player stats: %s", e)
     
     def _load_player_stats(self):
         """Load player statistics"""
@@ -194,7 +197,7 @@ class DSASoloLevelingApp:
         except FileNotFoundError:
             pass  # Use default stats
         except Exception as e:
-            print(f"Error loading player stats: {e}")
+            logger.error("Error loading player stats: %s", e)
     
     def handle_events(self):
         """Handle pygame events"""
@@ -270,6 +273,12 @@ class DSASoloLevelingApp:
 
 def main():
     """Entry point for the application"""
+    try:
+        from timer_app.infrastructure.app_logging import configure_logging
+        configure_logging()
+    except ImportError:  # Run on its own, without the timer package on the path
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Check if data file exists
     data_file = "dsa_queastions.json"
     if not os.path.exists(data_file):
@@ -9,12 +9,15 @@ Following SOLID principles:
 - Dependency Inversion: Depends on abstractions, not concretions
 """
 
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from enum import Enum
 import json
 
+logger = logging.getLogger("dsa_solo_leveling.models")
+
 
 class DifficultyLevel(Enum):
     """Enumeration for question difficulty levels"""
@@ -185,7 +188,7 @@ class JSONDataLoader(DataLoader):
             return steps
             
         except Exception as e:
-            print(f"Error loading data: {e}")
+            logger.error("Error loading data: %s", e)
             return []
 
 
@@ -201,7 +204,7 @@ class ProgressTracker:
             with open(file_path, 'w') as file:
                 json.dump(self.progress_data, file, indent=2)
         except Exception as e:
-            print(f"Error saving progress: {e}")
+            logger.error("Error saving progress: %s", e)
     
     def load_progress(self, file_path: str = "progress.json"):
         """Load progress from file"""
@@ -211,7 +214,7 @@ class ProgressTracker:
         except FileNotFoundError:
             self.progress_data = {}
         except Exception as e:
-            print(f"Error loading progress: {e}")
+            logger.error("Error loading progress: %s", e)
             self.progress_data = {}
     
     def update_topic_status(self, topic_id: str, status: QuestStatus):
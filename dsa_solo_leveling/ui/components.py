@@ -7,6 +7,7 @@ Following SOLID principles for UI component design:
 - Interface Segregation: Focused component interfaces
 """
 
+import logging
 import pygame
 import math
 import json
@@ -17,6 +18,8 @@ from enum import Enum
 
 from models.data_models import Step, SubStep, Topic, QuestStatus, PlayerStats
 
+logger = logging.getLogger("dsa_solo_leveling.ui")
+
 
 class ComponentState(Enum):
     """States for interactive components"""
@@ -785,7 +788,7 @@ class ChecklistItem(UIComponent):
                     for button_type, button_rect, button_link in self.action_buttons:
                         if button_rect.collidepoint(mouse_pos):
                             self._open_link(button_link)
-                            print(f"🔗 Opening {button_type}: {button_link}")
+                            logger.info("🔗 Opening %s: %s", button_type, button_link)
                             return True
                 
                 # Check if clicking on tooltip buttons (if tooltip is visible)
@@ -819,9 +822,9 @@ class ChecklistItem(UIComponent):
         try:
             import webbrowser
             webbrowser.open(url)
-            print(f"🔗 Opening: {url}")
+            logger.info("🔗 Opening: %s", url)
         except Exception as e:
-            print(f"❌ Error opening link: {e}")
+            logger.error("❌ Error opening link: %s", e)
     
     def _calculate_topic_tags_height(self, tooltip_width: int) -> int:
         """Calculate height needed for topic tags"""
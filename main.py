@@ -1,5 +1,10 @@
+import multiprocessing
+
 from timer_app.factories.app_factory import TimerApplicationFactory
+from timer_app.infrastructure.profiling import run_mainloop
 
 if __name__ == '__main__':
+    # Frozen builds start process-pool workers (audio analysis) by re-running this exe
+    multiprocessing.freeze_support()
     root, view = TimerApplicationFactory.create_application()
-    root.mainloop()
+    run_mainloop(root)  # Profiled when TIMER_PROFILE=1
@@ -1,7 +1,19 @@
-from typing import Protocol
+from typing import Callable, Iterable, Iterator, Optional, Protocol, Sequence
+from timer_app.domain.clock import Clock
 from timer_app.domain.models import Session, Stopwatch, ProblemStage
 
 
+class SchedulerInterface(Protocol):
+    """Interface for deferred callbacks (Tk's after loop or a simulation) - ISP"""
+    clock: Clock
+
+    def call_later(self, delay_ms: int, callback: Callable[[], None]) -> object:
+        ...
+
+    def cancel(self, handle: object) -> None:
+        ...
+
+
 class SessionStorageInterface(Protocol):
     """Interface for session storage - ISP"""
     def save_session(self, session: Session, stopwatch: Stopwatch) -> None:
@@ -13,6 +25,10 @@ class SessionStorageInterface(Protocol):
     def load_session(self, session_id: str) -> tuple[Session, Stopwatch]:
         ...
 
+    def load_many(self, session_ids: Iterable[str],
+                  fields: Optional[Sequence[str]] = None) -> Iterator[tuple[str, dict]]:
+        ...
+
 
 class SessionServiceInterface(Protocol):
     """Interface for session service with 3-stage workflow - ISP"""
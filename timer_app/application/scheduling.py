@@ -0,0 +1,131 @@
+"""
+Scheduling - Following Single Responsibility Principle (SOLID)
+This module only decides when the timer ticks.
+
+TimerTicker drives SessionService.increment_time() through a SchedulerInterface:
+TkScheduler for the real window (root.after), SimulatedScheduler for load tests
+and benchmarks, where a whole session runs on a SimulatedClock in milliseconds.
+Ticks are scheduled against the clock's monotonic time, so a late callback
+doesn't push every later tick back.
+"""
+import heapq
+import itertools
+from typing import Callable, List, Optional, Tuple
+
+from timer_app.domain.clock import Clock, SimulatedClock, SYSTEM_CLOCK
+from timer_app.infrastructure.metrics import REGISTRY
+
+_TICKS = REGISTRY.counter('timer_ticks_total', "Stopwatch seconds counted by the ticker")
+_TICK_JITTER = REGISTRY.histogram('timer_tick_jitter_seconds', "How late each tick callback ran",
+                                  (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0))
+
+
+class TkScheduler:
+    """Scheduler backed by Tk's event loop"""
+    def __init__(self, root, clock: Clock = None):
+        self._root = root
+        self.clock = clock or SYSTEM_CLOCK
+
+    def call_later(self, delay_ms: int, callback: Callable[[], None]) -> object:
+        return self._root.after(max(0, int(delay_ms)), callback)
+
+    def cancel(self, handle: object) -> None:
+        try:
+            self._root.after_cancel(handle)
+        except Exception:
+            pass  # Already fired or the window is gone
+
+
+class SimulatedScheduler:
+    """Scheduler on simulated time - callbacks only run when the clock is advanced"""
+    def __init__(self, clock: Optional[SimulatedClock] = None):
+        self.clock = clock or SimulatedClock()
+        self._queue: List[Tuple[float, int]] = []
+        self._callbacks = {}
+        self._sequence = itertools.count()
+
+    def call_later(self, delay_ms: int, callback: Callable[[], None]) -> object:
+        handle = next(self._sequence)
+        heapq.heappush(self._queue, (self.clock.monotonic() + max(0, delay_ms) / 1000, handle))
+        self._callbacks[handle] = callback
+        return handle
+
+    def cancel(self, handle: object) -> None:
+        self._callbacks.pop(handle, None)  # Stale queue entries are skipped when popped
+
+    @property
+    def pending(self) -> int:
+        return len(self._callbacks)
+
+    def advance(self, seconds: float) -> int:
+        """Move the clock forward, running due callbacks in order; returns how many ran"""
+        target = self.clock.monotonic() + seconds
+        ran = 0
+        while self._queue and self._queue[0][0] <= target:
+            due, handle = heapq.heappop(self._queue)
+            callback = self._callbacks.pop(handle, None)
+            if callback is None:
+                continue
+            self.clock.advance(max(0.0, due - self.clock.monotonic()))
+            callback()
+            ran += 1
+        self.clock.advance(max(0.0, target - self.clock.monotonic()))
+        return ran
+
+    def run_until_idle(self, max_callbacks: int = 1_000_000) -> int:
+        """Run callbacks until none are left (a running ticker never idles - use advance())"""
+        ran = 0
+        while self._callbacks and ran < max_callbacks:
+            due = self._queue[0][0]
+            ran += self.advance(max(0.0, due - self.clock.monotonic()))
+        return ran
+
+
+class TimerTicker:
+    """Increments the stopwatch by the whole seconds elapsed, checked once per interval, on any scheduler"""
+    def __init__(self, service, scheduler, interval_ms: int = 1000,
+                 on_tick: Optional[Callable[[], None]] = None):
+        self._service = service
+        self._scheduler = scheduler
+        self._interval_ms = interval_ms
+        self._interval = interval_ms / 1000
+        self._carry_ms = 0  # Elapsed time not yet counted as a whole second
+        self._on_tick = on_tick
+        self._handle = None
+        self._next_due = 0.0
+
+    def start(self) -> None:
+        if self._handle is not None:
+            return
+        self._next_due = self._scheduler.clock.monotonic() + self._interval
+        self._carry_ms = 0
+        self._schedule()
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._scheduler.cancel(self._handle)
+            self._handle = None
+
+    def is_running(self) -> bool:
+        return self._handle is not None
+
+    def _schedule(self) -> None:
+        delay = max(0.0, self._next_due - self._scheduler.clock.monotonic())
+        self._handle = self._scheduler.call_later(round(delay * 1000), self._tick)
+
+    def _tick(self) -> None:
+        # Catch up on ticks missed while the loop was blocked instead of losing them
+        now = self._scheduler.clock.monotonic()
+        _TICK_JITTER.observe(max(0.0, now - self._next_due))
+        ticks = 0
+        while self._next_due <= now + 1e-6:
+            ticks += 1
+            self._next_due += self._interval
+        # The stopwatch counts seconds, whatever the interval
+        seconds, self._carry_ms = divmod(self._carry_ms + ticks * self._interval_ms, 1000)
+        if seconds:
+            _TICKS.inc(seconds)
+            self._service.increment_time(seconds)
+            if self._on_tick:
+                self._on_tick()
+        self._schedule()
@@ -1,5 +1,8 @@
 from timer_app.domain.models import Session, Stopwatch, ProblemStage
 from timer_app.application.interfaces import SessionStorageInterface
+from timer_app.infrastructure.metrics import REGISTRY
+
+_TRANSITIONS = REGISTRY.counter('timer_session_transitions_total', "Session actions by kind")
 
 class SessionService:
     """Service for managing session operations with 3-stage workflow - SRP"""
@@ -7,38 +10,49 @@ class SessionService:
         self._session = session
         self._stopwatch = stopwatch
         self._storage = storage
+        self._stop_listeners = []
+
+    def add_stop_listener(self, callback) -> None:
+        """Call `callback()` after the session is stopped and saved"""
+        self._stop_listeners.append(callback)
 
     def start_self_doing(self) -> None:
         """Start the self-doing stage"""
+        _TRANSITIONS.inc(action='self_doing')
         self._session.start_self_doing(self._stopwatch.time)
         self._storage.save_session(self._session, self._stopwatch)
 
     def start_seeing_solution(self) -> None:
         """Start the solution viewing stage"""
+        _TRANSITIONS.inc(action='seeing_solution')
         self._session.start_seeing_solution(self._stopwatch.time)
         self._storage.save_session(self._session, self._stopwatch)
 
     def start_making_note(self) -> None:
         """Start the note-making stage"""
+        _TRANSITIONS.inc(action='making_note')
         self._session.start_making_note(self._stopwatch.time)
         self._storage.save_session(self._session, self._stopwatch)
 
     def complete_problem(self) -> None:
         """Complete the current problem"""
+        _TRANSITIONS.inc(action='complete')
         self._session.complete_problem(self._stopwatch.time)
         self._stopwatch.reset()  # Reset timer after completing problem
         self._storage.save_session(self._session, self._stopwatch)
 
     def reset_current_problem(self) -> None:
         """Reset the current problem (unsolve equivalent)"""
+        _TRANSITIONS.inc(action='reset')
         self._session.reset_current_problem(self._stopwatch.time)
         self._storage.save_session(self._session, self._stopwatch)
 
     def start_session(self, total_problems: int = None, session_name: str = None) -> None:
         """Start a new session with optional parameters"""
+        _TRANSITIONS.inc(action='start')
         if total_problems is not None:
             # Create new session with given parameters
-            self._session = Session(total_problems)
+            self._session = Session(total_problems, clock=self._session.clock)
             if session_name:
                 self._session.set_custom_session_name(session_name)
             self._stopwatch.reset()
@@ -52,11 +66,14 @@ class SessionService:
 
     def stop_session(self) -> None:
         """Stop the session with logging"""
+        _TRANSITIONS.inc(action='stop')
         self._session.stop_session(self._stopwatch.time)
         self._storage.save_session(self._session, self._stopwatch)
+        for listener in self._stop_listeners:
+            listener()
 
-    def increment_time(self) -> None:
-        self._stopwatch.increment()
+    def increment_time(self, seconds: int = 1) -> None:
+        self._stopwatch.increment(seconds)
 
     def get_session_data(self) -> tuple[Session, Stopwatch]:
         return self._session, self._stopwatch
@@ -75,13 +92,16 @@ class SessionService:
 
     def restore_session(self, session_id: str) -> None:
         """Restore a session from storage"""
+        _TRANSITIONS.inc(action='restore')
         restored_session, restored_stopwatch = self._storage.load_session(session_id)
+        restored_session.clock = self._session.clock  # Keep logging on this service's clock
         self._session = restored_session
         self._stopwatch = restored_stopwatch
     
     # Note handling methods
     def add_stage_note(self, stage: ProblemStage, note: str) -> None:
         """Add or update a note for a specific stage"""
+        _TRANSITIONS.inc(action='note')
         self._session.add_stage_note(stage, note, self._stopwatch.time)
         self._storage.save_session(self._session, self._stopwatch)
     
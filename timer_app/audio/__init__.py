@@ -6,10 +6,24 @@ Modular Audio System - Following SOLID Principles
 - Interface Segregation: Clients depend only on what they need
 - Dependency Inversion: Depend on abstractions, not concretions
 """
+import importlib
 
-from .factory import AudioSystemFactory
 from .interfaces import TrackInfo, RepeatMode, PlaybackState
-from .system import ModularAudioSystem
+
+# Imported on first access - the factory pulls in the pygame-backed player
+_LAZY_EXPORTS = {
+    'AudioSystemFactory': '.factory',
+    'ModularAudioSystem': '.system',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 # Public API
 __all__ = [
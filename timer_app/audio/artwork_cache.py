@@ -0,0 +1,210 @@
+"""
+Artwork Thumbnail Cache - Following Single Responsibility Principle (SOLID)
+This module only handles turning embedded cover art into ready-to-show thumbnails.
+
+Artwork is content-addressed (SHA-1 of the raw image bytes), resized once per UI size
+and stored as PNG on disk. Tk images are kept in a small LRU bounded by pixel bytes.
+"""
+import logging
+import hashlib
+import io
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, Tuple
+
+from timer_app.infrastructure.lazy_import import lazy_import
+
+logger = logging.getLogger(__name__)
+
+# Loaded on first use - the timer window shouldn't wait for PIL
+Image = lazy_import("PIL.Image")
+ImageTk = lazy_import("PIL.ImageTk")
+PIL_AVAILABLE = Image is not None and ImageTk is not None
+
+# Sizes (width, height) the media player UI renders artwork at
+ARTWORK_SIZE = (80, 80)
+THUMBNAIL_SIZES: Tuple[Tuple[int, int], ...] = (ARTWORK_SIZE,)
+
+# Marker stored in track metadata once a file was checked and has no artwork
+NO_ARTWORK = ""
+
+
+class ArtworkThumbnailCache:
+    """Content-addressed thumbnail cache with a byte-bounded in-memory LRU (Single Responsibility)"""
+
+    def __init__(self,
+                 cache_dir: str = "artwork_cache",
+                 sizes: Iterable[Tuple[int, int]] = THUMBNAIL_SIZES,
+                 max_memory_bytes: int = 8 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.sizes = tuple(sizes)
+        self.max_memory_bytes = max_memory_bytes
+
+        # LRU of Tk images: (artwork_hash, size) -> (photo, byte_size)
+        self._photos: "OrderedDict[Tuple[str, Tuple[int, int]], tuple]" = OrderedDict()
+        self._photo_bytes = 0
+
+        # Background population
+        self._jobs: "queue.Queue[tuple]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+    @staticmethod
+    def hash_artwork(artwork_data: bytes) -> str:
+        """Content address for raw artwork bytes"""
+        return hashlib.sha1(artwork_data).hexdigest()
+
+    def thumbnail_path(self, artwork_hash: str, size: Tuple[int, int] = ARTWORK_SIZE) -> str:
+        """Path of the pre-scaled PNG for a hash and size"""
+        return os.path.join(self.cache_dir, f"{artwork_hash}_{size[0]}x{size[1]}.png")
+
+    def has_thumbnails(self, artwork_hash: str) -> bool:
+        """Check if every configured size is already on disk"""
+        return all(os.path.exists(self.thumbnail_path(artwork_hash, size)) for size in self.sizes)
+
+    def store(self, artwork_data: bytes) -> Optional[str]:
+        """Decode and resize artwork to every UI size (blocking), return its hash"""
+        if not PIL_AVAILABLE or not artwork_data:
+            return None
+
+        artwork_hash = self.hash_artwork(artwork_data)
+        if self.has_thumbnails(artwork_hash):
+            return artwork_hash
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            image = Image.open(io.BytesIO(artwork_data))
+            image = image.convert("RGBA") if image.mode not in ("RGB", "RGBA") else image
+            for size in self.sizes:
+                target = self.thumbnail_path(artwork_hash, size)
+                if os.path.exists(target):
+                    continue
+                thumbnail = image.resize(size, Image.Resampling.LANCZOS)
+                temp_path = f"{target}.{threading.get_ident()}.tmp"
+                thumbnail.save(temp_path, format="PNG")
+                os.replace(temp_path, target)
+            return artwork_hash
+        except Exception as e:
+            logger.error("Error caching artwork thumbnail: %s", e)
+            return None
+
+    def store_async(self, artwork_data: bytes,
+                    callback: Optional[Callable[[Optional[str]], None]] = None) -> Optional[str]:
+        """Queue thumbnail generation in the background and return the hash right away"""
+        if not PIL_AVAILABLE or not artwork_data:
+            return None
+
+        artwork_hash = self.hash_artwork(artwork_data)
+        if self.has_thumbnails(artwork_hash):
+            if callback:
+                callback(artwork_hash)
+            return artwork_hash
+
+        self.submit(lambda: artwork_data, callback, key=artwork_hash)
+        return artwork_hash
+
+    def submit(self, loader: Callable[[], Optional[bytes]],
+               callback: Optional[Callable[[Optional[str]], None]] = None,
+               key: Optional[str] = None) -> bool:
+        """
+        Queue a background job that loads artwork bytes (e.g. by reading tags) and caches them.
+        The callback runs on the worker thread with the hash, NO_ARTWORK if nothing was found
+        or None if reading or caching the artwork failed.
+        Returns False if a job with the same key is already pending.
+        """
+        if not PIL_AVAILABLE:
+            return False
+
+        if key is not None:
+            with self._pending_lock:
+                if key in self._pending:
+                    return False
+                self._pending.add(key)
+
+        self._jobs.put((loader, callback, key))
+        self._ensure_worker()
+        return True
+
+    def get_photo(self, artwork_hash: Optional[str], size: Tuple[int, int] = ARTWORK_SIZE):
+        """Get a Tk image for a cached thumbnail (Tk thread only), None if not cached yet"""
+        if not PIL_AVAILABLE or not artwork_hash:
+            return None
+
+        key = (artwork_hash, size)
+        entry = self._photos.get(key)
+        if entry is not None:
+            self._photos.move_to_end(key)
+            return entry[0]
+
+        path = self.thumbnail_path(artwork_hash, size)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with Image.open(path) as image:
+                image.load()
+                photo = ImageTk.PhotoImage(image)
+        except Exception as e:
+            logger.error("Error loading cached artwork: %s", e)
+            return None
+
+        self._remember(key, photo, size[0] * size[1] * 4)
+        return photo
+
+    def clear_memory(self) -> None:
+        """Drop all in-memory Tk images (thumbnails stay on disk)"""
+        self._photos.clear()
+        self._photo_bytes = 0
+
+    def get_memory_usage(self) -> int:
+        """Approximate bytes held by cached Tk images"""
+        return self._photo_bytes
+
+    def _remember(self, key, photo, byte_size: int) -> None:
+        """Insert into the LRU and evict least recently used images over the byte budget"""
+        self._photos[key] = (photo, byte_size)
+        self._photo_bytes += byte_size
+        while self._photo_bytes > self.max_memory_bytes and len(self._photos) > 1:
+            _, (_, evicted_bytes) = self._photos.popitem(last=False)
+            self._photo_bytes -= evicted_bytes
+
+    def _ensure_worker(self) -> None:
+        """Start the background worker thread if it is not running"""
+        with self._worker_lock:
+            if self._worker and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._worker.start()
+
+    def _worker_loop(self) -> None:
+        """Process queued artwork jobs until the queue stays empty"""
+        while True:
+            try:
+                loader, callback, key = self._jobs.get(timeout=5.0)
+            except queue.Empty:
+                with self._worker_lock:
+                    if self._jobs.empty():
+                        self._worker = None
+                        return
+                continue
+
+            artwork_hash = None
+            try:
+                artwork_data = loader()
+                artwork_hash = self.store(artwork_data) if artwork_data else NO_ARTWORK
+            except Exception as e:
+                logger.error("Artwork job error: %s", e)
+
+            if callback:
+                try:
+                    callback(artwork_hash)
+                except Exception as e:
+                    logger.error("Artwork callback error: %s", e)
+            # Still pending until the callback ran, so the result is seen before a resubmit
+            if key is not None:
+                with self._pending_lock:
+                    self._pending.discard(key)
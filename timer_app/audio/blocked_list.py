@@ -0,0 +1,189 @@
+"""
+Blocked List - Following Single Responsibility Principle (SOLID)
+Ordered sequence of unique items for very large playlists.
+
+Items live in blocks of bounded size and a Fenwick tree over block sizes locates
+positions, so insert/remove/move/index cost O(log(n / B) + B) instead of O(n).
+"""
+from typing import Dict, Hashable, Iterable, Iterator, List
+
+
+class _Block:
+    """One contiguous run of items"""
+    __slots__ = ('items', 'index')
+
+    def __init__(self, items: List[Hashable], index: int):
+        self.items = items
+        self.index = index
+
+
+class BlockedList:
+    """Positional sequence of unique hashable items with fast insert/move/index (Single Responsibility)"""
+
+    def __init__(self, items: Iterable[Hashable] = (), block_size: int = 512):
+        self._block_size = block_size
+        self._blocks: List[_Block] = []
+        self._block_of: Dict[Hashable, _Block] = {}
+        self._tree: List[int] = [0]  # Fenwick tree over block sizes (1-based)
+        self._length = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._block_of
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for block in self._blocks:
+            yield from block.items
+
+    def __getitem__(self, position: int) -> Hashable:
+        block, offset = self._locate(position)
+        return block.items[offset]
+
+    def index(self, item: Hashable) -> int:
+        """Position of an item"""
+        block = self._block_of.get(item)
+        if block is None:
+            raise ValueError(f"{item!r} is not in list")
+        return self._prefix(block.index) + block.items.index(item)
+
+    def append(self, item: Hashable) -> None:
+        self.insert(self._length, item)
+
+    def extend(self, items: Iterable[Hashable]) -> None:
+        """Append many items, filling blocks directly"""
+        for item in items:
+            if item in self._block_of:
+                raise ValueError(f"{item!r} is already in list")
+            if not self._blocks or len(self._blocks[-1].items) >= self._block_size:
+                self._blocks.append(_Block([], len(self._blocks)))
+                self._tree.append(0)
+                self._tree_add_block_slot()
+            block = self._blocks[-1]
+            block.items.append(item)
+            self._block_of[item] = block
+            self._tree_add(block.index, 1)
+            self._length += 1
+
+    def insert(self, position: int, item: Hashable) -> None:
+        """Insert item before position (clamped to [0, len])"""
+        if item in self._block_of:
+            raise ValueError(f"{item!r} is already in list")
+
+        position = max(0, min(position, self._length))
+        if not self._blocks:
+            self.extend((item,))
+            return
+
+        if position == self._length:
+            block, offset = self._blocks[-1], len(self._blocks[-1].items)
+        else:
+            block, offset = self._locate(position)
+
+        block.items.insert(offset, item)
+        self._block_of[item] = block
+        self._tree_add(block.index, 1)
+        self._length += 1
+
+        if len(block.items) > 2 * self._block_size:
+            self._split(block)
+
+    def pop(self, position: int) -> Hashable:
+        """Remove and return the item at position"""
+        block, offset = self._locate(position)
+        item = block.items.pop(offset)
+        self._detach(block, item)
+        return item
+
+    def remove(self, item: Hashable) -> int:
+        """Remove an item, returning the position it had"""
+        position = self.index(item)
+        block = self._block_of[item]
+        block.items.remove(item)
+        self._detach(block, item)
+        return position
+
+    def move(self, from_position: int, to_position: int) -> Hashable:
+        """Move the item at from_position so it ends up at to_position"""
+        item = self.pop(from_position)
+        self.insert(to_position, item)
+        return item
+
+    def clear(self) -> None:
+        self._blocks = []
+        self._block_of = {}
+        self._tree = [0]
+        self._length = 0
+
+    def _locate(self, position: int):
+        """Find (block, offset) for a position via Fenwick descent"""
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("list index out of range")
+
+        block_number = 0
+        remaining = position
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            candidate = block_number + step
+            if candidate < len(self._tree) and self._tree[candidate] <= remaining:
+                block_number = candidate
+                remaining -= self._tree[candidate]
+            step >>= 1
+        return self._blocks[block_number], remaining
+
+    def _detach(self, block: _Block, item: Hashable) -> None:
+        """Bookkeeping after an item left a block"""
+        del self._block_of[item]
+        self._tree_add(block.index, -1)
+        self._length -= 1
+        if not block.items:
+            del self._blocks[block.index]
+            self._rebuild()
+
+    def _split(self, block: _Block) -> None:
+        """Split an oversized block in two and re-index the blocks"""
+        half = len(block.items) // 2
+        new_block = _Block(block.items[half:], block.index + 1)
+        del block.items[half:]
+        for item in new_block.items:
+            self._block_of[item] = new_block
+        self._blocks.insert(block.index + 1, new_block)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Renumber blocks and rebuild the Fenwick tree in O(number of blocks)"""
+        self._tree = [0] * (len(self._blocks) + 1)
+        for i, block in enumerate(self._blocks):
+            block.index = i
+            self._tree[i + 1] += len(block.items)
+            parent = (i + 1) + ((i + 1) & -(i + 1))
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[i + 1]
+
+    def _tree_add_block_slot(self) -> None:
+        """Initialise the Fenwick node for a block appended at the end"""
+        node = len(self._tree) - 1
+        lowest = node & -node
+        child = node - 1
+        while child > node - lowest:
+            self._tree[node] += self._tree[child]
+            child -= child & -child
+
+    def _tree_add(self, block_index: int, delta: int) -> None:
+        node = block_index + 1
+        while node < len(self._tree):
+            self._tree[node] += delta
+            node += node & -node
+
+    def _prefix(self, block_index: int) -> int:
+        """Total items in blocks before block_index"""
+        total = 0
+        node = block_index
+        while node > 0:
+            total += self._tree[node]
+            node -= node & -node
+        return total
@@ -0,0 +1,416 @@
+"""
+Audio Engine - Actor Pattern around pygame.mixer (SOLID)
+This module only owns the mixer: every mixer call runs on one worker thread.
+
+UI and monitor threads submit commands (load, play, pause, resume, stop, seek,
+volume, or a custom call) to a queue and return immediately. The worker applies
+them in order, keeps a state snapshot up to date (including detecting the end of a
+track) and notifies listeners. TkSnapshotPump hands snapshots to the Tk thread via
+root.after, scheduled only when one arrives. While nothing plays and no tick hook is
+registered the worker sleeps on the queue instead of polling. Seek and volume commands are coalesced so only the newest one runs.
+Tick hooks let mixer work that has to happen on a schedule (feeding a streaming
+Channel) run on the engine thread too, between commands.
+Per-command queue wait and run times are kept for latency metrics.
+"""
+import logging
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from timer_app.infrastructure.lazy_import import lazy_import
+from timer_app.infrastructure.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+_COMMAND_SECONDS = REGISTRY.histogram('timer_audio_command_seconds', "Audio engine command latency (queue wait + run)")
+_COMMAND_FAILURES = REGISTRY.counter('timer_audio_command_failures_total', "Audio engine commands that raised")
+
+pygame = lazy_import("pygame")  # Loaded on first mixer call
+PYGAME_AVAILABLE = pygame is not None
+
+
+class AudioEngine:
+    """Single-threaded owner of pygame.mixer processing a command queue (Actor Pattern)"""
+
+    def __init__(self, poll_interval: float = 0.1, metric_samples: int = 256):
+        self.poll_interval = poll_interval
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._newest: Dict[str, int] = {}  # Coalescing key -> newest submitted sequence
+        self._pending = 0
+
+        self._state_lock = threading.Lock()
+        self._state = {
+            'state': 'stopped',  # stopped | playing | paused | finished
+            'path': None,
+            'volume': 1.0,
+            'busy': False,
+            'finished_at': None,  # perf_counter() when the end of the track was detected
+        }
+        self._position_base = 0.0
+        self._started_at = 0.0
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._tick_hooks: Dict[Callable[[], None], float] = {}  # Hook -> interval (engine thread only)
+
+        self._metric_samples = metric_samples
+        self._metrics: Dict[str, deque] = {}
+        self._metrics_lock = threading.Lock()
+
+    # Submitting commands (any thread) ----------------------------------------------
+
+    def call(self, name: str, func: Callable, *args,
+             coalesce: bool = False, on_done: Optional[Callable[[Any], None]] = None) -> Future:
+        """
+        Run func(*args) on the engine thread. With coalesce=True a queued command of the
+        same name is skipped when a newer one was submitted. on_done(result) runs on the
+        engine thread afterwards.
+        """
+        future: Future = Future()
+        sequence = next(self._sequence)
+        with self._state_lock:
+            self._pending += 1
+            if coalesce:
+                self._newest[name] = sequence
+        self._queue.put((sequence, name, func, args, coalesce, on_done, future, time.perf_counter()))
+        self._ensure_thread()
+        return future
+
+    def add_tick_hook(self, hook: Callable[[], None], interval: float) -> Future:
+        """Run hook() on the engine thread at least every `interval` seconds until removed"""
+        return self.call('tick_hook', self._tick_hooks.__setitem__, hook, interval)
+
+    def remove_tick_hook(self, hook: Callable[[], None]) -> Future:
+        return self.call('tick_hook', self._tick_hooks.pop, hook, None)
+
+    def run_sync(self, name: str, func: Callable, *args, timeout: Optional[float] = 5.0) -> Any:
+        """Run on the engine thread and wait for the result (runs inline on the engine thread)"""
+        if self.is_engine_thread():
+            return func(*args)
+        return self.call(name, func, *args).result(timeout=timeout)
+
+    def is_engine_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def load(self, path: str, **kwargs) -> Future:
+        return self.call('load', self._do_load, path, **kwargs)
+
+    def play(self, start: float = 0.0, **kwargs) -> Future:
+        return self.call('play', self._do_play, start, **kwargs)
+
+    def load_and_play(self, path: str, volume: Optional[float] = None, **kwargs) -> Future:
+        """Load, set the volume and play as one command - nothing plays if the load fails"""
+        return self.call('load', self._do_load_and_play, path, volume, **kwargs)
+
+    def pause(self, **kwargs) -> Future:
+        return self.call('pause', self._do_pause, **kwargs)
+
+    def resume(self, **kwargs) -> Future:
+        return self.call('resume', self._do_resume, **kwargs)
+
+    def stop(self, **kwargs) -> Future:
+        return self.call('stop', self._do_stop, **kwargs)
+
+    def seek(self, position: float, seek_func: Optional[Callable[[float], Optional[float]]] = None,
+             **kwargs) -> Future:
+        """Seek the loaded music; seek_func(position) -> reached position overrides set_pos"""
+        return self.call('seek', self._do_seek, position, seek_func, coalesce=True, **kwargs)
+
+    def set_volume(self, volume: float, **kwargs) -> Future:
+        return self.call('volume', self._do_volume, volume, coalesce=True, **kwargs)
+
+    # State (any thread) -------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the engine state with the current position and queued command count"""
+        with self._state_lock:
+            snapshot = dict(self._state)
+            snapshot['pending'] = self._pending
+            snapshot['position'] = self._position_locked()
+        return snapshot
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """callback(snapshot) runs on the engine thread whenever the state changes"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Latency per command name: queue wait and run time (ms) over recent samples"""
+        with self._metrics_lock:
+            samples = {name: list(values) for name, values in self._metrics.items()}
+
+        metrics = {}
+        for name, values in samples.items():
+            waits = sorted(wait for wait, _ in values)
+            totals = sorted(wait + run for wait, run in values)
+            metrics[name] = {
+                'count': len(values),
+                'avg_wait_ms': round(sum(waits) / len(waits) * 1000, 3),
+                'avg_run_ms': round(sum(run for _, run in values) / len(values) * 1000, 3),
+                'p95_total_ms': round(totals[min(len(totals) - 1, int(len(totals) * 0.95))] * 1000, 3),
+                'max_total_ms': round(totals[-1] * 1000, 3),
+            }
+        return metrics
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Stop the worker after the queued commands"""
+        self._queue.put(None)
+        if self._thread and self._thread.is_alive() and not self.is_engine_thread():
+            self._thread.join(timeout=timeout)
+
+    # Engine thread ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="audio-engine", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while True:
+            with self._state_lock:
+                playing = self._state['state'] == 'playing'
+            wait = self.poll_interval if playing else None  # Idle: only a command can change anything
+            if self._tick_hooks:
+                wait = min(wait or self.poll_interval, min(self._tick_hooks.values()))
+                now = time.monotonic()
+                if now >= next_tick:
+                    self._run_tick_hooks()
+                    next_tick = now + wait
+                wait = max(0.0, next_tick - now)
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                self._poll_playback()
+                continue
+            if item is None:
+                return
+
+            sequence, name, func, args, coalesce, on_done, future, submitted = item
+            started = time.perf_counter()
+            with self._state_lock:
+                self._pending -= 1
+                superseded = coalesce and self._newest.get(name, sequence) != sequence
+
+            if superseded:
+                future.set_result(None)
+                continue
+
+            try:
+                result = func(*args)
+                future.set_result(result)
+            except Exception as e:
+                logger.error("❌ Audio command '%s' failed: %s", name, e)
+                _COMMAND_FAILURES.inc(command=name)
+                future.set_exception(e)
+                result = None
+            finished = time.perf_counter()
+            self._record_metric(name, started - submitted, finished - started)
+
+            if on_done:
+                try:
+                    on_done(result)
+                except Exception as e:
+                    logger.error("❌ Audio command callback error: %s", e)
+            self._poll_playback(force_publish=True)
+
+    def _run_tick_hooks(self) -> None:
+        for hook in list(self._tick_hooks):
+            try:
+                hook()
+            except Exception as e:
+                logger.error("❌ Audio tick hook failed, removing it: %s", e)
+                self._tick_hooks.pop(hook, None)
+
+    def _poll_playback(self, force_publish: bool = False) -> None:
+        """Refresh the busy flag and detect the end of the track"""
+        if not PYGAME_AVAILABLE or not pygame.mixer.get_init():
+            if force_publish:
+                self._publish()
+            return
+
+        busy = bool(pygame.mixer.music.get_busy())
+        changed = force_publish
+        with self._state_lock:
+            if busy != self._state['busy']:
+                self._state['busy'] = busy
+                changed = True
+            if self._state['state'] == 'playing' and not busy:
+                self._position_base = self._position_locked()
+                self._state['state'] = 'finished'
+                self._state['finished_at'] = time.perf_counter()
+                changed = True
+        if changed:
+            self._publish()
+
+    def _publish(self) -> None:
+        snapshot = self.snapshot()
+        for callback in list(self._listeners):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error("❌ Audio listener error: %s", e)
+
+    def _record_metric(self, name: str, wait: float, run: float) -> None:
+        _COMMAND_SECONDS.observe(wait + run, command=name)
+        with self._metrics_lock:
+            values = self._metrics.get(name)
+            if values is None:
+                values = self._metrics[name] = deque(maxlen=self._metric_samples)
+            values.append((wait, run))
+
+    def _position_locked(self) -> float:
+        if self._state['state'] == 'playing':
+            return self._position_base + time.monotonic() - self._started_at
+        return self._position_base
+
+    def _set_state(self, state: str, position: Optional[float] = None, **values) -> None:
+        with self._state_lock:
+            if position is not None:
+                self._position_base = position
+            if state == 'playing':
+                self._started_at = time.monotonic()
+            self._state['state'] = state
+            self._state['finished_at'] = None
+            self._state.update(values)
+
+    def _do_load(self, path: str) -> bool:
+        pygame.mixer.music.stop()
+        # Forget the old file first: if this load raises, a queued play must not restart it
+        self._set_state('stopped', position=0.0, path=None)
+        pygame.mixer.music.load(path)
+        self._set_state('stopped', position=0.0, path=path)
+        return True
+
+    def _do_load_and_play(self, path: str, volume: Optional[float]) -> bool:
+        self._do_load(path)
+        if volume is not None:
+            self._do_volume(volume)
+        return self._do_play(0.0)
+
+    def _do_play(self, start: float) -> bool:
+        with self._state_lock:
+            if self._state['path'] is None:
+                return False  # Nothing loaded (or the last load failed)
+        pygame.mixer.music.play(start=start) if start else pygame.mixer.music.play()
+        self._set_state('playing', position=start, busy=True)
+        return True
+
+    def _do_pause(self) -> bool:
+        with self._state_lock:
+            if self._state['state'] != 'playing':
+                return False
+            position = self._position_locked()
+        pygame.mixer.music.pause()
+        self._set_state('paused', position=position)
+        return True
+
+    def _do_resume(self) -> bool:
+        with self._state_lock:
+            if self._state['state'] != 'paused':
+                return False
+        pygame.mixer.music.unpause()
+        self._set_state('playing')
+        return True
+
+    def _do_stop(self) -> bool:
+        pygame.mixer.music.stop()
+        self._set_state('stopped', position=0.0)
+        return True
+
+    def _do_seek(self, position: float, seek_func) -> Optional[float]:
+        with self._state_lock:
+            state = self._state['state']
+        if seek_func:
+            reached = seek_func(position)
+        else:
+            pygame.mixer.music.set_pos(position)
+            reached = position
+        if reached is not None:
+            self._set_state('paused' if state == 'paused' else 'playing', position=reached, busy=True)
+        return reached
+
+    def _do_volume(self, volume: float) -> float:
+        pygame.mixer.music.set_volume(volume)
+        with self._state_lock:
+            self._state['volume'] = volume
+        return volume
+
+
+class TkSnapshotPump:
+    """Delivers engine snapshots to a callback on the Tk thread via root.after, only when there are any"""
+
+    def __init__(self, root, engine: AudioEngine, callback: Callable[[Dict[str, Any]], None],
+                 interval_ms: int = 50):
+        self.root = root
+        self.engine = engine
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self._latest: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._after_id = None
+        self._scheduled = False  # A drain is pending - snapshots arriving meanwhile ride on it
+        self._stopped = False
+        engine.add_listener(self._on_snapshot)
+
+    def _on_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        # Engine thread: keep only the newest snapshot and make sure one drain is pending
+        with self._lock:
+            self._latest = snapshot
+            if self._scheduled or self._stopped:
+                return
+            self._scheduled = True
+        try:
+            after_id = self.root.after(self.interval_ms, self._drain)
+        except Exception:
+            # Window gone or mainloop not running yet - the next snapshot tries again
+            with self._lock:
+                self._scheduled = False
+            return
+        with self._lock:
+            self._after_id = after_id
+
+    def _drain(self) -> None:
+        with self._lock:
+            snapshot, self._latest = self._latest, None
+            self._scheduled = False
+            self._after_id = None
+        if snapshot is not None:
+            try:
+                self.callback(snapshot)
+            except Exception as e:
+                logger.error("❌ Snapshot callback error: %s", e)
+
+    def stop(self) -> None:
+        self.engine.remove_listener(self._on_snapshot)
+        with self._lock:
+            self._stopped = True
+            after_id, self._after_id = self._after_id, None
+        if after_id:
+            try:
+                self.root.after_cancel(after_id)
+            except Exception:
+                pass
+
+
+_engine: Optional[AudioEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_audio_engine() -> AudioEngine:
+    """The shared engine - pygame.mixer is process-global, so there is exactly one owner"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AudioEngine()
+        return _engine
@@ -2,12 +2,15 @@
 Audio System Factory - Following Dependency Inversion Principle (SOLID)
 Creates the complete audio system with proper dependency injection.
 """
+import logging
 from .interfaces import AudioSystemInterface
 from .player import PygameAudioPlayer
 from .playlist import AudioPlaylist
 from .loop_controller import LoopController
 from .system import ModularAudioSystem
 
+logger = logging.getLogger(__name__)
+
 
 class AudioSystemFactory:
     """Factory for creating audio system with dependency injection (SOLID DIP)"""
@@ -26,7 +29,7 @@ class AudioSystemFactory:
         # Inject dependencies into high-level module
         audio_system = ModularAudioSystem(player, playlist, loop_controller)
         
-        print("🏭 Modular audio system created with dependency injection")
+        logger.info("🏭 Modular audio system created with dependency injection")
         return audio_system
     
     @staticmethod
@@ -42,5 +45,5 @@ class AudioSystemFactory:
         
         audio_system = ModularAudioSystem(player, playlist, loop_controller)
         
-        print("🏭 Custom audio system created")
+        logger.info("🏭 Custom audio system created")
         return audio_system
\ No newline at end of file
@@ -21,6 +21,15 @@ class PlaybackState(Enum):
     PAUSED = "paused"
 
 
+class PlaylistChange(Enum):
+    """Enum for playlist change notifications"""
+    ADDED = "added"
+    REMOVED = "removed"
+    MOVED = "moved"
+    CLEARED = "cleared"
+    CURRENT_CHANGED = "current_changed"
+
+
 class TrackInfo:
     """Data class for track information"""
     def __init__(self, path: str, title: str = "", artist: str = "", duration: float = 0.0):
@@ -28,6 +37,7 @@ class TrackInfo:
         self.title = title or "Unknown"
         self.artist = artist or "Unknown"
         self.duration = duration
+        self.track_id: Optional[int] = None  # Stable id assigned by the playlist
         self.metadata = {}
 
 
@@ -73,6 +83,10 @@ class AudioPlayerInterface(ABC):
     def is_track_finished(self) -> bool:
         """Check if current track has finished playing"""
         pass
+    
+    def get_finished_at(self) -> Optional[float]:
+        """time.perf_counter() when the end of the current track was detected (None if unknown)"""
+        return None
 
 
 class PlaylistInterface(ABC):
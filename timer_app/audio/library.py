@@ -0,0 +1,257 @@
+"""
+Music Library - Following Single Responsibility Principle (SOLID)
+This module only stores track metadata and answers lookups and searches.
+
+Tracks live in a sqlite3 database keyed by a stable integer id. An FTS5 index over
+title/artist/album/genre (kept in sync by triggers) makes prefix searches over tens of
+thousands of files instant. Playlists reference tracks by id only. Waveform peaks
+live in their own table so track queries never load the blobs.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Metadata columns mirrored from the media player's track dicts
+TRACK_FIELDS = ('path', 'title', 'artist', 'album', 'duration', 'genre', 'year', 'artwork_hash')
+SEARCH_FIELDS = ('title', 'artist', 'album', 'genre')
+# Results of background analysis, never overwritten by tag updates
+ANALYSIS_FIELDS = {'gain_db': 'REAL', 'loudness_lufs': 'REAL', 'peak_db': 'REAL'}
+SCHEMA_VERSION = 2
+
+
+def normalize_track_path(path: str) -> str:
+    """The one spelling of a file's path used as its identity (normalised, forward slashes)"""
+    return os.path.normpath(path).replace('\\', '/')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracks (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    artist TEXT NOT NULL DEFAULT '',
+    album TEXT NOT NULL DEFAULT '',
+    duration TEXT NOT NULL DEFAULT '0:00',
+    genre TEXT NOT NULL DEFAULT '',
+    year TEXT NOT NULL DEFAULT '',
+    artwork_hash TEXT,
+    added_at REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tracks_artist ON tracks(artist);
+CREATE TABLE IF NOT EXISTS waveforms (
+    track_id INTEGER PRIMARY KEY,
+    peaks BLOB NOT NULL,
+    source_mtime REAL NOT NULL DEFAULT 0
+);
+CREATE TRIGGER IF NOT EXISTS tracks_waveform_ad AFTER DELETE ON tracks BEGIN
+    DELETE FROM waveforms WHERE track_id = old.id;
+END;
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tracks_fts USING fts5(
+    title, artist, album, genre,
+    content='tracks', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS tracks_ai AFTER INSERT ON tracks BEGIN
+    INSERT INTO tracks_fts(rowid, title, artist, album, genre)
+    VALUES (new.id, new.title, new.artist, new.album, new.genre);
+END;
+CREATE TRIGGER IF NOT EXISTS tracks_ad AFTER DELETE ON tracks BEGIN
+    INSERT INTO tracks_fts(tracks_fts, rowid, title, artist, album, genre)
+    VALUES ('delete', old.id, old.title, old.artist, old.album, old.genre);
+END;
+CREATE TRIGGER IF NOT EXISTS tracks_au AFTER UPDATE OF title, artist, album, genre ON tracks BEGIN
+    INSERT INTO tracks_fts(tracks_fts, rowid, title, artist, album, genre)
+    VALUES ('delete', old.id, old.title, old.artist, old.album, old.genre);
+    INSERT INTO tracks_fts(rowid, title, artist, album, genre)
+    VALUES (new.id, new.title, new.artist, new.album, new.genre);
+END;
+"""
+
+
+class MusicLibrary:
+    """sqlite3-backed track store with full-text search (Single Responsibility)"""
+
+    def __init__(self, db_path: str = "music_library.db"):
+        self.db_path = db_path
+        self._lock = threading.RLock()  # One connection shared by the UI and import threads
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self.fts_available = False
+        self._initialize()
+
+    def _initialize(self) -> None:
+        """Create tables and the FTS index (falls back to LIKE search without FTS5)"""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.fts_available = True
+            except sqlite3.OperationalError as e:
+                logger.warning("⚠️ FTS5 not available, library search uses LIKE: %s", e)
+
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self._add_missing_columns(ANALYSIS_FIELDS)
+                self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._conn.commit()
+
+    def _add_missing_columns(self, columns: Dict[str, str]) -> None:
+        existing = {row['name'] for row in self._conn.execute("PRAGMA table_info(tracks)")}
+        for name, column_type in columns.items():
+            if name not in existing:
+                self._conn.execute(f"ALTER TABLE tracks ADD COLUMN {name} {column_type}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def add_track(self, track: Dict) -> int:
+        """Insert or update a track by path, returns its id"""
+        with self._lock:
+            track_id = self._upsert(track)
+            self._conn.commit()
+            return track_id
+
+    def add_tracks(self, tracks: Iterable[Dict]) -> List[int]:
+        """Insert or update many tracks in one transaction, returns their ids in order"""
+        with self._lock:
+            ids = [self._upsert(track) for track in tracks]
+            self._conn.commit()
+            return ids
+
+    def _upsert(self, track: Dict) -> int:
+        values = {field: track.get(field) for field in TRACK_FIELDS}
+        for field in ('title', 'artist', 'album', 'genre', 'year'):
+            values[field] = str(values[field] or '')
+        values['duration'] = str(values['duration'] or '0:00')
+
+        row = self._conn.execute("SELECT id FROM tracks WHERE path = ?", (values['path'],)).fetchone()
+        if row:
+            assignments = ", ".join(f"{field} = :{field}" for field in TRACK_FIELDS if field != 'path')
+            self._conn.execute(f"UPDATE tracks SET {assignments} WHERE id = :id", {**values, 'id': row['id']})
+            return row['id']
+
+        columns = ", ".join(TRACK_FIELDS)
+        placeholders = ", ".join(f":{field}" for field in TRACK_FIELDS)
+        cursor = self._conn.execute(
+            f"INSERT INTO tracks ({columns}, added_at) VALUES ({placeholders}, :added_at)",
+            {**values, 'added_at': time.time()})
+        return cursor.lastrowid
+
+    def update_field(self, track_id: int, field: str, value) -> None:
+        """Update one metadata column of a track"""
+        if field not in TRACK_FIELDS or field == 'path':
+            raise ValueError(f"Unknown track field: {field}")
+        with self._lock:
+            self._conn.execute(f"UPDATE tracks SET {field} = ? WHERE id = ?", (value, track_id))
+            self._conn.commit()
+
+    def set_analysis(self, track_id: int, values: Dict) -> None:
+        """Store analysis results (e.g. loudness gain) for a track"""
+        values = {field: value for field, value in values.items() if field in ANALYSIS_FIELDS}
+        if not values:
+            return
+        assignments = ", ".join(f"{field} = :{field}" for field in values)
+        with self._lock:
+            self._conn.execute(f"UPDATE tracks SET {assignments} WHERE id = :id", {**values, 'id': track_id})
+            self._conn.commit()
+
+    def set_waveform(self, track_id: int, peaks: bytes, source_mtime: float = 0.0) -> None:
+        """Cache encoded waveform peaks for a track (source_mtime detects changed files)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO waveforms (track_id, peaks, source_mtime) VALUES (?, ?, ?)",
+                (track_id, sqlite3.Binary(peaks), source_mtime))
+            self._conn.commit()
+
+    def get_waveform(self, track_id: int, source_mtime: Optional[float] = None) -> Optional[bytes]:
+        """Cached waveform peaks, None if missing or computed from an older file version"""
+        with self._lock:
+            row = self._conn.execute("SELECT peaks, source_mtime FROM waveforms WHERE track_id = ?",
+                                     (track_id,)).fetchone()
+        if row is None or (source_mtime is not None and row['source_mtime'] != source_mtime):
+            return None
+        return bytes(row['peaks'])
+
+    def remove_track(self, track_id: int) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM tracks WHERE id = ?", (track_id,))
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def get_track(self, track_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM tracks WHERE id = ?", (track_id,)).fetchone()
+        return self._to_track(row) if row else None
+
+    def get_tracks(self, track_ids: Iterable[int]) -> List[Dict]:
+        """Fetch tracks preserving the given order (unknown ids are skipped)"""
+        track_ids = list(track_ids)
+        found: Dict[int, Dict] = {}
+        with self._lock:
+            # Chunk to stay under sqlite's bound-parameter limit
+            for start in range(0, len(track_ids), 500):
+                chunk = track_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                for row in self._conn.execute(f"SELECT * FROM tracks WHERE id IN ({placeholders})", chunk):
+                    found[row['id']] = self._to_track(row)
+        return [found[track_id] for track_id in track_ids if track_id in found]
+
+    def find_id(self, path: str) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM tracks WHERE path = ?", (path,)).fetchone()
+        return row['id'] if row else None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
+
+    def search(self, query: str, limit: int = 200) -> List[Dict]:
+        """Prefix search over title/artist/album/genre, best matches first"""
+        terms = [term for term in query.split() if term]
+        if not terms:
+            return []
+
+        with self._lock:
+            if self.fts_available:
+                # Quote every term so user input can't form FTS syntax; '*' makes it a prefix match
+                match = " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+                rows = self._conn.execute(
+                    "SELECT tracks.* FROM tracks_fts JOIN tracks ON tracks.id = tracks_fts.rowid "
+                    "WHERE tracks_fts MATCH ? ORDER BY bm25(tracks_fts) LIMIT ?",
+                    (match, limit)).fetchall()
+            else:
+                clauses = []
+                params: List = []
+                for term in terms:
+                    clauses.append("(" + " OR ".join(f"{field} LIKE ?" for field in SEARCH_FIELDS) + ")")
+                    params.extend([f"%{term}%"] * len(SEARCH_FIELDS))
+                rows = self._conn.execute(
+                    f"SELECT * FROM tracks WHERE {' AND '.join(clauses)} ORDER BY artist, title LIMIT ?",
+                    params + [limit]).fetchall()
+        return [self._to_track(row) for row in rows]
+
+    def prune_missing(self) -> int:
+        """Remove tracks whose files no longer exist, returns how many were removed"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, path FROM tracks").fetchall()
+            missing = [(row['id'],) for row in rows if not os.path.exists(row['path'])]
+            self._conn.executemany("DELETE FROM tracks WHERE id = ?", missing)
+            self._conn.commit()
+        return len(missing)
+
+    @staticmethod
+    def _to_track(row: sqlite3.Row) -> Dict:
+        """Convert a row to the track dict format used by the media player"""
+        track = {field: row[field] for field in TRACK_FIELDS}
+        for field in ANALYSIS_FIELDS:
+            track[field] = row[field]
+        track['id'] = row['id']
+        return track
@@ -2,9 +2,12 @@
 Loop Control Management - Following Single Responsibility and Open/Closed Principles (SOLID)
 This class only handles loop logic and repeat mode operations.
 """
+import logging
 from typing import Optional
 from .interfaces import LoopControlInterface, PlaylistInterface, RepeatMode
 
+logger = logging.getLogger(__name__)
+
 
 class LoopController(LoopControlInterface):
     """Concrete implementation of loop control (Single Responsibility, Open/Closed)"""
@@ -16,7 +19,7 @@ class LoopController(LoopControlInterface):
     def set_repeat_mode(self, mode: RepeatMode) -> None:
         """Set repeat mode (Single Responsibility)"""
         self._repeat_mode = mode
-        print(f"🔄 Repeat mode: {mode.value.upper()}")
+        logger.debug("🔄 Repeat mode: %s", mode.value.upper())
     
     def get_repeat_mode(self) -> RepeatMode:
         """Get current repeat mode (Single Responsibility)"""
@@ -33,7 +36,7 @@ class LoopController(LoopControlInterface):
         current_index = self._playlist.get_current_index()
         
         if self._repeat_mode == RepeatMode.SINGLE:
-            print("🔂 Single repeat - playing same track")
+            logger.debug("🔂 Single repeat - playing same track")
             return current_index  # Repeat current track
         
         elif self._repeat_mode == RepeatMode.PLAYLIST:
@@ -42,10 +45,21 @@ class LoopController(LoopControlInterface):
         else:  # RepeatMode.OFF
             return self._handle_no_repeat(current_index)
     
+    def _shuffle_enabled(self) -> bool:
+        """Check if the playlist supports and has shuffle enabled"""
+        return hasattr(self._playlist, 'is_shuffle_enabled') and self._playlist.is_shuffle_enabled()
+    
     def _handle_playlist_repeat(self, current_index: int) -> Optional[int]:
         """Handle playlist repeat logic (Open/Closed - can extend with new repeat types)"""
+        if self._shuffle_enabled():
+            next_index = self._playlist.get_next_shuffle_index()
+            if next_index is not None:
+                logger.debug("🔀 Playlist repeat - shuffled track (%s)", next_index)
+                self._playlist.set_current_index(next_index)
+                return next_index
+        
         if self._playlist.is_at_end():
-            print("🔁 Playlist repeat - back to first track")
+            logger.debug("🔁 Playlist repeat - back to first track")
             first_index = self._playlist.first_index()
             if first_index is not None:
                 self._playlist.set_current_index(first_index)
@@ -54,21 +68,31 @@ class LoopController(LoopControlInterface):
         else:
             next_index = self._playlist.next_index()
             if next_index is not None:
-                print(f"🔁 Playlist repeat - next track ({next_index})")
+                logger.debug("🔁 Playlist repeat - next track (%s)", next_index)
                 self._playlist.set_current_index(next_index)
                 return next_index
             return None
     
     def _handle_no_repeat(self, current_index: int) -> Optional[int]:
         """Handle no repeat logic (Open/Closed - can extend with new behaviors)"""
+        if self._shuffle_enabled():
+            if not self._playlist.is_shuffle_cycle_complete():
+                next_index = self._playlist.get_next_shuffle_index()
+                if next_index is not None:
+                    logger.debug("🔀 No repeat - shuffled track (%s)", next_index)
+                    self._playlist.set_current_index(next_index)
+                    return next_index
+            logger.debug("⏹️ No repeat - all shuffled tracks played, stopping")
+            return None
+        
         if not self._playlist.is_at_end():
             next_index = self._playlist.next_index()
             if next_index is not None:
-                print(f"▶️ No repeat - next track ({next_index})")
+                logger.debug("▶️ No repeat - next track (%s)", next_index)
                 self._playlist.set_current_index(next_index)
                 return next_index
         
-        print("⏹️ No repeat - end of playlist, stopping")
+        logger.debug("⏹️ No repeat - end of playlist, stopping")
         return None
     
     def get_next_track_index(self) -> Optional[int]:
@@ -78,6 +102,9 @@ class LoopController(LoopControlInterface):
         if self._repeat_mode == RepeatMode.SINGLE:
             return current_index
         
+        if self._shuffle_enabled():
+            return self._playlist.get_next_shuffle_index()
+        
         elif self._repeat_mode == RepeatMode.PLAYLIST:
             if self._playlist.is_at_end():
                 return self._playlist.first_index()
@@ -89,6 +116,11 @@ class LoopController(LoopControlInterface):
     
     def get_previous_track_index(self) -> Optional[int]:
         """Get what the previous track index would be without changing state"""
+        if self._shuffle_enabled():
+            previous_index = self._playlist.get_previous_shuffle_index()
+            if previous_index is not None:
+                return previous_index
+        
         if self._repeat_mode == RepeatMode.PLAYLIST:
             if self._playlist.is_at_beginning():
                 return self._playlist.last_index()
@@ -2,14 +2,21 @@
 Audio Loop Manager - Dedicated system for handling audio looping
 Handles playlist looping, single track repeat, and queue management
 """
-import pygame
+import logging
 import threading
 import time
-import json
 import os
 from typing import List, Dict, Optional, Callable
 from enum import Enum
 
+from timer_app.infrastructure.lazy_import import lazy_import
+from .settings_store import get_settings_store
+from .engine import get_audio_engine
+
+logger = logging.getLogger(__name__)
+
+pygame = lazy_import("pygame")  # Loaded when the manager initialises the mixer
+
 class LoopMode(Enum):
     OFF = "off"
     SINGLE_TRACK = "single_track"  # Loop current song
@@ -20,6 +27,7 @@ class AudioLoopManager:
     
     def __init__(self, settings_file: str = "audio_loop_settings.json"):
         self.settings_file = settings_file
+        self.settings = get_settings_store(settings_file)
         
         # Playlist and playback state
         self.playlist: List[Dict] = []
@@ -39,65 +47,65 @@ class AudioLoopManager:
         self.on_track_change: Optional[Callable] = None
         self.on_loop_mode_change: Optional[Callable] = None
         
-        # Initialize pygame mixer
+        # Initialize pygame mixer (owned by the audio engine thread)
+        self.engine = get_audio_engine()
         self._init_audio()
         self._load_settings()
     
     def _init_audio(self):
         """Initialize pygame mixer for audio playback"""
-        try:
+        def init_mixer():
             pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
             pygame.mixer.init()
-            print("🎵 Audio Loop Manager initialized successfully")
+        
+        try:
+            self.engine.run_sync('init', init_mixer)
+            logger.info("🎵 Audio Loop Manager initialized successfully")
         except Exception as e:
-            print(f"❌ Audio initialization error: {e}")
+            logger.error("❌ Audio initialization error: %s", e)
     
     def _load_settings(self):
         """Load settings from file"""
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.playlist = data.get('playlist', [])
-                    self.volume = data.get('volume', 0.7)
-                    loop_mode_str = data.get('loop_mode', 'off')
-                    self.loop_mode = LoopMode(loop_mode_str)
-                    self.current_index = data.get('current_index', 0)
+            if 'playlist' in self.settings:
+                self.playlist = self.settings.get('playlist', [])
+                self.volume = self.settings.get('volume', 0.7)
+                loop_mode_str = self.settings.get('loop_mode', 'off')
+                self.loop_mode = LoopMode(loop_mode_str)
+                self.current_index = self.settings.get('current_index', 0)
+                
+                # Ensure current_index is valid
+                if self.current_index >= len(self.playlist):
+                    self.current_index = 0
                     
-                    # Ensure current_index is valid
-                    if self.current_index >= len(self.playlist):
-                        self.current_index = 0
-                        
-                    print(f"🔄 Loaded {len(self.playlist)} tracks, loop mode: {self.loop_mode.value}")
+                logger.info("🔄 Loaded %s tracks, loop mode: %s", len(self.playlist), self.loop_mode.value)
         except Exception as e:
-            print(f"⚠️ Settings load error: {e}")
+            logger.warning("⚠️ Settings load error: %s", e)
     
     def _save_settings(self):
-        """Save current settings to file"""
+        """Save current settings (written to file in the background once changes settle)"""
         try:
-            data = {
+            self.settings.update({
                 'playlist': self.playlist,
                 'volume': self.volume,
                 'loop_mode': self.loop_mode.value,
                 'current_index': self.current_index
-            }
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            })
         except Exception as e:
-            print(f"⚠️ Settings save error: {e}")
+            logger.warning("⚠️ Settings save error: %s", e)
     
     def add_track(self, track_info: Dict):
         """Add a track to the playlist"""
         if track_info not in self.playlist:
             self.playlist.append(track_info)
             self._save_settings()
-            print(f"➕ Added track: {track_info.get('title', 'Unknown')}")
+            logger.info("➕ Added track: %s", track_info.get('title', 'Unknown'))
     
     def set_loop_mode(self, mode: LoopMode):
         """Set the loop mode"""
         self.loop_mode = mode
         self._save_settings()
-        print(f"🔄 Loop mode set to: {mode.value}")
+        logger.info("🔄 Loop mode set to: %s", mode.value)
         
         if self.on_loop_mode_change:
             self.on_loop_mode_change(mode)
@@ -113,26 +121,25 @@ class AudioLoopManager:
     def play_current(self):
         """Play the current track"""
         if not self.playlist or self.current_index >= len(self.playlist):
-            print("❌ No track to play")
+            logger.error("❌ No track to play")
             return False
         
         track = self.playlist[self.current_index]
         track_path = track.get('path', '')
         
         if not os.path.exists(track_path):
-            print(f"❌ Track file not found: {track_path}")
+            logger.error("❌ Track file not found: %s", track_path)
             return False
         
         try:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(track_path)
-            pygame.mixer.music.set_volume(self.volume)
-            pygame.mixer.music.play()
+            self.engine.load(track_path)
+            self.engine.set_volume(self.volume)
+            self.engine.play()
             
             self.is_playing = True
             self.is_paused = False
             
-            print(f"▶️ Playing: {track.get('title', 'Unknown')} - {track.get('artist', 'Unknown')}")
+            logger.info("▶️ Playing: %s - %s", track.get('title', 'Unknown'), track.get('artist', 'Unknown'))
             
             # Start loop monitoring thread
             self._start_loop_monitor()
@@ -143,7 +150,7 @@ class AudioLoopManager:
             return True
             
         except Exception as e:
-            print(f"❌ Playback error: {e}")
+            logger.error("❌ Playback error: %s", e)
             return False
     
     def _start_loop_monitor(self):
@@ -163,29 +170,30 @@ class AudioLoopManager:
         while not self.stop_event.is_set() and self.is_playing:
             try:
                 # Check if track finished
-                if not pygame.mixer.music.get_busy() and not self.is_paused:
-                    print(f"🎵 Track finished - Loop mode: {self.loop_mode.value}")
+                snapshot = self.engine.snapshot()
+                if snapshot['state'] == 'finished' and not snapshot['pending'] and not self.is_paused:
+                    logger.debug("🎵 Track finished - Loop mode: %s", self.loop_mode.value)
                     
                     if self.loop_mode == LoopMode.SINGLE_TRACK:
-                        print("🔂 Looping current track")
+                        logger.debug("🔂 Looping current track")
                         self.play_current()
                         
                     elif self.loop_mode == LoopMode.PLAYLIST:
-                        print("🔁 Playlist loop - moving to next track")
+                        logger.debug("🔁 Playlist loop - moving to next track")
                         self._next_track_in_loop()
                         
                     else:  # LoopMode.OFF
                         if self.current_index < len(self.playlist) - 1:
-                            print("▶️ Playing next track (no loop)")
+                            logger.debug("▶️ Playing next track (no loop)")
                             self._next_track_in_loop()
                         else:
-                            print("⏹️ Playlist finished - stopping")
+                            logger.debug("⏹️ Playlist finished - stopping")
                             self.stop()
                     
                     break  # Exit monitor, new one will start if needed
                     
             except Exception as e:
-                print(f"❌ Loop monitor error: {e}")
+                logger.error("❌ Loop monitor error: %s", e)
                 break
             
             time.sleep(0.5)
@@ -201,7 +209,7 @@ class AudioLoopManager:
             # Always loop in playlist mode
             self.current_index = (self.current_index + 1) % len(self.playlist)
             if old_index == len(self.playlist) - 1 and self.current_index == 0:
-                print("🔄 Playlist looped back to first track!")
+                logger.debug("🔄 Playlist looped back to first track!")
         else:
             # Only advance if not at end
             if self.current_index < len(self.playlist) - 1:
@@ -234,31 +242,31 @@ class AudioLoopManager:
     def pause(self):
         """Pause playback"""
         if self.is_playing and not self.is_paused:
-            pygame.mixer.music.pause()
+            self.engine.pause()
             self.is_paused = True
-            print("⏸️ Paused")
+            logger.info("⏸️ Paused")
     
     def resume(self):
         """Resume playback"""
         if self.is_playing and self.is_paused:
-            pygame.mixer.music.unpause()
+            self.engine.resume()
             self.is_paused = False
-            print("▶️ Resumed")
+            logger.info("▶️ Resumed")
     
     def stop(self):
         """Stop playback"""
-        pygame.mixer.music.stop()
+        self.engine.stop()
         self.is_playing = False
         self.is_paused = False
         self.stop_event.set()
-        print("⏹️ Stopped")
+        logger.info("⏹️ Stopped")
     
     def set_volume(self, volume: float):
         """Set volume (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.volume)
+        self.engine.set_volume(self.volume)
         self._save_settings()
-        print(f"🔊 Volume: {int(self.volume * 100)}%")
+        logger.debug("🔊 Volume: %s%%", int(self.volume * 100))
     
     def get_current_track(self) -> Optional[Dict]:
         """Get current track info"""
@@ -0,0 +1,242 @@
+"""
+Loudness Analysis - Following Single Responsibility Principle (SOLID)
+This module only measures how loud a track is and derives a playback gain.
+
+Decoded PCM is processed in 100 ms blocks with NumPy: peak, RMS and an
+EBU R128-style gated integrated loudness (400 ms windows, 75% overlap, -70 LUFS
+absolute gate, -10 LU relative gate; K-weighted when SciPy is available). The work
+runs in a ProcessPoolExecutor so the UI and the audio threads are never blocked;
+the same pool runs other per-file analyses (e.g. waveform peaks). Frozen builds
+start the workers by re-running the exe, which is why main.py calls
+multiprocessing.freeze_support() before anything else.
+"""
+import logging
+import math
+import os
+import shutil
+import subprocess
+import threading
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional
+
+from timer_app.infrastructure.lazy_import import lazy_import
+
+logger = logging.getLogger(__name__)
+
+# Only the worker processes actually run NumPy/SciPy code
+np = lazy_import("numpy")
+NUMPY_AVAILABLE = np is not None
+scipy_signal = lazy_import("scipy.signal")
+SCIPY_AVAILABLE = scipy_signal is not None
+
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+TARGET_LUFS = -14.0  # Common streaming reference level
+MAX_GAIN_DB = 12.0
+PEAK_CEILING_DB = -1.0  # Never raise a track so far that its peak would clip
+ANALYSIS_RATE = 48000  # K-weighting coefficients below are defined for 48 kHz
+
+# ITU-R BS.1770 K-weighting at 48 kHz: high shelf, then high-pass
+_K_SHELF = ([1.53512485958697, -2.69169618940638, 1.19839281085285], [1.0, -1.69065929318241, 0.73248077421585])
+_K_HIGHPASS = ([1.0, -2.0, 1.0], [1.0, -1.99004745483398, 0.99007225036621])
+
+
+class _ProcessStream:
+    """stdout of a decoder subprocess; close() also ends and reaps the process"""
+
+    def __init__(self, process: subprocess.Popen):
+        self._process = process
+
+    def read(self, size: int) -> bytes:
+        return self._process.stdout.read(size)
+
+    def close(self) -> None:
+        self._process.stdout.close()
+        if self._process.poll() is None:
+            self._process.kill()  # Stopped early - ffmpeg would block on the closed pipe
+        self._process.wait()
+
+
+def open_pcm(path: str, rate: int = ANALYSIS_RATE, channels: int = 2):
+    """
+    Return (stream, sample rate, channels) of 16-bit PCM for a file, or None. ffmpeg
+    resamples to rate/channels; WAV files without ffmpeg keep their own format.
+    """
+    if FFMPEG_PATH:
+        command = [FFMPEG_PATH, "-nostdin", "-loglevel", "quiet", "-i", path,
+                   "-f", "s16le", "-acodec", "pcm_s16le", "-ac", str(channels), "-ar", str(rate), "-"]
+        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                   creationflags=creationflags)
+        return _ProcessStream(process), rate, channels
+    if path.lower().endswith('.wav'):
+        wav = wave.open(path, 'rb')
+        if wav.getsampwidth() != 2:
+            wav.close()
+            return None
+
+        class _WaveStream:
+            def read(self, size):
+                return wav.readframes(size // (2 * wav.getnchannels()))
+
+            def close(self):
+                wav.close()
+
+        return _WaveStream(), wav.getframerate(), wav.getnchannels()
+    return None
+
+
+def analyze_file(path: str) -> Optional[Dict[str, float]]:
+    """
+    Measure a file (runs in a worker process). Returns peak_db, rms_db, loudness_lufs
+    and gain_db, or None if the file can't be decoded here.
+    """
+    if not NUMPY_AVAILABLE or not os.path.exists(path):
+        return None
+
+    opened = open_pcm(path)
+    if opened is None:
+        return None
+    stream, rate, channels = opened
+
+    block_frames = rate // 10  # 100 ms
+    block_bytes = block_frames * channels * 2
+    use_k_weighting = SCIPY_AVAILABLE and rate == ANALYSIS_RATE
+    filter_state = None
+    block_powers = []  # Mean square per 100 ms block (channel powers summed)
+    peak = 0.0
+    total_square = 0.0
+    total_samples = 0
+
+    try:
+        pending = b""
+        while True:
+            data = stream.read(block_bytes * 10)
+            if not data:
+                break
+            data = pending + data
+            usable = len(data) - len(data) % block_bytes
+            pending = data[usable:]
+            if not usable:
+                continue
+
+            samples = np.frombuffer(data[:usable], dtype=np.int16).astype(np.float64) / 32768.0
+            samples = samples.reshape(-1, channels)
+            peak = max(peak, float(np.abs(samples).max()))
+            total_square += float(np.square(samples).sum())
+            total_samples += samples.size
+
+            weighted = samples
+            if use_k_weighting:
+                if filter_state is None:
+                    filter_state = [np.zeros((2, channels)), np.zeros((2, channels))]
+                weighted, filter_state[0] = scipy_signal.lfilter(*_K_SHELF, weighted, axis=0, zi=filter_state[0])
+                weighted, filter_state[1] = scipy_signal.lfilter(*_K_HIGHPASS, weighted, axis=0, zi=filter_state[1])
+
+            blocks = weighted.reshape(-1, block_frames, channels)
+            block_powers.extend(np.square(blocks).mean(axis=1).sum(axis=1).tolist())
+    finally:
+        stream.close()
+
+    if not total_samples:
+        return None
+
+    peak_db = 20 * math.log10(peak) if peak > 0 else -120.0
+    rms = math.sqrt(total_square / total_samples)
+    rms_db = 20 * math.log10(rms) if rms > 0 else -120.0
+    loudness = _gated_loudness(np.asarray(block_powers))
+    if loudness is None:
+        loudness = rms_db
+
+    gain_db = TARGET_LUFS - loudness
+    gain_db = min(gain_db, PEAK_CEILING_DB - peak_db, MAX_GAIN_DB)
+    gain_db = max(gain_db, -MAX_GAIN_DB)
+    return {
+        'peak_db': round(peak_db, 2),
+        'rms_db': round(rms_db, 2),
+        'loudness_lufs': round(loudness, 2),
+        'gain_db': round(gain_db, 2),
+    }
+
+
+def _gated_loudness(block_powers) -> Optional[float]:
+    """Integrated loudness from 100 ms block powers (400 ms windows with 100 ms hop)"""
+    if len(block_powers) < 4:
+        return None
+    cumulative = np.concatenate(([0.0], np.cumsum(block_powers)))
+    windows = (cumulative[4:] - cumulative[:-4]) / 4
+
+    def to_lufs(power):
+        return -0.691 + 10 * np.log10(np.maximum(power, 1e-12))
+
+    windows = windows[to_lufs(windows) > -70.0]  # Absolute gate
+    if not windows.size:
+        return None
+    relative_gate = to_lufs(windows.mean()) - 10.0
+    windows = windows[to_lufs(windows) > relative_gate]
+    if not windows.size:
+        return None
+    return float(to_lufs(windows.mean()))
+
+
+def gain_to_scale(gain_db: Optional[float]) -> float:
+    """Linear volume factor for a gain in dB (1.0 if unknown)"""
+    if gain_db is None:
+        return 1.0
+    return 10 ** (gain_db / 20)
+
+
+class LoudnessAnalyzer:
+    """Runs file analyses in a process pool and reports back via callbacks (Single Responsibility)"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or max(1, min(2, (os.cpu_count() or 2) - 1))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    @staticmethod
+    def is_available() -> bool:
+        return NUMPY_AVAILABLE
+
+    def analyze_async(self, key, path: str, callback: Callable[[object, Optional[object]], None],
+                      func: Callable[[str], Optional[object]] = analyze_file) -> bool:
+        """
+        Queue analysis of a file with func (a module-level function, loudness by default).
+        callback(key, result) runs on a pool thread of this process once done. Returns
+        False if unavailable or already queued.
+        """
+        if not NUMPY_AVAILABLE:
+            return False
+
+        pending_key = (func.__name__, key)
+        with self._lock:
+            if pending_key in self._pending:
+                return False
+            self._pending.add(pending_key)
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            future = self._executor.submit(func, path)
+
+        def on_done(done_future):
+            with self._lock:
+                self._pending.discard(pending_key)
+            try:
+                result = done_future.result()
+            except Exception as e:
+                logger.error("Analysis (%s) failed for %s: %s", func.__name__, os.path.basename(path), e)
+                result = None
+            try:
+                callback(key, result)
+            except Exception as e:
+                logger.error("Analysis callback error: %s", e)
+
+        future.add_done_callback(on_done)
+        return True
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
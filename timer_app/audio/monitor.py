@@ -2,10 +2,14 @@
 Playback Monitor - Following Single Responsibility Principle (SOLID)
 This class only handles monitoring playback and coordinating loop events.
 """
+import logging
 import threading
 import time
 from typing import Optional, Callable
 from .interfaces import AudioPlayerInterface, PlaylistInterface, LoopControlInterface, PlaybackEventInterface, PlaybackState
+from .telemetry import PlaybackTelemetry
+
+logger = logging.getLogger(__name__)
 
 
 class PlaybackMonitor:
@@ -15,11 +19,13 @@ class PlaybackMonitor:
                  player: AudioPlayerInterface,
                  playlist: PlaylistInterface, 
                  loop_controller: LoopControlInterface,
-                 event_handler: Optional[PlaybackEventInterface] = None):
+                 event_handler: Optional[PlaybackEventInterface] = None,
+                 telemetry: Optional[PlaybackTelemetry] = None):
         self._player = player
         self._playlist = playlist
         self._loop_controller = loop_controller
         self._event_handler = event_handler
+        self._telemetry = telemetry or PlaybackTelemetry()
         
         # Threading control
         self._monitor_thread: Optional[threading.Thread] = None
@@ -30,16 +36,17 @@ class PlaybackMonitor:
     def start_monitoring(self) -> None:
         """Start monitoring playback (Single Responsibility)"""
         if self._is_monitoring:
-            print("⚠️ Monitor already running")
+            logger.warning("⚠️ Monitor already running")
             return
         
         self.stop_monitoring()  # Ensure clean state
         
         self._stop_event.clear()
         self._is_monitoring = True
+        self._telemetry.reset_monitor_window()
         self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
-        print("👁️ Playback monitor started")
+        logger.info("👁️ Playback monitor started")
     
     def stop_monitoring(self) -> None:
         """Stop monitoring playback (Single Responsibility)"""
@@ -49,22 +56,26 @@ class PlaybackMonitor:
         self._is_monitoring = False
         self._stop_event.set()
         
-        if self._monitor_thread and self._monitor_thread.is_alive():
+        # The monitor stops itself at the end of the playlist - it can't join its own thread
+        if (self._monitor_thread and self._monitor_thread.is_alive()
+                and self._monitor_thread is not threading.current_thread()):
             self._monitor_thread.join(timeout=1.0)
         
-        print("🛑 Playback monitor stopped")
+        logger.info("🛑 Playback monitor stopped")
     
     def _monitor_loop(self) -> None:
         """Main monitoring loop - THE CRITICAL FIX FOR LOOPING (Single Responsibility)"""
-        print("🔍 Monitor loop started")
+        logger.debug("🔍 Monitor loop started")
         
         while not self._stop_event.is_set() and self._is_monitoring:
             try:
+                self._telemetry.monitor_iteration()
                 if self._player.get_state() == PlaybackState.PLAYING:
                     # Check if track finished
                     if self._player.is_track_finished():
-                        print("🎵 Track finished - handling loop logic")
-                        self._handle_track_finished()
+                        logger.debug("🎵 Track finished - handling loop logic")
+                        # Time the gap from when the end was detected upstream, not from this poll
+                        self._handle_track_finished(self._player.get_finished_at() or time.perf_counter())
                 
                 # Sleep with interruption check for responsiveness
                 for _ in range(int(self._monitor_interval * 10)):  # 10ms increments
@@ -73,12 +84,13 @@ class PlaybackMonitor:
                     time.sleep(0.01)
                     
             except Exception as e:
-                print(f"❌ Monitor error: {e}")
+                logger.error("❌ Monitor error: %s", e)
+                self._telemetry.record_error('monitor_exception')
                 break
         
-        print("🔍 Monitor loop ended")
+        logger.debug("🔍 Monitor loop ended")
     
-    def _handle_track_finished(self) -> None:
+    def _handle_track_finished(self, finished_at: Optional[float] = None) -> None:
         """
         Handle when a track finishes - THE KEY TO FIXING SINGLE TRACK LOOP
         This method solves the threading issue by handling everything in the monitor thread
@@ -96,27 +108,35 @@ class PlaybackMonitor:
             # Load and play next track (or same track for single repeat)
             next_track = self._playlist.get_track(next_index)
             if next_track:
-                print(f"🔄 Loading next track: {next_track.title}")
+                logger.debug("🔄 Loading next track: %s", next_track.title)
                 
                 # THE CRITICAL FIX: Load and play directly in monitor thread
                 # This avoids the threading conflicts that caused single-loop failure
-                if self._player.load_track(next_track):
+                load_start = time.perf_counter()
+                loaded = self._player.load_track(next_track)
+                self._telemetry.record_load(time.perf_counter() - load_start)
+                if loaded:
                     if self._player.play():
+                        if finished_at is not None:
+                            self._telemetry.record_transition_gap(time.perf_counter() - finished_at)
                         if self._event_handler:
                             self._event_handler.on_track_started(next_track, next_index)
-                        print(f"✅ Successfully looped to: {next_track.title}")
+                        logger.debug("✅ Successfully looped to: %s", next_track.title)
                     else:
-                        print(f"❌ Failed to play: {next_track.title}")
+                        logger.error("❌ Failed to play: %s", next_track.title)
+                        self._telemetry.record_error('play_failed')
                         self._stop_playback()
                 else:
-                    print(f"❌ Failed to load: {next_track.title}")
+                    logger.error("❌ Failed to load: %s", next_track.title)
+                    self._telemetry.record_error('load_failed')
                     self._stop_playback()
             else:
-                print("❌ Next track not found")
+                logger.error("❌ Next track not found")
+                self._telemetry.record_error('track_not_found')
                 self._stop_playback()
         else:
             # No more tracks to play
-            print("⏹️ Playback completed")
+            logger.info("⏹️ Playback completed")
             self._stop_playback()
     
     def _stop_playback(self) -> None:
@@ -138,9 +158,9 @@ class PlaybackMonitor:
         """Set monitoring interval in seconds (for performance tuning)"""
         if 0.01 <= interval <= 1.0:  # Reasonable bounds
             self._monitor_interval = interval
-            print(f"⏱️ Monitor interval set to {interval}s")
+            logger.debug("⏱️ Monitor interval set to %ss", interval)
         else:
-            print(f"❌ Invalid interval: {interval}. Must be between 0.01 and 1.0 seconds")
+            logger.error("❌ Invalid interval: %s. Must be between 0.01 and 1.0 seconds", interval)
     
     def get_status(self) -> dict:
         """Get monitor status"""
@@ -1,11 +1,22 @@
 """
 Concrete Audio Player Implementation - Following Single Responsibility Principle (SOLID)
 This class only handles the core audio playback functionality.
+
+Mixer calls are queued on the shared AudioEngine thread, so callers (UI, monitor)
+never block on pygame.
 """
-import pygame
+import logging
 import os
 from typing import Optional
+from timer_app.infrastructure.lazy_import import lazy_import
 from .interfaces import AudioPlayerInterface, TrackInfo, PlaybackState
+from .engine import get_audio_engine
+
+logger = logging.getLogger(__name__)
+
+pygame = lazy_import("pygame")  # Loaded when the player initialises the mixer
+
+LOAD_TIMEOUT = 5.0  # Seconds to wait for the engine to open a track
 
 
 class PygameAudioPlayer(AudioPlayerInterface):
@@ -16,52 +27,62 @@ class PygameAudioPlayer(AudioPlayerInterface):
         self._state = PlaybackState.STOPPED
         self._volume = 0.7
         self._pygame_ready = False
+        self._engine = get_audio_engine()
         self._init_pygame()
     
     def _init_pygame(self) -> None:
-        """Initialize pygame mixer"""
-        try:
+        """Initialize pygame mixer on the engine thread"""
+        def init_mixer():
             pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
             pygame.mixer.init()
+        
+        try:
+            self._engine.run_sync('init', init_mixer)
             self._pygame_ready = True
-            print("🎵 Pygame audio player initialized")
+            logger.info("🎵 Pygame audio player initialized")
         except Exception as e:
-            print(f"❌ Failed to initialize pygame audio: {e}")
+            logger.error("❌ Failed to initialize pygame audio: %s", e)
             self._pygame_ready = False
     
     def load_track(self, track: TrackInfo) -> bool:
         """Load a track for playback (Single Responsibility)"""
         if not self._pygame_ready:
-            print("❌ Pygame not ready")
+            logger.error("❌ Pygame not ready")
             return False
         
         if not os.path.exists(track.path):
-            print(f"❌ Track file not found: {track.path}")
+            logger.error("❌ Track file not found: %s", track.path)
             return False
         
         try:
-            pygame.mixer.music.load(track.path)
+            # Wait for the engine so a file the mixer can't open is reported here, not skipped silently
+            if not self._engine.load(track.path).result(timeout=LOAD_TIMEOUT):
+                self._current_track = None
+                return False
             self._current_track = track
-            print(f"✅ Loaded track: {track.title}")
+            self._state = PlaybackState.STOPPED
+            logger.info("✅ Loaded track: %s", track.title)
             return True
         except Exception as e:
-            print(f"❌ Failed to load track {track.path}: {e}")
+            logger.error("❌ Failed to load track %s: %s", track.path, e)
+            self._current_track = None
+            self._state = PlaybackState.STOPPED
             return False
     
     def play(self) -> bool:
         """Start playback of loaded track (Single Responsibility)"""
         if not self._pygame_ready or not self._current_track:
-            print("❌ No track loaded or pygame not ready")
+            logger.error("❌ No track loaded or pygame not ready")
             return False
         
         try:
-            pygame.mixer.music.set_volume(self._volume)
-            pygame.mixer.music.play()
+            self._engine.set_volume(self._volume)
+            self._engine.play()
             self._state = PlaybackState.PLAYING
-            print(f"▶️ Playing: {self._current_track.title}")
+            logger.info("▶️ Playing: %s", self._current_track.title)
             return True
         except Exception as e:
-            print(f"❌ Playback error: {e}")
+            logger.error("❌ Playback error: %s", e)
             return False
     
     def pause(self) -> bool:
@@ -70,12 +91,12 @@ class PygameAudioPlayer(AudioPlayerInterface):
             return False
         
         try:
-            pygame.mixer.music.pause()
+            self._engine.pause()
             self._state = PlaybackState.PAUSED
-            print("⏸️ Paused")
+            logger.info("⏸️ Paused")
             return True
         except Exception as e:
-            print(f"❌ Pause error: {e}")
+            logger.error("❌ Pause error: %s", e)
             return False
     
     def resume(self) -> bool:
@@ -84,12 +105,12 @@ class PygameAudioPlayer(AudioPlayerInterface):
             return False
         
         try:
-            pygame.mixer.music.unpause()
+            self._engine.resume()
             self._state = PlaybackState.PLAYING
-            print("▶️ Resumed")
+            logger.info("▶️ Resumed")
             return True
         except Exception as e:
-            print(f"❌ Resume error: {e}")
+            logger.error("❌ Resume error: %s", e)
             return False
     
     def stop(self) -> bool:
@@ -98,29 +119,29 @@ class PygameAudioPlayer(AudioPlayerInterface):
             return False
         
         try:
-            pygame.mixer.music.stop()
+            self._engine.stop()
             self._state = PlaybackState.STOPPED
-            print("⏹️ Stopped")
+            logger.info("⏹️ Stopped")
             return True
         except Exception as e:
-            print(f"❌ Stop error: {e}")
+            logger.error("❌ Stop error: %s", e)
             return False
     
     def set_volume(self, volume: float) -> bool:
         """Set volume (Single Responsibility)"""
         if not 0.0 <= volume <= 1.0:
-            print(f"❌ Invalid volume: {volume}. Must be between 0.0 and 1.0")
+            logger.error("❌ Invalid volume: %s. Must be between 0.0 and 1.0", volume)
             return False
         
         self._volume = volume
         
         if self._pygame_ready:
             try:
-                pygame.mixer.music.set_volume(self._volume)
-                print(f"🔊 Volume: {int(self._volume * 100)}%")
+                self._engine.set_volume(self._volume)
+                logger.debug("🔊 Volume: %s%%", int(self._volume * 100))
                 return True
             except Exception as e:
-                print(f"❌ Volume error: {e}")
+                logger.error("❌ Volume error: %s", e)
                 return False
         
         return True  # Volume stored for when pygame becomes ready
@@ -134,22 +155,32 @@ class PygameAudioPlayer(AudioPlayerInterface):
         if not self._pygame_ready:
             return False
         
-        try:
-            # Track is finished if not busy and not paused
-            return not pygame.mixer.music.get_busy() and self._state != PlaybackState.PAUSED
-        except Exception:
-            return False
+        # The engine flags the end of the track; ignore it while commands are still queued
+        snapshot = self._engine.snapshot()
+        return (snapshot['state'] == 'finished' and not snapshot['pending']
+                and self._state == PlaybackState.PLAYING)
+    
+    def get_finished_at(self) -> Optional[float]:
+        """When the engine's playback poll saw the track end (the gap timer starts here)"""
+        return self._engine.snapshot()['finished_at']
     
     def get_current_track(self) -> Optional[TrackInfo]:
         """Get currently loaded track"""
         return self._current_track
     
+    def get_command_latency(self):
+        """Queue wait and run time per audio command (see AudioEngine.get_metrics)"""
+        return self._engine.get_metrics()
+    
     def cleanup(self) -> None:
         """Clean up resources"""
         if self._pygame_ready:
-            try:
+            def quit_mixer():
                 pygame.mixer.music.stop()
                 pygame.mixer.quit()
-                print("🧹 Audio player cleaned up")
+            
+            try:
+                self._engine.run_sync('cleanup', quit_mixer)
+                logger.info("🧹 Audio player cleaned up")
             except Exception as e:
-                print(f"⚠️ Cleanup warning: {e}")
\ No newline at end of file
+                logger.warning("⚠️ Cleanup warning: %s", e)
\ No newline at end of file
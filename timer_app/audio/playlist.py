@@ -1,175 +1,258 @@
 """
 Playlist Management - Following Single Responsibility Principle (SOLID)
 This class only handles playlist operations and track management.
+
+Tracks get stable ids. Play order is kept in a BlockedList of ids and a path -> id
+hash index makes duplicate checks O(1), so libraries of 100k+ tracks stay responsive.
 """
-from typing import List, Optional
-from .interfaces import PlaylistInterface, TrackInfo
+import logging
+from typing import Callable, Dict, List, Optional
+from .interfaces import PlaylistInterface, PlaylistChange, TrackInfo
+from .blocked_list import BlockedList
+from .library import normalize_track_path
+from .shuffle import ShuffleOrder
+
+logger = logging.getLogger(__name__)
 
 
 class AudioPlaylist(PlaylistInterface):
     """Concrete implementation of playlist management (Single Responsibility)"""
     
     def __init__(self):
-        self._tracks: List[TrackInfo] = []
-        self._current_index = 0
+        self._order = BlockedList()  # Track ids in play order
+        self._tracks_by_id: Dict[int, TrackInfo] = {}
+        self._id_by_path: Dict[str, int] = {}
+        self._next_id = 1
+        self._current_id: Optional[int] = None
         self._shuffle_enabled = False
-        self._shuffle_history: List[int] = []  # Track shuffle history to avoid immediate repeats
+        self._shuffle = ShuffleOrder()  # Precomputed play order, keyed by track id
+        self._listeners: List[Callable[[PlaylistChange, dict], None]] = []
     
     def add_track(self, track: TrackInfo) -> None:
         """Add track to playlist (Single Responsibility)"""
-        self._tracks.append(track)
-        print(f"➕ Added to playlist: {track.title}")
+        self.insert_track(len(self._order), track)
+    
+    def insert_track(self, index: int, track: TrackInfo) -> Optional[int]:
+        """Insert track before index, returns its id (None if the path is already listed)"""
+        track.path = normalize_track_path(track.path)
+        if track.path in self._id_by_path:
+            logger.warning("⚠️ Already in playlist: %s", track.title)
+            return None
+        
+        track_id = self._next_id
+        self._next_id += 1
+        track.track_id = track_id
+        
+        index = max(0, min(index, len(self._order)))
+        self._order.insert(index, track_id)
+        self._tracks_by_id[track_id] = track
+        self._id_by_path[track.path] = track_id
+        
+        if self._current_id is None:
+            self._current_id = track_id
+        if self._shuffle_enabled:
+            self._shuffle.add(track_id)
+        
+        logger.debug("➕ Added to playlist: %s", track.title)
+        self._notify(PlaylistChange.ADDED, track_id=track_id, index=index)
+        return track_id
     
     def remove_track(self, index: int) -> bool:
         """Remove track at index (Single Responsibility)"""
         if not self._is_valid_index(index):
-            print(f"❌ Invalid track index: {index}")
+            logger.error("❌ Invalid track index: %s", index)
+            return False
+        return self.remove_track_by_id(self._order[index])
+    
+    def remove_track_by_id(self, track_id: int) -> bool:
+        """Remove a track by its stable id"""
+        if track_id not in self._tracks_by_id:
             return False
         
-        removed_track = self._tracks.pop(index)
-        print(f"➖ Removed from playlist: {removed_track.title}")
+        index = self._order.remove(track_id)
+        removed_track = self._tracks_by_id.pop(track_id)
+        del self._id_by_path[removed_track.path]
+        self._shuffle.remove(track_id)
+        logger.debug("➖ Removed from playlist: %s", removed_track.title)
         
-        # Adjust current index if necessary
-        if index < self._current_index:
-            self._current_index -= 1
-        elif index == self._current_index and self._current_index >= len(self._tracks):
-            self._current_index = max(0, len(self._tracks) - 1)
+        # The track that slides into the removed slot becomes current (or the new last one)
+        if track_id == self._current_id:
+            if self._order:
+                self._current_id = self._order[min(index, len(self._order) - 1)]
+            else:
+                self._current_id = None
         
+        self._notify(PlaylistChange.REMOVED, track_id=track_id, index=index)
         return True
     
     def get_track(self, index: int) -> Optional[TrackInfo]:
         """Get track at index (Single Responsibility)"""
         if self._is_valid_index(index):
-            return self._tracks[index]
+            return self._tracks_by_id[self._order[index]]
         return None
     
+    def get_track_by_id(self, track_id: int) -> Optional[TrackInfo]:
+        """Get track by its stable id"""
+        return self._tracks_by_id.get(track_id)
+    
+    def get_track_id(self, index: int) -> Optional[int]:
+        """Get the stable id of the track at index"""
+        return self._order[index] if self._is_valid_index(index) else None
+    
+    def get_index_of_id(self, track_id: int) -> Optional[int]:
+        """Get the current position of a track id"""
+        return self._order.index(track_id) if track_id in self._order else None
+    
+    def find_by_path(self, path: str) -> Optional[int]:
+        """Get the id of the track with this path in O(1)"""
+        return self._id_by_path.get(normalize_track_path(path))
+    
+    def contains_path(self, path: str) -> bool:
+        """Check if a file is already in the playlist in O(1)"""
+        return normalize_track_path(path) in self._id_by_path
+    
     def get_current_index(self) -> int:
         """Get current track index (Single Responsibility)"""
-        return self._current_index
+        if self._current_id is None:
+            return 0
+        return self._order.index(self._current_id)
     
     def set_current_index(self, index: int) -> bool:
         """Set current track index (Single Responsibility)"""
         if self._is_valid_index(index):
-            self._current_index = index
+            track_id = self._order[index]
+            changed = track_id != self._current_id
+            self._current_id = track_id
+            if self._shuffle_enabled:
+                self._shuffle.select(track_id)
+            if changed:
+                self._notify(PlaylistChange.CURRENT_CHANGED, track_id=track_id, index=index)
             return True
         return False
     
     def get_playlist_size(self) -> int:
         """Get total number of tracks (Single Responsibility)"""
-        return len(self._tracks)
+        return len(self._order)
     
     def clear_playlist(self) -> None:
         """Clear all tracks (Single Responsibility)"""
-        self._tracks.clear()
-        self._current_index = 0
-        print("🗑️ Playlist cleared")
+        self._order.clear()
+        self._tracks_by_id.clear()
+        self._id_by_path.clear()
+        self._current_id = None
+        self._shuffle.reset(())
+        logger.info("🗑️ Playlist cleared")
+        self._notify(PlaylistChange.CLEARED)
     
     def get_current_track(self) -> Optional[TrackInfo]:
         """Get current track"""
-        return self.get_track(self._current_index)
+        if self._current_id is None:
+            return None
+        return self._tracks_by_id.get(self._current_id)
     
     def next_index(self) -> Optional[int]:
         """Get next track index, None if at end"""
-        if self._current_index < len(self._tracks) - 1:
-            return self._current_index + 1
+        current_index = self.get_current_index()
+        if current_index < len(self._order) - 1:
+            return current_index + 1
         return None
     
     def previous_index(self) -> Optional[int]:
         """Get previous track index, None if at beginning"""
-        if self._current_index > 0:
-            return self._current_index - 1
+        current_index = self.get_current_index()
+        if current_index > 0:
+            return current_index - 1
         return None
     
     def first_index(self) -> Optional[int]:
         """Get first track index, None if empty"""
-        return 0 if self._tracks else None
+        return 0 if self._order else None
     
     def last_index(self) -> Optional[int]:
         """Get last track index, None if empty"""
-        return len(self._tracks) - 1 if self._tracks else None
+        return len(self._order) - 1 if self._order else None
     
     def is_empty(self) -> bool:
         """Check if playlist is empty"""
-        return len(self._tracks) == 0
+        return len(self._order) == 0
     
     def is_at_end(self) -> bool:
         """Check if current index is at the last track"""
-        return self._current_index >= len(self._tracks) - 1
+        return self.get_current_index() >= len(self._order) - 1
     
     def is_at_beginning(self) -> bool:
         """Check if current index is at the first track"""
-        return self._current_index == 0
+        return self.get_current_index() == 0
     
     def _is_valid_index(self, index: int) -> bool:
         """Check if index is valid for current playlist"""
-        return 0 <= index < len(self._tracks)
+        return 0 <= index < len(self._order)
     
     def get_all_tracks(self) -> List[TrackInfo]:
         """Get copy of all tracks for display purposes"""
-        return self._tracks.copy()
+        return [self._tracks_by_id[track_id] for track_id in self._order]
     
     def move_track(self, from_index: int, to_index: int) -> bool:
         """Move track from one position to another (Open/Closed - can extend functionality)"""
-        if not (self._is_valid_index(from_index) and 0 <= to_index < len(self._tracks)):
+        if not (self._is_valid_index(from_index) and 0 <= to_index < len(self._order)):
             return False
         
-        # Remove track from original position
-        track = self._tracks.pop(from_index)
-        
-        # Insert at new position
-        self._tracks.insert(to_index, track)
+        # Ids are stable, so the current track and shuffle order need no fix-ups
+        track_id = self._order.move(from_index, to_index)
+        track = self._tracks_by_id[track_id]
         
-        # Update current index if affected
-        if from_index == self._current_index:
-            self._current_index = to_index
-        elif from_index < self._current_index <= to_index:
-            self._current_index -= 1
-        elif to_index <= self._current_index < from_index:
-            self._current_index += 1
-        
-        print(f"📦 Moved '{track.title}' from position {from_index} to {to_index}")
+        logger.debug("📦 Moved '%s' from position %s to %s", track.title, from_index, to_index)
+        self._notify(PlaylistChange.MOVED, track_id=track_id, from_index=from_index, to_index=to_index)
         return True
     
+    def add_listener(self, callback: Callable[[PlaylistChange, dict], None]) -> None:
+        """Register a callback(change, details) for playlist changes (Observer Pattern)"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[PlaylistChange, dict], None]) -> None:
+        """Unregister a change callback"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _notify(self, change: PlaylistChange, **details) -> None:
+        """Send a change notification to all listeners"""
+        for callback in list(self._listeners):
+            try:
+                callback(change, details)
+            except Exception as e:
+                logger.error("❌ Playlist listener error: %s", e)
+    
     def enable_shuffle(self) -> None:
         """Enable shuffle mode"""
         self._shuffle_enabled = True
-        self._shuffle_history.clear()
-        print("🔀 Shuffle enabled")
+        self._shuffle.reset(self._order, current=self._current_id)
+        logger.info("🔀 Shuffle enabled")
     
     def disable_shuffle(self) -> None:
         """Disable shuffle mode"""
         self._shuffle_enabled = False
-        self._shuffle_history.clear()
-        print("➡️ Shuffle disabled")
+        self._shuffle.reset(())
+        logger.info("➡️ Shuffle disabled")
     
     def is_shuffle_enabled(self) -> bool:
         """Check if shuffle is enabled"""
         return self._shuffle_enabled
     
     def get_next_shuffle_index(self) -> Optional[int]:
-        """Get next random track index for shuffle mode"""
-        if not self._shuffle_enabled or len(self._tracks) <= 1:
+        """Get next track index in shuffle order without advancing (set_current_index advances)"""
+        if not self._shuffle_enabled or len(self._order) <= 1:
             return None
-        
-        import random
-        
-        # If we've played all tracks, reset history
-        if len(self._shuffle_history) >= len(self._tracks):
-            self._shuffle_history.clear()
-        
-        # Find available tracks (not in recent history)
-        available_indices = []
-        for i in range(len(self._tracks)):
-            if i not in self._shuffle_history[-min(3, len(self._tracks)-1):]:  # Avoid last 3 or total-1 tracks
-                available_indices.append(i)
-        
-        if not available_indices:
-            # If no available tracks, just pick any except current
-            available_indices = [i for i in range(len(self._tracks)) if i != self._current_index]
-        
-        if available_indices:
-            next_index = random.choice(available_indices)
-            self._shuffle_history.append(next_index)
-            return next_index
-        
-        return None
\ No newline at end of file
+        track_id = self._shuffle.peek_next()
+        return self.get_index_of_id(track_id) if track_id is not None else None
+    
+    def get_previous_shuffle_index(self) -> Optional[int]:
+        """Get previously played track index from shuffle history"""
+        if not self._shuffle_enabled:
+            return None
+        track_id = self._shuffle.peek_previous()
+        return self.get_index_of_id(track_id) if track_id is not None else None
+    
+    def is_shuffle_cycle_complete(self) -> bool:
+        """Check if every track has been played in the current shuffle cycle"""
+        return not self._shuffle.has_next_in_cycle()
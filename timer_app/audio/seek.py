@@ -0,0 +1,270 @@
+"""
+Seek Subsystem - Following Single Responsibility Principle (SOLID)
+This module only handles moving the playback position of pygame.mixer.music.
+
+Seeks keep the loaded stream open and use set_pos where the codec supports it.
+For MP3s a per-file frame offset index (built once) provides an accurate fallback
+that restarts decoding at the nearest frame instead of decoding from the start.
+seek() must run on the audio engine thread (AudioEngine.seek), which also coalesces
+drag events so only the latest target is applied.
+"""
+import logging
+import bisect
+import io
+import mmap
+import os
+import threading
+from array import array
+from typing import Dict, Optional, Tuple
+
+from timer_app.infrastructure.lazy_import import lazy_import
+
+logger = logging.getLogger(__name__)
+
+pygame = lazy_import("pygame")  # Loaded on first mixer call
+PYGAME_AVAILABLE = pygame is not None
+
+
+# MPEG audio header tables: bitrates (kbps) keyed by (mpeg1?, layer)
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates keyed by MPEG version bits (3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5)
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# Formats where pygame.mixer.music.set_pos works on the open stream
+SET_POS_FORMATS = ('.mp3', '.ogg', '.flac', '.mod', '.xm', '.it', '.s3m')
+
+
+class Mp3FrameIndex:
+    """Per-file table of (time, byte offset) for MPEG audio frames (Single Responsibility)"""
+
+    def __init__(self, times: array, offsets: array, duration: float):
+        self._times = times
+        self._offsets = offsets
+        self.duration = duration
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def locate(self, position: float) -> Tuple[float, int]:
+        """Get (frame start time, byte offset) of the last indexed frame at or before position"""
+        if not self._times:
+            return 0.0, 0
+        i = bisect.bisect_right(self._times, position) - 1
+        i = max(0, i)
+        return self._times[i], self._offsets[i]
+
+    @classmethod
+    def build(cls, path: str, resolution: float = 0.25) -> Optional['Mp3FrameIndex']:
+        """Scan MPEG frame headers once; keep one entry every `resolution` seconds"""
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < 4:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return cls._scan(data, size, resolution)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not index %s: %s", os.path.basename(path), e)
+            return None
+
+    @classmethod
+    def _scan(cls, data, size: int, resolution: float) -> Optional['Mp3FrameIndex']:
+        times = array('d')
+        offsets = array('q')
+        offset = cls._skip_id3v2(data, size)
+        elapsed = 0.0
+        next_mark = 0.0
+
+        while offset + 4 <= size:
+            frame = cls._parse_header(data[offset:offset + 4])
+            if frame is None:
+                # Lost sync (junk or trailing tags) - resynchronise on the next 0xFF byte
+                next_sync = data.find(b'\xff', offset + 1)
+                if next_sync < 0:
+                    break
+                offset = next_sync
+                continue
+
+            frame_length, frame_duration = frame
+            if elapsed >= next_mark:
+                times.append(elapsed)
+                offsets.append(offset)
+                next_mark = elapsed + resolution
+            elapsed += frame_duration
+            offset += frame_length
+
+        if not times:
+            return None
+        return cls(times, offsets, elapsed)
+
+    @staticmethod
+    def _skip_id3v2(data, size: int) -> int:
+        """Return the offset just past a leading ID3v2 tag (0 if there is none)"""
+        if size >= 10 and data[0:3] == b'ID3':
+            tag_size = ((data[6] & 0x7F) << 21) | ((data[7] & 0x7F) << 14) | \
+                       ((data[8] & 0x7F) << 7) | (data[9] & 0x7F)
+            footer = 10 if data[5] & 0x10 else 0
+            return 10 + tag_size + footer
+        return 0
+
+    @staticmethod
+    def _parse_header(header: bytes) -> Optional[Tuple[int, float]]:
+        """Parse a 4-byte frame header into (frame length in bytes, duration in seconds)"""
+        if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+            return None
+
+        version_bits = (header[1] >> 3) & 0x03
+        layer_bits = (header[1] >> 1) & 0x03
+        bitrate_index = header[2] >> 4
+        sample_rate_index = (header[2] >> 2) & 0x03
+        padding = (header[2] >> 1) & 0x01
+
+        if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+            return None
+
+        layer = 4 - layer_bits
+        mpeg1 = version_bits == 3
+        bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+        sample_rate = _SAMPLE_RATES[version_bits][sample_rate_index]
+
+        if layer == 1:
+            samples = 384
+            length = (12 * bitrate // sample_rate + padding) * 4
+        else:
+            samples = 1152 if (layer == 2 or mpeg1) else 576
+            length = (samples // 8) * bitrate // sample_rate + padding
+
+        if length < 4:
+            return None
+        return length, samples / sample_rate
+
+
+class SeekController:
+    """Applies seeks to pygame.mixer.music with an MP3 index fallback (Single Responsibility)"""
+
+    def __init__(self):
+        self._indexes: Dict[Tuple[str, float, int], Optional[Mp3FrameIndex]] = {}
+        self._index_lock = threading.Lock()
+
+        # File object backing an index-based seek must stay open while it plays
+        self._stream_file: Optional[io.BufferedReader] = None
+        # Track time at which the loaded stream starts (the frame an index seek opened it at)
+        self._stream_base = 0.0
+
+    def seek(self, path: str, position: float, paused: bool = False) -> Optional[float]:
+        """
+        Seek immediately. Returns the position actually reached (index seeks land on a
+        frame boundary) or None if the seek failed. A paused stream stays paused.
+        """
+        if not PYGAME_AVAILABLE:
+            return None
+
+        extension = os.path.splitext(path)[1].lower()
+        if extension in SET_POS_FORMATS:
+            reached = self._seek_in_stream(extension, position, paused)
+            if reached is not None:
+                return reached
+
+        reached = None
+        if extension == '.mp3':
+            reached = self._seek_with_index(path, position)
+        if reached is None:
+            reached = self._seek_by_reload(path, position)
+
+        if reached is not None and paused:
+            pygame.mixer.music.pause()
+        return reached
+
+    def prepare_index(self, path: str) -> None:
+        """Build the frame index for an MP3 in the background so the first fallback seek is fast"""
+        if os.path.splitext(path)[1].lower() == '.mp3':
+            threading.Thread(target=self.get_index, args=(path,), daemon=True).start()
+
+    def get_index(self, path: str) -> Optional[Mp3FrameIndex]:
+        """Get (building once per file version) the MP3 frame index"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = (path, stat.st_mtime, stat.st_size)
+        with self._index_lock:
+            if key in self._indexes:
+                return self._indexes[key]
+
+        index = Mp3FrameIndex.build(path)
+        with self._index_lock:
+            self._indexes[key] = index
+        return index
+
+    def release(self) -> None:
+        """Close the file backing an index-based seek (call when a new track is loaded)"""
+        self._stream_base = 0.0
+        if self._stream_file:
+            try:
+                self._stream_file.close()
+            except Exception:
+                pass
+            self._stream_file = None
+
+    def _seek_in_stream(self, extension: str, position: float, paused: bool) -> Optional[float]:
+        """Seek on the open stream with set_pos (no reload)"""
+        # After an index seek the stream starts mid-track: positions are relative to that frame
+        offset = position - self._stream_base
+        if offset < 0:
+            return None  # Before the start of this stream - reopen it further back
+        try:
+            if not paused and not pygame.mixer.music.get_busy():
+                # Stream finished or stopped: restart without reloading the file
+                pygame.mixer.music.play(start=offset)
+                return position
+            if extension == '.mp3':
+                # set_pos is relative for MP3 - rewind first for an absolute position
+                pygame.mixer.music.rewind()
+            pygame.mixer.music.set_pos(offset)
+            return position
+        except Exception:
+            return None
+
+    def _seek_with_index(self, path: str, position: float) -> Optional[float]:
+        """Restart decoding at the indexed frame nearest to the target position"""
+        index = self.get_index(path)
+        if index is None:
+            return None
+
+        frame_time, offset = index.locate(position)
+        stream = None
+        try:
+            stream = open(path, 'rb')
+            stream.seek(offset)
+            pygame.mixer.music.load(stream, 'mp3')
+            pygame.mixer.music.play()
+        except Exception as e:
+            logger.error("Index seek error: %s", e)
+            if stream is not None:
+                stream.close()
+            return None
+
+        self.release()
+        self._stream_file = stream
+        self._stream_base = frame_time
+        return frame_time
+
+    def _seek_by_reload(self, path: str, position: float) -> Optional[float]:
+        """Last resort: reload the file and start at the position"""
+        try:
+            pygame.mixer.music.stop()
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.play(start=position)
+            self.release()
+            return position
+        except Exception as e:
+            logger.error("Seek error: %s", e)
+            return None
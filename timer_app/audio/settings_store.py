@@ -0,0 +1,184 @@
+"""
+Settings Store - Following Single Responsibility Principle (SOLID)
+This module only keeps audio settings in memory and persists them.
+
+Callers change values in memory; the store marks itself dirty and a background
+writer saves a snapshot once changes settle (debounced), using an atomic
+write-to-temp-then-rename. Pending changes are flushed at interpreter exit.
+"""
+import logging
+import atexit
+import copy
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsStore:
+    """In-memory settings with dirty tracking and debounced atomic writes (Single Responsibility)"""
+
+    def __init__(self, path: str, debounce: float = 0.5, max_delay: float = 5.0):
+        self.path = path
+        self.debounce = debounce  # Quiet time after the last change before writing
+        self.max_delay = max_delay  # Upper bound while changes keep coming (e.g. slider drags)
+
+        self._data: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()  # Serialises file writes
+        self._condition = threading.Condition(self._lock)
+        self._version = 0  # Bumped on every change
+        self._saved_version = 0
+        self._first_dirty_at: Optional[float] = None
+        self._last_change_at = 0.0
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+        except Exception as e:
+            logger.warning("⚠️ Settings load error (%s): %s", self.path, e)
+            self._data = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return copy.deepcopy(self._data.get(key, default))
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def set(self, key: str, value: Any) -> None:
+        self.update({key: value})
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Change several values; only real changes mark the store dirty"""
+        with self._lock:
+            changed = False
+            for key, value in values.items():
+                if key not in self._data or self._data[key] != value:
+                    self._data[key] = copy.deepcopy(value)
+                    changed = True
+            if changed:
+                self._mark_dirty()
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if key in self._data:
+                del self._data[key]
+                self._mark_dirty()
+
+    def is_dirty(self) -> bool:
+        with self._lock:
+            return self._version != self._saved_version
+
+    def flush(self) -> bool:
+        """Write pending changes now (blocking). Returns False if the write failed"""
+        with self._lock:
+            if self._version == self._saved_version:
+                return True
+            version = self._version
+            snapshot = copy.deepcopy(self._data)
+        return self._write(snapshot, version)
+
+    def close(self) -> None:
+        """Flush and stop the background writer"""
+        with self._lock:
+            self._closed = True
+            self._condition.notify_all()
+        self.flush()
+
+    def _mark_dirty(self) -> None:
+        now = time.monotonic()
+        self._version += 1
+        self._last_change_at = now
+        if self._first_dirty_at is None:
+            self._first_dirty_at = now
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+        self._condition.notify()
+
+    def _writer_loop(self) -> None:
+        """Wait for changes to settle, then write a snapshot; exits when idle"""
+        while True:
+            with self._lock:
+                while self._version == self._saved_version and not self._closed:
+                    if not self._condition.wait(timeout=10.0) and self._version == self._saved_version:
+                        self._writer = None
+                        return
+                if self._closed:
+                    self._writer = None
+                    return
+
+                # Debounce: wait for a quiet period, but never longer than max_delay overall
+                while True:
+                    now = time.monotonic()
+                    due = min(self._last_change_at + self.debounce, self._first_dirty_at + self.max_delay)
+                    if now >= due or self._closed:
+                        break
+                    self._condition.wait(timeout=due - now)
+
+                version = self._version
+                snapshot = copy.deepcopy(self._data)
+
+            self._write(snapshot, version)
+
+    def _write(self, snapshot: Dict[str, Any], version: int) -> bool:
+        """Atomically replace the settings file with a snapshot"""
+        with self._write_lock:
+            with self._lock:
+                if version <= self._saved_version:
+                    return True  # A newer snapshot was already written
+            temp_path = f"{self.path}.tmp"
+            try:
+                directory = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(directory, exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except Exception as e:
+                logger.warning("⚠️ Settings save error (%s): %s", self.path, e)
+                return False
+
+            with self._lock:
+                self._saved_version = version
+                if self._version == version:
+                    self._first_dirty_at = None
+            return True
+
+
+_stores: Dict[str, SettingsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_settings_store(path: str) -> SettingsStore:
+    """Shared store per settings file, so all audio components write through one instance"""
+    key = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = SettingsStore(path)
+            _stores[key] = store
+        return store
+
+
+def flush_all_settings() -> None:
+    """Write every store's pending changes (called at shutdown)"""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.flush()
+
+
+atexit.register(flush_all_settings)
@@ -0,0 +1,207 @@
+"""
+Shuffle Order - Following Single Responsibility Principle (SOLID)
+This class only decides the shuffled play order; it knows nothing about playback.
+
+A Fisher-Yates permutation of the remaining tracks is kept per cycle and consumed
+from the end, so advancing is O(1). Played tracks form a history that previous/next
+can walk through. Adding or removing tracks updates the current cycle in place.
+"""
+import random
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+
+class ShuffleOrder:
+    """Precomputed shuffle permutation with bidirectional history (Single Responsibility)"""
+
+    def __init__(self, keys: Iterable[Hashable] = (), rng: Optional[random.Random] = None,
+                 avoid_repeat_window: int = 3, max_history: int = 1000):
+        self._rng = rng or random.Random()
+        self._window = avoid_repeat_window
+        self._max_history = max_history
+
+        self._members = set()
+        self._upcoming: List[Hashable] = []  # Unplayed keys of this cycle; next pick is the last
+        self._upcoming_pos: Dict[Hashable, int] = {}
+        self._history: List[Hashable] = []  # Played keys, oldest first
+        self._history_index = -1  # Position of the current key in history
+
+        self.reset(keys)
+
+    def reset(self, keys: Iterable[Hashable], current: Optional[Hashable] = None) -> None:
+        """Start a fresh order over keys, optionally with `current` as the playing key"""
+        self._members = set(keys)
+        self._history = []
+        self._history_index = -1
+        self._fill_cycle(exclude=current)
+        if current is not None and current in self._members:
+            self._history.append(current)
+            self._history_index = 0
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._members
+
+    def current(self) -> Optional[Hashable]:
+        """Key that is currently playing, None before the first pick"""
+        if 0 <= self._history_index < len(self._history):
+            return self._history[self._history_index]
+        return None
+
+    def has_next_in_cycle(self) -> bool:
+        """True if there is a forward history entry or an unplayed key left in this cycle"""
+        return self._forward_key() is not None or bool(self._upcoming)
+
+    def peek_next(self) -> Optional[Hashable]:
+        """Key next() would return (starts a new cycle if this one is used up)"""
+        forward = self._forward_key()
+        if forward is not None:
+            return forward
+        if not self._members:
+            return None
+        if not self._upcoming:
+            self._fill_cycle()
+        return self._upcoming[-1] if self._upcoming else None
+
+    def next(self) -> Optional[Hashable]:
+        """Advance to and return the next key in O(1)"""
+        forward = self._forward_key()
+        if forward is not None:
+            self._history_index = self._history.index(forward, self._history_index + 1)
+            return forward
+
+        key = self.peek_next()
+        if key is None:
+            return None
+        self._pop_upcoming(key)
+        self._push_history(key)
+        return key
+
+    def peek_previous(self) -> Optional[Hashable]:
+        """Key previous() would return, None at the start of history"""
+        for i in range(self._history_index - 1, -1, -1):
+            if self._history[i] in self._members:
+                return self._history[i]
+        return None
+
+    def previous(self) -> Optional[Hashable]:
+        """Step back through history, None if there is nothing earlier"""
+        for i in range(self._history_index - 1, -1, -1):
+            if self._history[i] in self._members:
+                self._history_index = i
+                return self._history[i]
+        return None
+
+    def select(self, key: Hashable) -> None:
+        """Make key current (e.g. user picked a track); keeps history consistent"""
+        if key not in self._members or key == self.current():
+            return
+        if key == self._forward_key():
+            self.next()
+            return
+        if key == self.peek_previous():
+            self.previous()
+            return
+
+        if key in self._upcoming_pos:
+            self._pop_upcoming(key)
+        # Jumping elsewhere discards the forward history
+        del self._history[self._history_index + 1:]
+        self._push_history(key)
+
+    def add(self, key: Hashable) -> None:
+        """Insert a new key at a random position of the remaining cycle in O(1)"""
+        if key in self._members:
+            return
+        self._members.add(key)
+        self._upcoming.append(key)
+        self._upcoming_pos[key] = len(self._upcoming) - 1
+        self._swap_upcoming(len(self._upcoming) - 1, self._rng.randrange(len(self._upcoming)))
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a key in O(1); stale history entries are skipped lazily"""
+        if key not in self._members:
+            return
+        self._members.discard(key)
+        if key in self._upcoming_pos:
+            self._pop_upcoming(key)
+
+    def remap(self, mapping: Callable[[Hashable], Optional[Hashable]]) -> None:
+        """
+        Rename every key (O(n)), e.g. when list indices shift after a removal.
+        Keys mapped to None are dropped.
+        """
+        current = self.current()
+        self._members = {new for new in (mapping(k) for k in self._members) if new is not None}
+        self._upcoming = [new for new in (mapping(k) for k in self._upcoming) if new is not None]
+        self._upcoming_pos = {key: i for i, key in enumerate(self._upcoming)}
+
+        history = []
+        new_index = -1
+        for i, key in enumerate(self._history):
+            new_key = mapping(key)
+            if new_key is None:
+                continue
+            history.append(new_key)
+            if i <= self._history_index:
+                new_index = len(history) - 1
+        self._history = history
+        self._history_index = new_index if current is not None else -1
+
+    def _forward_key(self) -> Optional[Hashable]:
+        """Next valid key after the current history position (after stepping back)"""
+        for i in range(self._history_index + 1, len(self._history)):
+            if self._history[i] in self._members:
+                return self._history[i]
+        return None
+
+    def _fill_cycle(self, exclude: Optional[Hashable] = None) -> None:
+        """Build the next cycle with Fisher-Yates, keeping recent keys away from its start"""
+        self._upcoming = [key for key in self._members if key != exclude]
+        for i in range(len(self._upcoming) - 1, 0, -1):
+            j = self._rng.randint(0, i)
+            self._upcoming[i], self._upcoming[j] = self._upcoming[j], self._upcoming[i]
+        self._upcoming_pos = {key: i for i, key in enumerate(self._upcoming)}
+        self._avoid_recent_repeats()
+
+    def _avoid_recent_repeats(self) -> None:
+        """Ensure the first picks of a new cycle were not among the last played keys"""
+        n = len(self._upcoming)
+        window = min(self._window, n // 2)
+        if window <= 0 or not self._history:
+            return
+
+        recent = set(self._history[max(0, self._history_index - window + 1):self._history_index + 1])
+        safe_end = n - window  # Swap targets come from the part of the cycle played later
+        for slot in range(n - 1, n - 1 - window, -1):
+            if self._upcoming[slot] not in recent:
+                continue
+            start = self._rng.randrange(safe_end)
+            for offset in range(safe_end):
+                target = (start + offset) % safe_end
+                if self._upcoming[target] not in recent:
+                    self._swap_upcoming(slot, target)
+                    break
+
+    def _swap_upcoming(self, i: int, j: int) -> None:
+        if i == j:
+            return
+        a, b = self._upcoming[i], self._upcoming[j]
+        self._upcoming[i], self._upcoming[j] = b, a
+        self._upcoming_pos[a], self._upcoming_pos[b] = j, i
+
+    def _pop_upcoming(self, key: Hashable) -> None:
+        """Remove key from the remaining cycle by swapping it with the last entry"""
+        self._swap_upcoming(self._upcoming_pos[key], len(self._upcoming) - 1)
+        self._upcoming.pop()
+        del self._upcoming_pos[key]
+
+    def _push_history(self, key: Hashable) -> None:
+        self._history.append(key)
+        self._history_index = len(self._history) - 1
+        if len(self._history) > 2 * self._max_history:
+            # Trim in bulk so appends stay amortised O(1)
+            drop = len(self._history) - self._max_history
+            del self._history[:drop]
+            self._history_index -= drop
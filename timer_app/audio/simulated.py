@@ -0,0 +1,183 @@
+"""
+Simulated Audio Player - Following Liskov Substitution Principle (SOLID)
+This module only stands in for the real player where no sound device exists.
+
+SimulatedAudioPlayer implements AudioPlayerInterface against a VirtualClock: a
+playing track "finishes" once the clock has advanced past its declared duration.
+Inject it with AudioSystemFactory.create_custom_audio_system(player_impl=...) to
+drive PlaybackMonitor, LoopController and ModularAudioSystem headless, e.g. in
+benchmarks. Every call is counted and transitions are timestamped.
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .interfaces import AudioPlayerInterface, PlaybackState, TrackInfo
+
+
+class VirtualClock:
+    """Manually advanced clock in seconds, safe to read from any thread"""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        with self._lock:
+            return self._now
+
+    def advance(self, seconds: float) -> float:
+        """Move time forward, returns the new time"""
+        if seconds < 0:
+            raise ValueError("VirtualClock can't go backwards")
+        with self._lock:
+            self._now += seconds
+            return self._now
+
+
+class SimulatedAudioPlayer(AudioPlayerInterface):
+    """Headless player driven by a virtual clock (Liskov Substitution)"""
+
+    def __init__(self, clock: Optional[VirtualClock] = None, default_duration: float = 180.0,
+                 failing_paths: Iterable[str] = ()):
+        self.clock = clock or VirtualClock()
+        self.default_duration = default_duration  # Used for tracks without a declared duration
+        self.failing_paths = set(failing_paths)  # load_track fails for these, like a missing file
+
+        self._current_track: Optional[TrackInfo] = None
+        self._state = PlaybackState.STOPPED
+        self._volume = 0.7
+        self._position = 0.0  # Seconds played before the current PLAYING stretch
+        self._started_at = 0.0  # Virtual time the current PLAYING stretch began
+
+        self._lock = threading.Condition()
+        self._calls: Dict[str, int] = {}
+        self._events: List[Tuple[str, float, float, Optional[str]]] = []  # (event, virtual, perf, path)
+        self._plays = 0
+        self._stops = 0
+        self._finished_at: Optional[float] = None
+
+    def _record(self, name: str, event: bool = False) -> None:
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            if event:
+                path = self._current_track.path if self._current_track else None
+                self._events.append((name, self.clock.now(), time.perf_counter(), path))
+                if name == 'play':
+                    self._plays += 1
+                elif name == 'stop':
+                    self._stops += 1
+                self._lock.notify_all()
+
+    def load_track(self, track: TrackInfo) -> bool:
+        self._record('load_track', event=True)
+        if track.path in self.failing_paths:
+            return False
+        self._current_track = track
+        self._state = PlaybackState.STOPPED
+        self._position = 0.0
+        return True
+
+    def play(self) -> bool:
+        if not self._current_track:
+            return False
+        self._position = 0.0
+        self._started_at = self.clock.now()
+        self._state = PlaybackState.PLAYING
+        self._finished_at = None
+        self._record('play', event=True)
+        return True
+
+    def pause(self) -> bool:
+        if self._state != PlaybackState.PLAYING:
+            return False
+        self._position = self.get_position()
+        self._state = PlaybackState.PAUSED
+        self._record('pause', event=True)
+        return True
+
+    def resume(self) -> bool:
+        if self._state != PlaybackState.PAUSED:
+            return False
+        self._started_at = self.clock.now()
+        self._state = PlaybackState.PLAYING
+        self._record('resume', event=True)
+        return True
+
+    def stop(self) -> bool:
+        self._state = PlaybackState.STOPPED
+        self._position = 0.0
+        self._record('stop', event=True)
+        return True
+
+    def set_volume(self, volume: float) -> bool:
+        self._record('set_volume')
+        if not 0.0 <= volume <= 1.0:
+            return False
+        self._volume = volume
+        return True
+
+    def get_state(self) -> PlaybackState:
+        self._record('get_state')
+        return self._state
+
+    def is_track_finished(self) -> bool:
+        self._record('is_track_finished')
+        return self._state == PlaybackState.PLAYING and self.time_remaining() <= 0
+
+    def get_finished_at(self) -> Optional[float]:
+        return self._finished_at
+
+    def get_current_track(self) -> Optional[TrackInfo]:
+        return self._current_track
+
+    def cleanup(self) -> None:
+        self.stop()
+
+    # Simulation helpers ---------------------------------------------------------------
+
+    def duration_of(self, track: Optional[TrackInfo]) -> float:
+        if track is None:
+            return 0.0
+        return track.duration if track.duration and track.duration > 0 else self.default_duration
+
+    def get_position(self) -> float:
+        """Virtual seconds played in the current track"""
+        if self._state == PlaybackState.PLAYING:
+            return self._position + self.clock.now() - self._started_at
+        return self._position
+
+    def time_remaining(self) -> float:
+        """Virtual seconds until the current track finishes"""
+        return self.duration_of(self._current_track) - self.get_position()
+
+    def finish_track(self) -> float:
+        """Advance the clock to the end of the current track, returns the perf_counter time"""
+        self.clock.advance(max(0.0, self.time_remaining()))
+        self._finished_at = time.perf_counter()
+        return self._finished_at
+
+    def play_count(self) -> int:
+        with self._lock:
+            return self._plays
+
+    def wait_for_play(self, after: int, timeout: float = 5.0) -> bool:
+        """Block until more than `after` plays happened; False on stop() or timeout"""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            stops = self._stops
+            while self._plays <= after and self._stops == stops:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._lock.wait(remaining)
+            return self._plays > after
+
+    def get_call_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._calls)
+
+    def get_events(self) -> List[Tuple[str, float, float, Optional[str]]]:
+        """(event, virtual time, perf_counter, track path) for load/play/pause/resume/stop"""
+        with self._lock:
+            return list(self._events)
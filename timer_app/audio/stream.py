@@ -0,0 +1,342 @@
+"""
+Streaming Playback - Following Single Responsibility Principle (SOLID)
+This module only plays a file through a mixer Channel with bounded memory.
+
+A decoder thread turns the file into PCM in small chunks and writes them into a
+fixed-size ring buffer; feed() keeps one chunk playing and one queued on a reserved
+pygame mixer Channel. The decoder thread never touches the mixer: every mixer call,
+feed() included, runs on the thread that owns the mixer (the audio engine, which calls
+feed() as a tick hook every feed_interval seconds). Memory use is the ring buffer plus
+two chunks no matter how long the track is, and position is counted in decoded frames.
+
+Decoders: WAV files matching the mixer format are read with the stdlib wave module;
+everything else is decoded by an ffmpeg subprocess when ffmpeg is on PATH.
+"""
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from collections import deque
+from typing import Optional, Tuple
+
+from timer_app.infrastructure.lazy_import import lazy_import
+
+logger = logging.getLogger(__name__)
+
+pygame = lazy_import("pygame")  # Loaded on first mixer call
+PYGAME_AVAILABLE = pygame is not None
+
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+
+class RingBuffer:
+    """Fixed-capacity byte FIFO shared by one writer and one reader thread"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._read_pos = 0
+        self._size = 0
+        self._eof = False
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def eof(self) -> bool:
+        """True once the writer is done and everything has been read"""
+        return self._eof and self._size == 0
+
+    def write(self, data: bytes) -> bool:
+        """Write all of data, blocking while the buffer is full. False if the buffer was closed"""
+        view = memoryview(data)
+        with self._condition:
+            while view:
+                while self._size == self.capacity and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return False
+                write_pos = (self._read_pos + self._size) % self.capacity
+                count = min(len(view), self.capacity - self._size, self.capacity - write_pos)
+                self._buffer[write_pos:write_pos + count] = view[:count]
+                self._size += count
+                view = view[count:]
+                self._condition.notify_all()
+        return True
+
+    def read(self, size: int) -> bytes:
+        """Read up to size bytes without blocking"""
+        with self._condition:
+            count = min(size, self._size)
+            first = min(count, self.capacity - self._read_pos)
+            data = bytes(self._buffer[self._read_pos:self._read_pos + first])
+            if count > first:
+                data += bytes(self._buffer[:count - first])
+            self._read_pos = (self._read_pos + count) % self.capacity
+            self._size -= count
+            self._condition.notify_all()
+            return data
+
+    def mark_eof(self) -> None:
+        with self._condition:
+            self._eof = True
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Wake and stop a blocked writer (a seek replaces the buffer)"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+class _WaveDecoder:
+    """Chunked PCM reader for WAV files already in the mixer's format"""
+
+    def __init__(self, path: str, start: float, frame_bytes: int):
+        self._file = wave.open(path, 'rb')
+        self._frame_bytes = frame_bytes
+        rate = self._file.getframerate()
+        self._file.setpos(min(int(start * rate), self._file.getnframes()))
+
+    def read(self, size: int) -> bytes:
+        return self._file.readframes(size // self._frame_bytes)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _FfmpegDecoder:
+    """Chunked PCM reader backed by an ffmpeg subprocess (any format ffmpeg understands)"""
+
+    def __init__(self, path: str, start: float, rate: int, channels: int):
+        command = [FFMPEG_PATH, "-nostdin", "-loglevel", "quiet", "-ss", f"{start:.3f}", "-i", path,
+                   "-f", "s16le", "-acodec", "pcm_s16le", "-ac", str(channels), "-ar", str(rate), "-"]
+        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        self._process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                         creationflags=creationflags)
+
+    def read(self, size: int) -> bytes:
+        return self._process.stdout.read(size)
+
+    def close(self) -> None:
+        try:
+            self._process.kill()
+            self._process.stdout.close()
+            self._process.wait(timeout=1.0)
+        except Exception:
+            pass
+
+
+class StreamingPlayback:
+    """Plays one file through a reserved mixer Channel with constant memory (Single Responsibility)"""
+
+    def __init__(self, path: str, buffer_seconds: float = 2.0, chunk_seconds: float = 0.1):
+        self.path = path
+        self.rate, self.sample_width, self.channels = self.mixer_format()
+        self.frame_bytes = self.sample_width * self.channels
+        self.chunk_bytes = max(1, int(self.rate * chunk_seconds)) * self.frame_bytes
+        self.ring = RingBuffer(max(self.chunk_bytes * 2, int(self.rate * buffer_seconds) * self.frame_bytes))
+
+        pygame.mixer.set_reserved(1)
+        self.channel = pygame.mixer.Channel(0)
+        self.volume = 1.0
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._decoder = None
+        self._decode_thread: Optional[threading.Thread] = None
+        self._pending_seek: Optional[float] = None
+
+        # Position bookkeeping (seconds): start + completed chunks + time into the playing chunk
+        self._base_position = 0.0
+        self._frames_done = 0
+        self._in_flight: "deque[int]" = deque()  # Frame counts of the playing and queued chunks
+        self._chunk_started = 0.0
+        self._paused_at: Optional[float] = None
+        self._finished = False
+
+    @staticmethod
+    def mixer_format() -> Tuple[int, int, int]:
+        """(sample rate, bytes per sample, channels) of the initialised mixer"""
+        rate, size, channels = pygame.mixer.get_init()
+        return rate, abs(size) // 8, channels
+
+    @staticmethod
+    def can_stream(path: str) -> bool:
+        """True if a chunked decoder is available for this file"""
+        if not PYGAME_AVAILABLE or not pygame.mixer.get_init() or not os.path.exists(path):
+            return False
+        if FFMPEG_PATH:
+            return True
+        return path.lower().endswith('.wav') and StreamingPlayback._wave_matches_mixer(path)
+
+    @staticmethod
+    def _wave_matches_mixer(path: str) -> bool:
+        rate, sample_width, channels = StreamingPlayback.mixer_format()
+        try:
+            with wave.open(path, 'rb') as f:
+                return (f.getframerate(), f.getsampwidth(), f.getnchannels()) == (rate, sample_width, channels)
+        except (wave.Error, EOFError, OSError):
+            return False
+
+    def memory_bytes(self) -> int:
+        """Upper bound of PCM held in memory (ring buffer + playing and queued chunks)"""
+        return self.ring.capacity + 2 * self.chunk_bytes
+
+    @property
+    def feed_interval(self) -> float:
+        """How often feed() must run to keep the channel queue topped up (a quarter chunk)"""
+        return self.chunk_bytes / self.frame_bytes / self.rate / 4
+
+    def start(self, position: float = 0.0) -> None:
+        """Begin decoding at position; playback starts on the next feed()"""
+        self._base_position = position
+        self._open_decoder(position)
+
+    def seek(self, position: float) -> None:
+        """Jump to a position; rapid calls collapse into the latest target"""
+        with self._lock:
+            self._pending_seek = max(0.0, position)
+            self._finished = False
+
+    def pause(self) -> None:
+        with self._lock:
+            if self._paused_at is None:
+                self.channel.pause()
+                self._paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        with self._lock:
+            if self._paused_at is not None:
+                self._chunk_started += time.monotonic() - self._paused_at
+                self._paused_at = None
+                self.channel.unpause()
+
+    def stop(self) -> None:
+        """Stop playback and release the decoder and threads"""
+        self._stop_event.set()
+        self.ring.close()
+        try:
+            self.channel.stop()
+        except Exception:
+            pass
+        self._close_decoder()
+
+    def set_volume(self, volume: float) -> None:
+        self.volume = volume
+        self.channel.set_volume(volume)
+
+    def is_finished(self) -> bool:
+        return self._finished
+
+    def get_position(self) -> float:
+        """Seconds from the start of the track, counted from frames handed to the mixer"""
+        with self._lock:
+            if self._pending_seek is not None:
+                return self._pending_seek
+            position = self._base_position + self._frames_done / self.rate
+            if self._in_flight:
+                now = self._paused_at if self._paused_at is not None else time.monotonic()
+                playing = self._in_flight[0] / self.rate
+                position += max(0.0, min(now - self._chunk_started, playing))
+            return position
+
+    def _open_decoder(self, position: float) -> None:
+        self._close_decoder()
+        if FFMPEG_PATH and not (self.path.lower().endswith('.wav') and self._wave_matches_mixer(self.path)):
+            self._decoder = _FfmpegDecoder(self.path, position, self.rate, self.channels)
+        else:
+            self._decoder = _WaveDecoder(self.path, position, self.frame_bytes)
+
+        self.ring = RingBuffer(self.ring.capacity)
+        decoder, ring = self._decoder, self.ring
+        self._decode_thread = threading.Thread(target=self._decode_loop, args=(decoder, ring), daemon=True)
+        self._decode_thread.start()
+
+    def _close_decoder(self) -> None:
+        if self._decoder:
+            self.ring.close()
+            self._decoder.close()
+            self._decoder = None
+
+    def _decode_loop(self, decoder, ring: RingBuffer) -> None:
+        """Decode chunks into the ring buffer until EOF, stop or seek"""
+        try:
+            while not self._stop_event.is_set():
+                data = decoder.read(self.chunk_bytes)
+                if not data:
+                    ring.mark_eof()
+                    return
+                if not ring.write(data):
+                    return  # Ring closed by a seek or stop
+        except Exception as e:
+            if not self._stop_event.is_set():
+                logger.error("Stream decode error: %s", e)
+            ring.mark_eof()
+
+    def feed(self) -> None:
+        """Apply a pending seek and keep one chunk playing and one queued (mixer thread only)"""
+        if self._stop_event.is_set():
+            return
+        with self._lock:
+            seek_target, self._pending_seek = self._pending_seek, None
+        if seek_target is not None:
+            self._apply_seek(seek_target)
+
+        if self._paused_at is None:
+            self._advance()
+
+    def _apply_seek(self, position: float) -> None:
+        self.channel.stop()
+        self._open_decoder(position)
+        with self._lock:
+            self._base_position = position
+            self._frames_done = 0
+            self._in_flight.clear()
+            if self._paused_at is not None:
+                self._paused_at = time.monotonic()
+
+    def _advance(self) -> None:
+        """Account for finished chunks and top up the channel queue"""
+        busy = self.channel.get_busy()
+        with self._lock:
+            if not busy:
+                # Everything handed to the channel has played (end of track or underrun)
+                self._frames_done += sum(self._in_flight)
+                self._in_flight.clear()
+            elif len(self._in_flight) == 2 and self.channel.get_queue() is None:
+                # The queued chunk became the playing chunk right when the previous one ended
+                done = self._in_flight.popleft()
+                self._frames_done += done
+                self._chunk_started += done / self.rate
+
+            if not busy and not self._in_flight:
+                if self.ring.eof:
+                    self._finished = True
+                    return
+                chunk = self._next_chunk()
+                if chunk:
+                    self.channel.play(chunk[0])
+                    self.channel.set_volume(self.volume)
+                    self._in_flight.append(chunk[1])
+                    self._chunk_started = time.monotonic()
+                busy = bool(chunk)
+
+            if busy and len(self._in_flight) == 1:
+                chunk = self._next_chunk()
+                if chunk:
+                    self.channel.queue(chunk[0])
+                    self._in_flight.append(chunk[1])
+
+    def _next_chunk(self):
+        """Next (Sound, frame count) from the ring buffer, None if nothing is buffered"""
+        data = self.ring.read(self.chunk_bytes)
+        data = data[:len(data) - len(data) % self.frame_bytes]
+        if not data:
+            return None
+        return pygame.mixer.Sound(buffer=data), len(data) // self.frame_bytes
@@ -2,13 +2,18 @@
 Main Audio System - Facade Pattern coordinating all audio components (SOLID)
 This class follows Dependency Inversion Principle by depending on interfaces, not concrete classes.
 """
+import logging
 import os
+import time
 from typing import Optional, Dict, Any
 from .interfaces import (
     AudioSystemInterface, TrackInfo, RepeatMode, PlaybackState,
     AudioPlayerInterface, PlaylistInterface, LoopControlInterface, PlaybackEventInterface
 )
 from .monitor import PlaybackMonitor
+from .telemetry import PlaybackTelemetry
+
+logger = logging.getLogger(__name__)
 
 
 class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
@@ -26,8 +31,11 @@ class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
         self._playlist = playlist
         self._loop_controller = loop_controller
         
+        # Bounded playback measurements shared with the monitor
+        self._telemetry = PlaybackTelemetry()
+        
         # Create monitor with all dependencies
-        self._monitor = PlaybackMonitor(player, playlist, loop_controller, self)
+        self._monitor = PlaybackMonitor(player, playlist, loop_controller, self, telemetry=self._telemetry)
         
         # State tracking
         self._current_status = {
@@ -44,26 +52,32 @@ class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
         """Load and play track at index (Facade Pattern)"""
         track = self._playlist.get_track(index)
         if not track:
-            print(f"❌ Track at index {index} not found")
+            logger.error("❌ Track at index %s not found", index)
             return False
         
         # Update playlist current index
         self._playlist.set_current_index(index)
         
         # Load and play track
-        if self._player.load_track(track):
-            if self._player.play():
-                self._current_status['is_playing'] = True
-                self._current_status['current_track'] = track
-                
-                # Start monitoring for automatic progression
-                self._monitor.start_monitoring()
-                
-                # Trigger event
-                self.on_track_started(track, index)
-                return True
-        
-        return False
+        load_start = time.perf_counter()
+        loaded = self._player.load_track(track)
+        self._telemetry.record_load(time.perf_counter() - load_start)
+        if not loaded:
+            self._telemetry.record_error('load_failed')
+            return False
+        if not self._player.play():
+            self._telemetry.record_error('play_failed')
+            return False
+
+        self._current_status['is_playing'] = True
+        self._current_status['current_track'] = track
+
+        # Start monitoring for automatic progression
+        self._monitor.start_monitoring()
+
+        # Trigger event
+        self.on_track_started(track, index)
+        return True
     
     def pause_playback(self) -> bool:
         """Pause current playback (Facade Pattern)"""
@@ -130,7 +144,11 @@ class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
     def add_track_from_path(self, file_path: str) -> bool:
         """Add track from file path with metadata extraction"""
         if not os.path.exists(file_path):
-            print(f"❌ File not found: {file_path}")
+            logger.error("❌ File not found: %s", file_path)
+            return False
+        
+        if hasattr(self._playlist, 'contains_path') and self._playlist.contains_path(file_path):
+            logger.warning("⚠️ Already in playlist: %s", os.path.basename(file_path))
             return False
         
         # Extract basic info from filename
@@ -155,6 +173,8 @@ class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
     def get_status(self) -> Dict[str, Any]:
         """Get current system status (Facade Pattern)"""
         current_track = self.get_current_track()
+        command_latency = (self._player.get_command_latency()
+                           if hasattr(self._player, 'get_command_latency') else {})
         return {
             'is_playing': self._current_status['is_playing'],
             'playback_state': self._player.get_state().value,
@@ -169,9 +189,19 @@ class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
             'repeat_display': self._loop_controller.get_repeat_mode_display(),
             'volume': self._current_status['volume'],
             'shuffle_enabled': self.is_shuffle_enabled(),
-            'monitor_status': self._monitor.get_status()
+            'monitor_status': self._monitor.get_status(),
+            'command_latency': command_latency,
+            'telemetry': self._telemetry.get_summary()
         }
     
+    def get_telemetry(self) -> PlaybackTelemetry:
+        """Playback measurements (load times, transition gaps, monitor rate, errors)"""
+        return self._telemetry
+    
+    def dump_telemetry(self, path: str) -> bool:
+        """Write the raw telemetry samples to a JSON file (for profiling sessions)"""
+        return self._telemetry.dump_json(path)
+    
     def start_monitoring(self) -> None:
         """Start monitoring playback (Facade Pattern)"""
         self._monitor.start_monitoring()
@@ -184,27 +214,27 @@ class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
     
     def on_track_started(self, track: TrackInfo, index: int) -> None:
         """Called when a track starts playing"""
-        print(f"🎵 Started: {track.title} by {track.artist}")
+        logger.info("🎵 Started: %s by %s", track.title, track.artist)
     
     def on_track_finished(self, track: TrackInfo, index: int) -> None:
         """Called when a track finishes playing"""
-        print(f"🏁 Finished: {track.title}")
+        logger.info("🏁 Finished: %s", track.title)
     
     def on_playback_paused(self, track: TrackInfo, index: int) -> None:
         """Called when playback is paused"""
-        print(f"⏸️ Paused: {track.title}")
+        logger.info("⏸️ Paused: %s", track.title)
     
     def on_playback_resumed(self, track: TrackInfo, index: int) -> None:
         """Called when playback is resumed"""
-        print(f"▶️ Resumed: {track.title}")
+        logger.info("▶️ Resumed: %s", track.title)
     
     def on_playback_stopped(self) -> None:
         """Called when playback is stopped"""
-        print("⏹️ Playback stopped")
+        logger.info("⏹️ Playback stopped")
     
     def on_repeat_mode_changed(self, mode: RepeatMode) -> None:
         """Called when repeat mode changes"""
-        print(f"🔄 Repeat mode changed: {mode.value}")
+        logger.info("🔄 Repeat mode changed: %s", mode.value)
     
     # Additional utility methods
     
@@ -239,12 +269,12 @@ class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
             if current_shuffle:
                 self._playlist.disable_shuffle()
                 self._current_status['shuffle_enabled'] = False
-                print("🔀 ➡️ Shuffle disabled")
+                logger.info("🔀 ➡️ Shuffle disabled")
                 return False
             else:
                 self._playlist.enable_shuffle()
                 self._current_status['shuffle_enabled'] = True
-                print("➡️ 🔀 Shuffle enabled")
+                logger.info("➡️ 🔀 Shuffle enabled")
                 return True
         return False
     
@@ -259,4 +289,4 @@ class ModularAudioSystem(AudioSystemInterface, PlaybackEventInterface):
         self.stop_playback()
         if hasattr(self._player, 'cleanup'):
             self._player.cleanup()
-        print("🧹 Audio system cleaned up")
\ No newline at end of file
+        logger.info("🧹 Audio system cleaned up")
\ No newline at end of file
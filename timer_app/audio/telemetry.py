@@ -0,0 +1,119 @@
+"""
+Playback Telemetry - Following Single Responsibility Principle (SOLID)
+This module only records how the audio stack performs.
+
+Load durations, end-of-track to next-play gaps and monitor loop rates are kept in
+fixed-size ring buffers (deques), so memory stays bounded however long the app
+runs; errors are counted per kind. get_summary() feeds get_status(), dump_json()
+writes the raw samples for profiling sessions.
+"""
+import logging
+import json
+import threading
+import time
+from collections import Counter, deque
+from typing import Dict, Optional
+
+from timer_app.infrastructure.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+_LOAD_SECONDS = REGISTRY.histogram('timer_audio_load_seconds', "Time to load a track")
+_TRANSITION_GAP_SECONDS = REGISTRY.histogram('timer_audio_transition_gap_seconds', "Silence between tracks")
+_TRANSITIONS = REGISTRY.counter('timer_audio_transitions_total', "Automatic track transitions")
+_ERRORS = REGISTRY.counter('timer_audio_errors_total', "Playback errors by kind")
+
+
+class PlaybackTelemetry:
+    """Bounded playback measurements (Single Responsibility)"""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.load_durations: deque = deque(maxlen=capacity)  # Seconds per load_track
+        self.transition_gaps: deque = deque(maxlen=capacity)  # Seconds from track end to next play
+        self.monitor_rates: deque = deque(maxlen=capacity)  # Monitor iterations per second, one per second
+        self.errors: Counter = Counter()
+        self._lock = threading.Lock()
+        self._iterations = 0
+        self._window_start = time.perf_counter()
+        self._started = time.time()
+
+    def record_load(self, seconds: float) -> None:
+        self.load_durations.append(seconds)
+        _LOAD_SECONDS.observe(seconds)
+
+    def record_transition_gap(self, seconds: float) -> None:
+        self.transition_gaps.append(seconds)
+        _TRANSITIONS.inc()
+        _TRANSITION_GAP_SECONDS.observe(seconds)
+
+    def record_error(self, kind: str) -> None:
+        with self._lock:
+            self.errors[kind] += 1
+        _ERRORS.inc(kind=kind)
+
+    def monitor_iteration(self) -> None:
+        """Count one monitor loop pass; closes a rate sample every second"""
+        now = time.perf_counter()
+        with self._lock:
+            self._iterations += 1
+            elapsed = now - self._window_start
+            if elapsed >= 1.0:
+                self.monitor_rates.append(self._iterations / elapsed)
+                self._iterations = 0
+                self._window_start = now
+
+    def reset_monitor_window(self) -> None:
+        """Start a fresh rate window (call when the monitor starts, so idle time isn't averaged in)"""
+        with self._lock:
+            self._iterations = 0
+            self._window_start = time.perf_counter()
+
+    @staticmethod
+    def _stats(samples, scale: float = 1000.0, digits: int = 3) -> Dict[str, Optional[float]]:
+        values = sorted(samples)
+        if not values:
+            return {'count': 0, 'avg': None, 'p95': None, 'max': None, 'last': None}
+        return {
+            'count': len(values),
+            'avg': round(sum(values) / len(values) * scale, digits),
+            'p95': round(values[min(len(values) - 1, int(len(values) * 0.95))] * scale, digits),
+            'max': round(values[-1] * scale, digits),
+            'last': round(samples[-1] * scale, digits),
+        }
+
+    def get_summary(self) -> Dict:
+        """Aggregates of the recent samples (times in ms)"""
+        with self._lock:
+            errors = dict(self.errors)
+        return {
+            'load_ms': self._stats(list(self.load_durations)),
+            'transition_gap_ms': self._stats(list(self.transition_gaps)),
+            'monitor_iterations_per_sec': self._stats(list(self.monitor_rates), scale=1.0, digits=1),
+            'errors': errors,
+        }
+
+    def to_dict(self) -> Dict:
+        """Raw samples and the summary"""
+        with self._lock:
+            errors = dict(self.errors)
+        return {
+            'started_at': self._started,
+            'dumped_at': time.time(),
+            'capacity': self.capacity,
+            'load_seconds': list(self.load_durations),
+            'transition_gap_seconds': list(self.transition_gaps),
+            'monitor_iterations_per_sec': list(self.monitor_rates),
+            'errors': errors,
+            'summary': self.get_summary(),
+        }
+
+    def dump_json(self, path: str) -> bool:
+        """Write the raw samples to a JSON file, returns False on failure"""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2)
+            return True
+        except Exception as e:
+            logger.warning("⚠️ Telemetry dump failed (%s): %s", path, e)
+            return False
@@ -0,0 +1,77 @@
+"""
+Waveform Peaks - Following Single Responsibility Principle (SOLID)
+This module only turns a track into a small min/max peak overview.
+
+A track is decoded once (mono, 8 kHz is plenty for an overview) and reduced with
+NumPy to at most WAVEFORM_BUCKETS (min, max) pairs, normalised to the loudest
+sample. Peaks are stored as interleaved int8 bytes - 2 KB per track - so they can
+be cached in the music library and drawn without decoding anything.
+"""
+from array import array
+from typing import List, Optional, Tuple
+
+from .loudness import NUMPY_AVAILABLE, np, open_pcm
+
+WAVEFORM_BUCKETS = 1024
+WAVEFORM_RATE = 8000
+_BLOCK_FRAMES = 64  # Frames reduced per block while decoding (8 ms at 8 kHz)
+
+Peaks = Tuple[List[float], List[float]]
+
+
+def compute_waveform(path: str, buckets: int = WAVEFORM_BUCKETS) -> Optional[bytes]:
+    """Decode a file and return its encoded peaks, or None (runs in a worker process)"""
+    if not NUMPY_AVAILABLE:
+        return None
+    opened = open_pcm(path, rate=WAVEFORM_RATE, channels=1)
+    if opened is None:
+        return None
+    stream, _, channels = opened
+
+    block_bytes = _BLOCK_FRAMES * channels * 2
+    block_mins, block_maxs = [], []
+    try:
+        pending = b""
+        while True:
+            data = stream.read(block_bytes * 256)
+            if not data:
+                break
+            data = pending + data
+            usable = len(data) - len(data) % block_bytes
+            pending = data[usable:]
+            if not usable:
+                continue
+            samples = np.frombuffer(data[:usable], dtype=np.int16).reshape(-1, channels)
+            blocks = samples.mean(axis=1).reshape(-1, _BLOCK_FRAMES)
+            block_mins.append(blocks.min(axis=1))
+            block_maxs.append(blocks.max(axis=1))
+    finally:
+        stream.close()
+
+    if not block_mins:
+        return None
+    mins = np.concatenate(block_mins)
+    maxs = np.concatenate(block_maxs)
+
+    if len(mins) > buckets:
+        edges = np.linspace(0, len(mins), buckets + 1).astype(np.int64)[:-1]
+        mins = np.minimum.reduceat(mins, edges)
+        maxs = np.maximum.reduceat(maxs, edges)
+
+    scale = max(float(np.abs(mins).max()), float(np.abs(maxs).max()), 1.0)
+    return encode_peaks(mins / scale, maxs / scale)
+
+
+def encode_peaks(mins, maxs) -> bytes:
+    """Interleave (min, max) values in [-1, 1] as int8 bytes"""
+    pairs = np.stack([mins, maxs], axis=1) * 127
+    return np.clip(np.round(pairs), -127, 127).astype(np.int8).tobytes()
+
+
+def decode_peaks(blob: Optional[bytes]) -> Optional[Peaks]:
+    """(mins, maxs) lists in [-1, 1] from encoded peaks - no NumPy needed on the UI side"""
+    if not blob:
+        return None
+    values = array('b')
+    values.frombytes(bytes(blob))
+    return [v / 127 for v in values[0::2]], [v / 127 for v in values[1::2]]
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+from typing import Optional, Protocol
+import time
+
+
+class Clock(Protocol):
+    """Source of wall-clock and monotonic time - lets sessions run on simulated time"""
+    def now(self) -> datetime:
+        ...
+
+    def monotonic(self) -> float:
+        ...
+
+
+class SystemClock:
+    """Real time"""
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+
+class SimulatedClock:
+    """Time that only moves when advanced - a 6-hour session can run in milliseconds"""
+    def __init__(self, start: Optional[datetime] = None):
+        self._start = start or datetime(2024, 1, 1, 9, 0, 0)
+        self._elapsed = 0.0
+
+    def now(self) -> datetime:
+        return self._start + timedelta(seconds=self._elapsed)
+
+    def monotonic(self) -> float:
+        return self._elapsed
+
+    def advance(self, seconds: float) -> None:
+        if seconds < 0:
+            raise ValueError("SimulatedClock can't go backwards")
+        self._elapsed += seconds
+
+
+SYSTEM_CLOCK = SystemClock()
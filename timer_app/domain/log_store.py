@@ -0,0 +1,98 @@
+"""
+Log Store - Following Single Responsibility Principle (SOLID)
+This module only keeps a session's activity log within a fixed memory budget.
+
+SessionLog holds the most recent `capacity` entries in a ring buffer. Older
+entries are handed to a LogSpill (an append-only file in practice, see
+infrastructure/log_spill.py) and stay readable through paging and iteration.
+Until a spill is attached - a new session that hasn't been saved yet - evicted
+entries wait in memory and are written out on attach.
+"""
+import itertools
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Protocol
+
+LogEntry = List[str]  # ["MM:SS ; HH:MM:SS", "Action description"]
+
+DEFAULT_LOG_CAPACITY = 500
+
+
+class LogSpill(Protocol):
+    """Append-only storage for entries evicted from memory - ISP"""
+    def __len__(self) -> int:
+        ...
+
+    def append_many(self, entries: List[LogEntry]) -> None:
+        ...
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> Iterator[LogEntry]:
+        ...
+
+
+class SessionLog:
+    """Bounded in-memory session log with the full history one spill away"""
+    def __init__(self, entries: Iterable[LogEntry] = (), capacity: int = DEFAULT_LOG_CAPACITY,
+                 spill: Optional[LogSpill] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.spill = spill
+        self._recent: deque = deque()
+        self._pending: List[LogEntry] = []  # Evicted before a spill was attached
+        for entry in entries:
+            self.append(entry)
+
+    @property
+    def spilled(self) -> int:
+        """Entries no longer held in memory (written or waiting to be written)"""
+        return (len(self.spill) if self.spill is not None else 0) + len(self._pending)
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._recent)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        """Full history, oldest first - spilled entries are read lazily"""
+        if self.spill is not None:
+            yield from self.spill.read()
+        yield from list(self._pending)
+        yield from list(self._recent)
+
+    def append(self, entry: LogEntry) -> None:
+        self._recent.append(entry)
+        if len(self._recent) > self.capacity:
+            evicted = self._recent.popleft()
+            if self.spill is not None:
+                self.spill.append_many([evicted])
+            else:
+                self._pending.append(evicted)
+
+    def attach_spill(self, spill: LogSpill) -> None:
+        """Start spilling to `spill`, writing out anything evicted so far"""
+        self.spill = spill
+        if self._pending:
+            spill.append_many(self._pending)
+            self._pending = []
+
+    def recent(self, limit: Optional[int] = None) -> List[LogEntry]:
+        """In-memory entries, oldest first (the last `limit` of them if given)"""
+        if limit is None or limit >= len(self._recent):
+            return list(self._recent)
+        return list(itertools.islice(self._recent, len(self._recent) - limit, None))
+
+    def page(self, offset: int, limit: int) -> List[LogEntry]:
+        """Entries [offset, offset + limit) of the full history"""
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+        stop = min(offset + limit, len(self))
+        if offset >= stop:
+            return []
+        entries: List[LogEntry] = []
+        on_disk = len(self.spill) if self.spill is not None else 0
+        if offset < on_disk:
+            entries.extend(self.spill.read(offset, min(stop, on_disk)))
+        in_memory = self._pending + list(self._recent)
+        entries.extend(in_memory[max(0, offset - on_disk):stop - on_disk])
+        return entries
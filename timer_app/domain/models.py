@@ -1,5 +1,6 @@
 from enum import Enum
-from datetime import datetime
+from timer_app.domain.clock import Clock, SYSTEM_CLOCK
+from timer_app.domain.log_store import SessionLog
 
 class ProblemStage(Enum):
     """Enum representing different stages of problem solving"""
@@ -12,12 +13,13 @@ class ProblemStage(Enum):
 
 class Session:
     """Domain entity representing a coding session with 3-stage problem workflow"""
-    def __init__(self, total_problems: int):
+    def __init__(self, total_problems: int, clock: Clock = None):
         self.total_problems = total_problems
         self.problems_solved = 0
-        self._session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.clock = clock or SYSTEM_CLOCK  # Wall-clock source for the id and log timestamps
+        self._session_id = self.clock.now().strftime('%Y%m%d_%H%M%S')
         self._custom_session_name = None  # Custom user-defined session name
-        self.logs = []  # List of log entries: [["MM:SS ; HH:MM:SS", "Action description"], ...]
+        self.logs = SessionLog()  # Log entries: [["MM:SS ; HH:MM:SS", "Action description"], ...], recent ones in memory
         
         # 3-stage workflow tracking
         self.current_problem_stage = ProblemStage.NOT_STARTED
@@ -42,7 +44,7 @@ class Session:
     def add_log(self, stopwatch_time: int, description: str):
         """Add a log entry with current time and description"""
         stopwatch_formatted = f"{stopwatch_time // 60:02}:{stopwatch_time % 60:02}"
-        current_time = datetime.now().strftime('%H:%M:%S')
+        current_time = self.clock.now().strftime('%H:%M:%S')
         log_entry = [f"{stopwatch_formatted} ; {current_time}", description]
         self.logs.append(log_entry)
 
@@ -247,12 +249,12 @@ class Session:
 
 
 class Stopwatch:
-    """Separate concern for time tracking - SRP"""
+    """Separate concern for time tracking - SRP (advanced by a ticker on a real or simulated scheduler)"""
     def __init__(self):
         self.time = 0
 
-    def increment(self):
-        self.time += 1
+    def increment(self, seconds: int = 1):
+        self.time += seconds
 
     def reset(self):
         self.time = 0
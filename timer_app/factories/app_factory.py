@@ -1,18 +1,26 @@
 import tkinter as tk
+from timer_app.domain.clock import Clock
 from timer_app.domain.models import Session, Stopwatch
 from timer_app.application.services import SessionService
 from timer_app.infrastructure.storage import FileSessionStorage
+from timer_app.infrastructure.profiling import on_session_stopped
+from timer_app.infrastructure.app_logging import configure_logging
+from timer_app.infrastructure.metrics import start_exporters_from_env
 from timer_app.ui.views import TimerView
 
 class TimerApplicationFactory:
     """Factory for creating the timer application with proper dependency injection - DIP"""
     @staticmethod
-    def create_application() -> tuple[tk.Tk, TimerView]:
+    def create_application(clock: Clock = None) -> tuple[tk.Tk, TimerView]:
+        configure_logging()
+        start_exporters_from_env()  # TIMER_METRICS_PORT / TIMER_METRICS_JSON
+
         # Create dependencies
-        session = Session(total_problems=0)
+        session = Session(total_problems=0, clock=clock)
         stopwatch = Stopwatch()
         storage = FileSessionStorage()
         service = SessionService(session, stopwatch, storage)
+        service.add_stop_listener(on_session_stopped)  # Profiling report, if one is running
         
         # Create UI
         root = tk.Tk()
@@ -0,0 +1,131 @@
+"""
+Application Logging - Following Single Responsibility Principle (SOLID)
+This module only decides where log records from timer_app and dsa_solo_leveling go.
+
+Modules log through `logger = logging.getLogger(__name__)` with %-style arguments,
+so a message is only formatted if some handler actually wants it - a disabled
+DEBUG call costs one level check. configure_logging() attaches:
+  - a RingBufferHandler keeping the most recent records (shown from the menu)
+  - a console handler for warnings and errors, when a console exists (frozen
+    windowed builds have no stderr)
+  - optionally a rotating log file, written by a QueueListener thread so the Tk
+    and audio threads never wait on disk
+
+TIMER_LOG_LEVEL (DEBUG/INFO/WARNING/ERROR) and TIMER_LOG_FILE override the defaults.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from typing import List, Optional
+
+LOG_LEVEL_ENV_VAR = 'TIMER_LOG_LEVEL'
+LOG_FILE_ENV_VAR = 'TIMER_LOG_FILE'
+APP_LOGGERS = ('timer_app', 'dsa_solo_leveling')
+LOG_FORMAT = '%(asctime)s %(levelname)-7s %(name)s: %(message)s'
+
+_configured = False
+_ring_handler: Optional['RingBufferHandler'] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records; formats them only when they're read"""
+    def __init__(self, capacity: int = 2000):
+        super().__init__()
+        self._records = deque(maxlen=capacity)
+        self._lock_records = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        with self._lock_records:
+            self._records.append(record)
+
+    def get_lines(self, limit: Optional[int] = None, level: int = logging.NOTSET) -> List[str]:
+        with self._lock_records:
+            records = [record for record in self._records if record.levelno >= level]
+        if limit is not None:
+            records = records[-limit:]
+        return [self.format(record) for record in records]
+
+    def clear(self) -> None:
+        with self._lock_records:
+            self._records.clear()
+
+
+def _level_from_env(default: int) -> int:
+    name = os.environ.get(LOG_LEVEL_ENV_VAR, '').strip().upper()
+    level = logging.getLevelName(name) if name else default
+    return level if isinstance(level, int) else default
+
+
+def configure_logging(level: int = logging.INFO, log_file: Optional[str] = None,
+                      ring_capacity: int = 2000) -> None:
+    """Attach the app's handlers once; later calls are no-ops"""
+    global _configured, _ring_handler, _listener
+    if _configured:
+        return
+    _configured = True
+
+    level = _level_from_env(level)
+    log_file = os.environ.get(LOG_FILE_ENV_VAR) or log_file
+    formatter = logging.Formatter(LOG_FORMAT, datefmt='%H:%M:%S')
+
+    _ring_handler = RingBufferHandler(ring_capacity)
+    _ring_handler.setFormatter(formatter)
+    handlers: List[logging.Handler] = [_ring_handler]
+
+    if sys.stderr is not None:
+        console = logging.StreamHandler()
+        console.setLevel(logging.WARNING)
+        console.setFormatter(logging.Formatter('%(message)s'))
+        handlers.append(console)
+
+    if log_file:
+        try:
+            os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=2 * 1024 * 1024, backupCount=3, encoding='utf-8')
+            file_handler.setFormatter(formatter)
+            log_queue = queue.SimpleQueue()
+            _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+            handlers.append(logging.handlers.QueueHandler(log_queue))
+        except OSError as e:
+            _listener = None
+            print(f"⚠️ Log file unavailable ({log_file}): {e}")
+
+    # Records aren't needed for thread/process names in these apps; skip collecting them
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    for name in APP_LOGGERS:
+        app_logger = logging.getLogger(name)
+        app_logger.setLevel(level)
+        app_logger.propagate = False
+        for handler in handlers:
+            app_logger.addHandler(handler)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the file writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def set_log_level(level: int) -> None:
+    for name in APP_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+
+
+def get_recent_logs(limit: Optional[int] = None, level: int = logging.NOTSET) -> List[str]:
+    """Formatted recent records from the ring buffer (empty before configure_logging)"""
+    if _ring_handler is None:
+        return []
+    return _ring_handler.get_lines(limit, level)
@@ -0,0 +1,34 @@
+"""
+Lazy Imports - Following Single Responsibility Principle (SOLID)
+This module only defers loading heavy optional dependencies.
+
+lazy_import() finds a module without executing it and returns a module object that
+runs its code on first attribute access (importlib.util.LazyLoader). pygame, PIL,
+mutagen and friends are then loaded when the media player is first used instead
+of before the timer window appears.
+"""
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """Module that loads on first use, or None if it isn't installed"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None:
+        return None
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
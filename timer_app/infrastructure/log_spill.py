@@ -0,0 +1,60 @@
+"""
+Log Spill - Following Single Responsibility Principle (SOLID)
+This module only stores session log entries evicted from memory.
+
+Entries are appended one JSON array per line to session_<id>.logs.jsonl next to
+the session file. The session file records how many entries it has spilled, so
+lines written after the last save (a crash in between) are dropped on reopen
+rather than duplicated.
+"""
+import itertools
+import json
+import os
+from typing import Iterator, List, Optional
+
+from timer_app.domain.log_store import LogEntry
+
+
+class JsonlLogSpill:
+    """Append-only JSON-lines file of log entries"""
+    def __init__(self, path: str, expected_count: Optional[int] = None):
+        self.path = path
+        self._count = self._count_lines()
+        if expected_count is not None and self._count != expected_count:
+            self._truncate(expected_count)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append_many(self, entries: List[LogEntry]) -> None:
+        if not entries:
+            return
+        lines = ''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries)
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write(lines)
+        self._count += len(entries)
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> Iterator[LogEntry]:
+        """Entries [start, stop), oldest first"""
+        if self._count == 0:
+            return
+        stop = self._count if stop is None else min(stop, self._count)
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line in itertools.islice(file, start, stop):
+                yield json.loads(line)
+
+    def _count_lines(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, 'rb') as file:
+            return sum(1 for _ in file)
+
+    def _truncate(self, count: int) -> None:
+        # More lines than the session knows about: keep its view of the history
+        with open(self.path, 'r', encoding='utf-8') as file:
+            kept = list(itertools.islice(file, count))
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.writelines(kept)
+        os.replace(temp_path, self.path)
+        self._count = len(kept)
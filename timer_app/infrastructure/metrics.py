@@ -0,0 +1,341 @@
+"""
+Metrics - Following Single Responsibility Principle (SOLID)
+This module only counts and times things for charting long-running sessions.
+
+A process-wide MetricsRegistry holds counters, gauges and fixed-bucket
+histograms (optionally labelled). Recording is a lock and an addition, cheap
+enough to leave on permanently. Two optional exporters read the registry:
+  - a localhost HTTP endpoint serving Prometheus text (/metrics) and JSON
+    (/metrics.json), enabled with TIMER_METRICS_PORT
+  - a JSON snapshot file rewritten periodically, enabled with TIMER_METRICS_JSON
+"""
+import atexit
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+METRICS_PORT_ENV_VAR = 'TIMER_METRICS_PORT'
+METRICS_JSON_ENV_VAR = 'TIMER_METRICS_JSON'
+
+# Seconds - from sub-millisecond mixer calls to multi-second saves of huge sessions
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value"""
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str):
+        super().__init__(name, help_text)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return super().render() + [f"{self.name}{_format_labels(key)} {value:g}" for key, value in values.items()]
+
+    def to_dict(self):
+        with self._lock:
+            return {_format_labels(key) or '': value for key, value in self._values.items()}
+
+
+class Gauge(_Metric):
+    """Value that goes up and down; can be computed on read"""
+    kind = 'gauge'
+
+    def __init__(self, name: str, help_text: str, func: Optional[Callable[[], Optional[float]]] = None):
+        super().__init__(name, help_text)
+        self._values: Dict[LabelKey, float] = {}
+        self._func = func
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def get(self, **labels) -> Optional[float]:
+        if self._func is not None:
+            return self._func()
+        with self._lock:
+            return self._values.get(_label_key(labels))
+
+    def _current(self) -> Dict[LabelKey, float]:
+        if self._func is not None:
+            value = self._func()
+            return {} if value is None else {(): value}
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        return super().render() + [f"{self.name}{_format_labels(key)} {value:g}" for key, value in self._current().items()]
+
+    def to_dict(self):
+        return {_format_labels(key) or '': value for key, value in self._current().items()}
+
+
+class Histogram(_Metric):
+    """Observations counted into fixed upper-bound buckets (plus sum and count)"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, list] = {}  # key -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def time(self, **labels) -> '_Timer':
+        """Context manager observing the elapsed seconds"""
+        return _Timer(self, labels)
+
+    def get_count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(_label_key(labels))
+            return sum(series[:-1]) if series else 0
+
+    def _snapshot(self) -> Dict[LabelKey, list]:
+        with self._lock:
+            return {key: list(series) for key, series in self._series.items()}
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for key, series in self._snapshot().items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(key, [('le', f'{bound:g}')])} {cumulative}")
+            total = sum(series[:-1])
+            lines.append(f"{self.name}_bucket{_format_labels(key, [('le', '+Inf')])} {total}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {series[-1]:g}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {total}")
+        return lines
+
+    def to_dict(self):
+        result = {}
+        for key, series in self._snapshot().items():
+            count = sum(series[:-1])
+            result[_format_labels(key) or ''] = {
+                'count': count,
+                'sum': series[-1],
+                'avg': series[-1] / count if count else None,
+                'buckets': {f'{bound:g}': n for bound, n in zip(self.buckets, series)} | {'+Inf': series[-2]},
+            }
+        return result
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict):
+        self._histogram = histogram
+        self._labels = labels
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+        return False
+
+
+class MetricsRegistry:
+    """Named metrics; asking for an existing name returns the same metric"""
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._get_or_create(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str, func: Optional[Callable[[], Optional[float]]] = None) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, func)
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, buckets)
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            'timestamp': time.time(),
+            'metrics': {metric.name: {'type': metric.kind, 'values': metric.to_dict()} for metric in metrics},
+        }
+
+
+def _process_memory_bytes() -> Optional[float]:
+    """Resident memory of this process, where it can be read cheaply"""
+    if PSUTIL_AVAILABLE:
+        return float(psutil.Process().memory_info().rss)
+    try:
+        with open('/proc/self/statm') as f:
+            return float(int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE'))
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+_process_start = time.time()
+
+REGISTRY = MetricsRegistry()
+REGISTRY.gauge('timer_process_resident_memory_bytes', "Resident memory of the timer process", _process_memory_bytes)
+REGISTRY.gauge('timer_process_uptime_seconds', "Seconds since the timer started", lambda: time.time() - _process_start)
+
+
+def get_registry() -> MetricsRegistry:
+    return REGISTRY
+
+
+# Exporters
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path in ('/metrics', '/'):
+            body = self.registry.render_prometheus().encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        elif self.path == '/metrics.json':
+            body = json.dumps(self.registry.to_dict()).encode('utf-8')
+            content_type = 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics endpoint: " + format, *args)
+
+
+def start_http_server(port: int, host: str = '127.0.0.1',
+                      registry: MetricsRegistry = REGISTRY) -> Optional[ThreadingHTTPServer]:
+    """Serve the registry on localhost from a daemon thread; None if the port is taken"""
+    handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry})
+    try:
+        server = ThreadingHTTPServer((host, port), handler)
+    except OSError as e:
+        logger.warning("⚠️ Metrics endpoint unavailable on %s:%s: %s", host, port, e)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info("📈 Metrics served at http://%s:%s/metrics", host, server.server_port)
+    return server
+
+
+class JsonSnapshotWriter:
+    """Rewrites a JSON snapshot of the registry every `interval` seconds"""
+    def __init__(self, path: str, interval: float = 60.0, registry: MetricsRegistry = REGISTRY):
+        self.path = path
+        self.interval = interval
+        self._registry = registry
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="metrics-json", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.write()
+
+    def write(self) -> None:
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump(self._registry.to_dict(), f, indent=2)
+            os.replace(temp_path, self.path)  # Readers never see a half-written file
+        except OSError as e:
+            logger.warning("⚠️ Metrics snapshot failed (%s): %s", self.path, e)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.write()
+
+
+def start_exporters_from_env() -> None:
+    """Start the endpoint / snapshot writer requested through the environment"""
+    port = os.environ.get(METRICS_PORT_ENV_VAR)
+    if port:
+        try:
+            start_http_server(int(port))
+        except ValueError:
+            logger.warning("⚠️ %s must be a port number, got %r", METRICS_PORT_ENV_VAR, port)
+    json_path = os.environ.get(METRICS_JSON_ENV_VAR)
+    if json_path:
+        writer = JsonSnapshotWriter(json_path)
+        writer.start()
+        atexit.register(writer.stop)  # Final totals, not the last periodic snapshot
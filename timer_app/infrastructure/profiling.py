@@ -0,0 +1,223 @@
+"""
+Profiling - Following Single Responsibility Principle (SOLID)
+This module only measures where the timer spends its time and memory.
+
+A TkProfiler records, while active:
+  - cProfile of everything the Tk main thread runs (callbacks, redraws, saves)
+  - tracemalloc top allocators, snapshotted periodically
+  - event-loop lag: how late a fixed-interval root.after() heartbeat fires
+
+and writes a text report plus the raw .prof file into profiles/. It can be
+toggled from the menu, or enabled for a whole run with TIMER_PROFILE=1, in
+which case run_mainloop() wraps root.mainloop() in it. TIMER_WATCHDOG=1 likewise
+runs the stall watchdog for the whole run and writes its report on exit.
+"""
+import logging
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+
+from .watchdog import EventLoopWatchdog, watchdog_requested
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = 'TIMER_PROFILE'
+PROFILE_DIR = 'profiles'
+
+
+class TkProfiler:
+    """cProfile + tracemalloc + event-loop lag for a Tk application"""
+    def __init__(self, root, output_dir: str = PROFILE_DIR, lag_interval_ms: int = 100,
+                 snapshot_interval_s: float = 30.0, top_allocators: int = 15, lag_samples: int = 4096):
+        self._root = root
+        self._output_dir = output_dir
+        self._lag_interval_ms = lag_interval_ms
+        self._snapshot_interval_ms = int(snapshot_interval_s * 1000)
+        self._top_allocators = top_allocators
+
+        self._profile: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        self._lag_ms = deque(maxlen=lag_samples)
+        self._snapshots: List[tuple] = []  # (elapsed seconds, top allocator lines)
+        self._first_snapshot = None
+        self._last_snapshot = None
+        self._heartbeat_job = None
+        self._snapshot_job = None
+        self._expected = 0.0
+        self._started_at = 0.0
+        self._started_wall = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._profile is not None
+
+    def start(self) -> None:
+        if self.is_active:
+            return
+        self._lag_ms.clear()
+        self._snapshots = []
+        self._started_at = time.perf_counter()
+        self._started_wall = datetime.now()
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)  # One frame is enough for per-line statistics and keeps snapshots cheap
+            self._started_tracemalloc = True
+        self._first_snapshot = tracemalloc.take_snapshot()
+        self._last_snapshot = self._first_snapshot
+
+        self._expected = time.perf_counter() + self._lag_interval_ms / 1000
+        self._heartbeat_job = self._root.after(self._lag_interval_ms, self._heartbeat)
+        self._snapshot_job = self._root.after(self._snapshot_interval_ms, self._take_snapshot)
+
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        logger.info("⏱️ Profiling started")
+
+    def stop(self) -> Optional[str]:
+        """Stop profiling and write the report; returns its path"""
+        if not self.is_active:
+            return None
+        self._profile.disable()
+        for job in (self._heartbeat_job, self._snapshot_job):
+            if job is not None:
+                try:
+                    self._root.after_cancel(job)
+                except Exception:
+                    pass  # Window already destroyed
+        self._heartbeat_job = self._snapshot_job = None
+
+        self._take_snapshot(reschedule=False)
+        report_path = self._write_report()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._profile = None
+        logger.info("⏱️ Profiling stopped - report written to %s", report_path)
+        return report_path
+
+    def toggle(self) -> bool:
+        """Start or stop; returns True if profiling is now active"""
+        if self.is_active:
+            self.stop()
+        else:
+            self.start()
+        return self.is_active
+
+    # Sampling (runs on the Tk thread)
+
+    def _heartbeat(self) -> None:
+        now = time.perf_counter()
+        self._lag_ms.append(max(0.0, (now - self._expected) * 1000))
+        self._expected = now + self._lag_interval_ms / 1000
+        self._heartbeat_job = self._root.after(self._lag_interval_ms, self._heartbeat)
+
+    def _take_snapshot(self, reschedule: bool = True) -> None:
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            top = [str(stat) for stat in self._top(snapshot.statistics('lineno'))]
+            self._snapshots.append((round(time.perf_counter() - self._started_at, 1), top))
+            self._last_snapshot = snapshot
+        if reschedule:
+            self._snapshot_job = self._root.after(self._snapshot_interval_ms, self._take_snapshot)
+
+    def _top(self, statistics: list) -> list:
+        """Largest entries, leaving out tracemalloc's and the import system's own allocations"""
+        # Filtering aggregated statistics is far cheaper than Snapshot.filter_traces on every trace
+        own = (tracemalloc.__file__, '<frozen importlib._bootstrap')
+        return [stat for stat in statistics
+                if not stat.traceback[0].filename.startswith(own)][:self._top_allocators]
+
+    # Reporting
+
+    def get_lag_summary(self) -> dict:
+        samples = sorted(self._lag_ms)
+        if not samples:
+            return {'samples': 0}
+        return {
+            'samples': len(samples),
+            'p50_ms': round(samples[len(samples) // 2], 2),
+            'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 2),
+            'max_ms': round(samples[-1], 2),
+            'over_100ms': sum(1 for lag in samples if lag > 100),
+        }
+
+    def _write_report(self) -> str:
+        os.makedirs(self._output_dir, exist_ok=True)
+        stamp = self._started_wall.strftime('%Y%m%d_%H%M%S')
+        base = os.path.join(self._output_dir, f'profile_{stamp}')
+        self._profile.dump_stats(f'{base}.prof')
+
+        lines = [f"Timer profile {stamp} - {time.perf_counter() - self._started_at:.1f}s", ""]
+
+        lag = self.get_lag_summary()
+        lines.append(f"== Tk event-loop lag (heartbeat every {self._lag_interval_ms} ms) ==")
+        lines.extend(f"{key}: {value}" for key, value in lag.items())
+        lines.append("")
+
+        lines.append("== Memory growth since start (top allocators) ==")
+        if self._first_snapshot is not None and self._last_snapshot is not None:
+            growth = self._last_snapshot.compare_to(self._first_snapshot, 'lineno')
+            lines.extend(str(stat) for stat in self._top(growth))
+        lines.append("")
+        for elapsed, top in self._snapshots:
+            lines.append(f"== Top allocators at +{elapsed}s ==")
+            lines.extend(top)
+            lines.append("")
+
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats('cumulative').print_stats(40)
+        stats.sort_stats('tottime').print_stats(20)
+        lines.append("== cProfile (Tk main thread) ==")
+        lines.append(stream.getvalue())
+
+        report_path = f'{base}.txt'
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+        return report_path
+
+
+_profiler: Optional[TkProfiler] = None
+
+
+def get_profiler(root=None) -> Optional[TkProfiler]:
+    """The application's profiler (created on first call with a root)"""
+    global _profiler
+    if _profiler is None and root is not None:
+        _profiler = TkProfiler(root)
+    return _profiler
+
+
+def on_session_stopped() -> None:
+    """Write the report when the session stops, if profiling is running"""
+    if _profiler is not None and _profiler.is_active:
+        _profiler.stop()
+
+
+def profiling_requested() -> bool:
+    return os.environ.get(PROFILE_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def run_mainloop(root) -> None:
+    """root.mainloop(), profiled when TIMER_PROFILE is set and watched when TIMER_WATCHDOG is set"""
+    profiler = get_profiler(root) if profiling_requested() else None
+    watchdog = EventLoopWatchdog(root) if watchdog_requested() else None
+    if profiler:
+        profiler.start()
+    if watchdog:
+        watchdog.start()
+    try:
+        root.mainloop()
+    finally:
+        if watchdog:
+            watchdog.stop()
+            report_path = os.path.join(PROFILE_DIR, f"stalls_{datetime.now():%Y%m%d_%H%M%S}.txt")
+            logger.info("🐕 Stall report written to %s", watchdog.write_report(report_path))
+        if profiler and profiler.is_active:
+            profiler.stop()
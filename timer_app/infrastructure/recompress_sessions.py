@@ -0,0 +1,90 @@
+"""
+Recompress Sessions - one-shot rewrite of the sessions/ directory into another format.
+
+Every session_<id>.json is decoded (whatever format it is in), re-encoded in the
+target format (upgraded to the current schema on the way, see session_schema)
+and replaced atomically with its modification time preserved. The
+command reports the size before and after for each file and in total.
+
+Usage:
+    python -m timer_app.infrastructure.recompress_sessions --format zlib [--dir sessions] [--dry-run]
+"""
+import argparse
+import os
+import sys
+from typing import Dict, List
+
+from timer_app.infrastructure import session_codec
+from timer_app.infrastructure.session_schema import migrate
+from timer_app.infrastructure.storage import FileSessionStorage
+
+
+def recompress_directory(directory: str, session_format: str, dry_run: bool = False) -> Dict[str, object]:
+    """Rewrite every session file in `directory` in `session_format`; returns the size report"""
+    files: List[dict] = []
+    for filename in sorted(os.listdir(directory)):
+        if not (filename.startswith('session_') and filename.endswith('.json')):
+            continue
+        path = os.path.join(directory, filename)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        entry = {'file': filename, 'from': session_codec.detect_format(raw), 'before': len(raw)}
+        try:
+            data, _ = migrate(session_codec.decode(raw), filename[8:-5])
+            payload = session_codec.encode(data, session_format)
+        except (ValueError, OSError, EOFError) as e:  # JSONDecodeError is a ValueError, as are lzma/zlib errors
+            entry.update(after=len(raw), error=str(e))
+            files.append(entry)
+            continue
+        entry['after'] = len(payload)
+
+        if not dry_run and payload != raw:
+            stat = os.stat(path)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # Keep session ordering by date
+        files.append(entry)
+
+    before = sum(entry['before'] for entry in files)
+    after = sum(entry['after'] for entry in files)
+    return {
+        'directory': directory,
+        'format': session_format,
+        'dry_run': dry_run,
+        'files': files,
+        'bytes_before': before,
+        'bytes_after': after,
+        'saved_percent': round((1 - after / before) * 100, 1) if before else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rewrite session files in another on-disk format")
+    parser.add_argument('--format', choices=session_codec.SESSION_FORMATS, default='zlib',
+                        help="Target format (default: zlib)")
+    parser.add_argument('--dir', default=FileSessionStorage.SESSION_DIR, help="Sessions directory")
+    parser.add_argument('--dry-run', action='store_true', help="Report the savings without rewriting files")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.dir):
+        print(f"❌ Sessions directory not found: {args.dir}")
+        sys.exit(1)
+
+    report = recompress_directory(args.dir, args.format, args.dry_run)
+    for entry in report['files']:
+        if 'error' in entry:
+            print(f"⚠️ {entry['file']}: skipped ({entry['error']})")
+        else:
+            print(f"  {entry['file']:<50} {entry['from']:>7} → {args.format:<7} "
+                  f"{entry['before']:>10,} → {entry['after']:>10,} bytes")
+    saved = report['saved_percent']
+    change = f"{'would save' if args.dry_run else 'saved'} {saved}%" if saved >= 0 else \
+        f"{'would grow' if args.dry_run else 'grew'} {-saved}%"
+    print(f"📦 {len(report['files'])} session files: {report['bytes_before']:,} → {report['bytes_after']:,} bytes "
+          f"({change})")
+
+
+if __name__ == '__main__':
+    main()
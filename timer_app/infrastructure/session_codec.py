@@ -0,0 +1,56 @@
+"""
+Session Codec - Following Single Responsibility Principle (SOLID)
+This module only turns session dicts into file bytes and back.
+
+Formats:
+  json     indent=2 JSON (the original, human-readable format)
+  compact  minified JSON
+  zlib     minified JSON, zlib-compressed
+  lzma     minified JSON, xz-compressed (smallest, slowest to write)
+
+Every format keeps the session_<id>.json file name. decode() recognises the
+format from the first bytes (xz magic, a zlib header, or plain JSON), so old
+and new files load side by side.
+"""
+import json
+import lzma
+import zlib
+from typing import Any, Dict
+
+SESSION_FORMATS = ('json', 'compact', 'zlib', 'lzma')
+DEFAULT_FORMAT = 'json'
+
+_XZ_MAGIC = b'\xfd7zXZ\x00'
+_COMPACT_SEPARATORS = (',', ':')
+
+
+def detect_format(raw: bytes) -> str:
+    """'lzma', 'zlib' or 'json' (plain JSON, pretty or compact)"""
+    if raw.startswith(_XZ_MAGIC):
+        return 'lzma'
+    # zlib header: CMF 0x78 (deflate, 32K window) and a header checksum divisible by 31
+    if len(raw) >= 2 and raw[0] == 0x78 and (raw[0] << 8 | raw[1]) % 31 == 0:
+        return 'zlib'
+    return 'json'
+
+
+def encode(data: Dict[str, Any], session_format: str = DEFAULT_FORMAT) -> bytes:
+    if session_format == 'json':
+        return json.dumps(data, indent=2).encode('utf-8')
+    compact = json.dumps(data, separators=_COMPACT_SEPARATORS).encode('utf-8')
+    if session_format == 'compact':
+        return compact
+    if session_format == 'zlib':
+        return zlib.compress(compact, 6)
+    if session_format == 'lzma':
+        return lzma.compress(compact, preset=6)
+    raise ValueError(f"Unknown session format '{session_format}' (expected one of {', '.join(SESSION_FORMATS)})")
+
+
+def decode(raw: bytes) -> Dict[str, Any]:
+    session_format = detect_format(raw)
+    if session_format == 'lzma':
+        raw = lzma.decompress(raw)
+    elif session_format == 'zlib':
+        raw = zlib.decompress(raw)
+    return json.loads(raw)
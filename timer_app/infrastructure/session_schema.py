@@ -0,0 +1,96 @@
+"""
+Session Schema - Following Single Responsibility Principle (SOLID)
+This module only knows the layout of session files and how to upgrade old ones.
+
+Files carry a 'schema_version'. Files without one are version 1 (every layout
+written before versioning). migrate() runs the registered steps in order until a
+document reaches CURRENT_SCHEMA_VERSION; FileSessionStorage rewrites migrated
+files once, so current files load with no compatibility work.
+
+Version 2:
+  - all fields always present (session_id, custom_session_name, logs, stages)
+  - problem_stages stored as [[problem_number, data], ...] so problem numbers
+    stay ints (JSON object keys would turn them into strings)
+  - every problem has stage_notes for all three stages
+
+Version 3:
+  - 'logs' holds only the entries kept in memory; the 'logs_spilled' older ones
+    are in session_<session_id>.logs.jsonl (see infrastructure/log_spill.py)
+"""
+from typing import Any, Callable, Dict, List, Tuple
+
+from timer_app.domain.models import ProblemStage
+
+CURRENT_SCHEMA_VERSION = 3
+REQUIRED_FIELDS = ('total_problems', 'problems_solved', 'stopwatch_time')
+
+Document = Dict[str, Any]
+
+
+def problem_stages_to_pairs(problem_stages: Dict[int, dict]) -> List[list]:
+    return [[problem_num, data] for problem_num, data in problem_stages.items()]
+
+
+def pairs_to_problem_stages(pairs: List[list]) -> Dict[int, dict]:
+    return {problem_num: data for problem_num, data in pairs}
+
+
+def _empty_stage_notes() -> Dict[str, str]:
+    return {
+        ProblemStage.SELF_DOING.name: "",
+        ProblemStage.SEEING_SOLUTION.name: "",
+        ProblemStage.MAKING_NOTE.name: ""
+    }
+
+
+def _migrate_v1_to_v2(data: Document, session_id: str) -> Document:
+    """Fill in everything older files may lack and make problem numbers ints"""
+    for field in REQUIRED_FIELDS:
+        if field not in data:
+            raise ValueError(f"Invalid session file: missing field '{field}'")
+
+    data.setdefault('session_id', session_id)  # Older files only had it in the file name
+    data['custom_session_name'] = data.get('custom_session_name') or None
+    data.setdefault('logs', [])
+    data.setdefault('current_problem_stage', ProblemStage.NOT_STARTED.value)
+    if 'current_problem_number' not in data:
+        solved, total = data['problems_solved'], data['total_problems']
+        data['current_problem_number'] = solved + 1 if solved < total else total
+
+    problem_stages = []
+    for problem_num, problem_data in data.get('problem_stages', {}).items():
+        problem_data.setdefault('stage_notes', _empty_stage_notes())
+        problem_stages.append([int(problem_num), problem_data])
+    data['problem_stages'] = problem_stages
+    return data
+
+
+def _migrate_v2_to_v3(data: Document, session_id: str) -> Document:
+    """Every entry of a v2 file is in 'logs'"""
+    data['logs_spilled'] = 0
+    return data
+
+
+# from_version -> step producing from_version + 1
+MIGRATIONS: Dict[int, Callable[[Document, str], Document]] = {
+    1: _migrate_v1_to_v2,
+    2: _migrate_v2_to_v3,
+}
+
+
+def schema_version(data: Document) -> int:
+    return data.get('schema_version', 1)
+
+
+def migrate(data: Document, session_id: str) -> Tuple[Document, bool]:
+    """Upgrade a document to the current version; returns (document, whether it changed)"""
+    version = schema_version(data)
+    if version > CURRENT_SCHEMA_VERSION:
+        raise ValueError(f"Session file uses schema version {version}; "
+                         f"this version of the timer reads up to {CURRENT_SCHEMA_VERSION}")
+    migrated = version != CURRENT_SCHEMA_VERSION
+    while version < CURRENT_SCHEMA_VERSION:
+        data = MIGRATIONS[version](data, session_id)
+        version += 1
+        data['schema_version'] = version
+    return data, migrated
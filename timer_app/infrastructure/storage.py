@@ -1,32 +1,89 @@
-import os
 import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Sequence
+from timer_app.domain.log_store import SessionLog
 from timer_app.domain.models import Session, Stopwatch, ProblemStage
 from timer_app.application.interfaces import SessionStorageInterface
+from timer_app.infrastructure.metrics import REGISTRY
+from timer_app.infrastructure import session_codec
+from timer_app.infrastructure.log_spill import JsonlLogSpill
+from timer_app.infrastructure.session_schema import (
+    CURRENT_SCHEMA_VERSION, migrate, pairs_to_problem_stages, problem_stages_to_pairs
+)
+
+logger = logging.getLogger(__name__)
+
+SESSION_FORMAT_ENV_VAR = 'TIMER_SESSION_FORMAT'
+
+# Written before 'logs' and 'problem_stages', so they can be read without parsing either
+HEADER_FIELDS = ('schema_version', 'session_id', 'custom_session_name', 'total_problems', 'problems_solved',
+                 'stopwatch_time', 'current_problem_stage', 'current_problem_number', 'logs_spilled')
+_BODY_MARKERS = (b'"logs":', b'"problem_stages":')
+_HEADER_CHUNK = 4096
+
+_SAVE_SECONDS = REGISTRY.histogram('timer_session_save_seconds', "Time to write a session file")
+_LOAD_SECONDS = REGISTRY.histogram('timer_session_load_seconds', "Time to read a session file")
+_SAVES = REGISTRY.counter('timer_session_saves_total', "Session files written")
+_BYTES_WRITTEN = REGISTRY.counter('timer_session_bytes_written_total', "Bytes written to session files")
+_SESSION_BYTES = REGISTRY.gauge('timer_session_file_bytes', "Size of the last session file written")
 
 class FileSessionStorage(SessionStorageInterface):
     """Concrete implementation of session storage - SRP"""
     SESSION_DIR = 'sessions'
 
-    def __init__(self):
+    def __init__(self, session_format: str = None):
+        # 'json' (default), 'compact', 'zlib' or 'lzma' - see session_codec; loading accepts them all
+        self.session_format = session_format or os.environ.get(SESSION_FORMAT_ENV_VAR) or session_codec.DEFAULT_FORMAT
+        if self.session_format not in session_codec.SESSION_FORMATS:
+            raise ValueError(f"Unknown session format '{self.session_format}'")
         if not os.path.exists(self.SESSION_DIR):
             os.makedirs(self.SESSION_DIR)
 
     def save_session(self, session: Session, stopwatch: Stopwatch) -> None:
+        started = time.perf_counter()
         # Use custom session name if available, otherwise use timestamp ID
         session_filename = session.session_id if session._custom_session_name else session._session_id
         file_path = os.path.join(self.SESSION_DIR, f'session_{session_filename}.json')
-        with open(file_path, 'w') as file:
-            json.dump({
-                'session_id': session._session_id,  # Keep original timestamp ID
-                'custom_session_name': session._custom_session_name,  # Save custom name
-                'total_problems': session.total_problems,
-                'problems_solved': session.problems_solved,
-                'stopwatch_time': stopwatch.time,
-                'logs': session.logs,
-                'current_problem_stage': session.current_problem_stage.value,
-                'current_problem_number': session.current_problem_number,
-                'problem_stages': session.problem_stages
-            }, file, indent=2)
+        if session.logs.spill is None:
+            session.logs.attach_spill(JsonlLogSpill(self._spill_path(session._session_id), 0))
+        size = self._write(file_path, self._to_document(session, stopwatch))
+        _SAVE_SECONDS.observe(time.perf_counter() - started)
+        _SAVES.inc()
+        _BYTES_WRITTEN.inc(size)
+        _SESSION_BYTES.set(size)
+
+    def _spill_path(self, session_id: str) -> str:
+        # Keyed by the timestamp id, so renaming a session keeps its log history
+        return os.path.join(self.SESSION_DIR, f'session_{session_id}.logs.jsonl')
+
+    @staticmethod
+    def _to_document(session: Session, stopwatch: Stopwatch) -> dict:
+        """Current-schema file contents - HEADER_FIELDS first, then the bulky logs and stages"""
+        return {
+            'schema_version': CURRENT_SCHEMA_VERSION,
+            'session_id': session._session_id,  # Keep original timestamp ID
+            'custom_session_name': session._custom_session_name,  # Save custom name
+            'total_problems': session.total_problems,
+            'problems_solved': session.problems_solved,
+            'stopwatch_time': stopwatch.time,
+            'current_problem_stage': session.current_problem_stage.value,
+            'current_problem_number': session.current_problem_number,
+            'logs_spilled': session.logs.spilled,
+            'logs': session.logs.recent(),
+            'problem_stages': problem_stages_to_pairs(session.problem_stages)
+        }
+
+    def _write(self, file_path: str, document: dict) -> int:
+        payload = session_codec.encode(document, self.session_format)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(payload)
+        os.replace(temp_path, file_path)  # A crash mid-write never leaves a half-written session
+        return len(payload)
 
     def list_sessions(self) -> list[str]:
         """List all available session names (custom names or IDs)"""
@@ -48,63 +105,107 @@ class FileSessionStorage(SessionStorageInterface):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Session {session_id} not found")
         
-        with open(file_path, 'r') as file:
-            data = json.load(file)
-        
-        # Handle backward compatibility with older session formats
-        if 'session_id' not in data:
-            # Use the session_id from the filename for older files
-            data['session_id'] = session_id
-        
-        # Ensure required fields exist (backward compatibility)
-        required_fields = ['total_problems', 'problems_solved', 'stopwatch_time']
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Invalid session file: missing field '{field}'")
+        with _LOAD_SECONDS.time():
+            with open(file_path, 'rb') as file:
+                data = session_codec.decode(file.read())
         
-        # Create session with restored data
+        # Older files are upgraded once and written back in the current schema
+        data, migrated = migrate(data, session_id)
+        session, stopwatch = self._from_document(data)
+        session.logs.attach_spill(JsonlLogSpill(self._spill_path(session._session_id), data['logs_spilled']))
+        if migrated:
+            self._write(file_path, self._to_document(session, stopwatch))
+            logger.info("📄 Session %s upgraded to schema version %s", session_id, CURRENT_SCHEMA_VERSION)
+        return session, stopwatch
+
+    def load_many(self, session_ids: Iterable[str], fields: Optional[Sequence[str]] = None,
+                  max_workers: int = None) -> Iterator[tuple[str, dict]]:
+        """Yield (session_id, document) for each session, in order, parsed in a thread pool
+
+        fields limits each document to those keys; when they are all HEADER_FIELDS,
+        plain-JSON files are only read up to the logs. Documents are migrated in memory
+        but not rewritten (load_session does that). Unreadable files are logged and skipped.
+        At most 2 * max_workers files are in flight, so parsed documents the caller
+        hasn't reached yet don't pile up in memory.
+        """
+        session_ids = iter(session_ids)
+        fields = tuple(fields) if fields is not None else None
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)  # ThreadPoolExecutor's default
+        in_flight: deque = deque()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="session-load") as pool:
+            def submit_next() -> None:
+                for session_id in session_ids:
+                    path = os.path.join(self.SESSION_DIR, f'session_{session_id}.json')
+                    in_flight.append((session_id, pool.submit(_read_document, path, session_id, fields)))
+                    return
+
+            try:
+                for _ in range(2 * max_workers):
+                    submit_next()
+                while in_flight:
+                    session_id, future = in_flight.popleft()
+                    submit_next()  # Keep the window full while this result is consumed
+                    try:
+                        yield session_id, future.result()
+                    except (OSError, ValueError, EOFError) as e:  # JSON, zlib and lzma errors are ValueErrors
+                        logger.warning("⚠️ Skipping session %s: %s", session_id, e)
+            finally:
+                for _, future in in_flight:  # Caller stopped early
+                    future.cancel()
+
+    @staticmethod
+    def _from_document(data: dict) -> tuple[Session, Stopwatch]:
+        """Build the session from a current-schema document - no compatibility checks"""
         session = Session(data['total_problems'])
         session.problems_solved = data['problems_solved']
         session._session_id = data['session_id']
-        
-        # Restore custom session name if available
-        if 'custom_session_name' in data and data['custom_session_name']:
-            session._custom_session_name = data['custom_session_name']
-        
-        # Restore logs if available (backward compatibility)
-        if 'logs' in data:
-            session.logs = data['logs']
-        else:
-            session.logs = []  # Empty logs for older session files
-        
-        # Restore 3-stage workflow data (backward compatibility)
-        if 'current_problem_stage' in data:
-            session.current_problem_stage = ProblemStage(data['current_problem_stage'])
-        else:
-            session.current_problem_stage = ProblemStage.NOT_STARTED
-            
-        if 'current_problem_number' in data:
-            session.current_problem_number = data['current_problem_number']
-        else:
-            session.current_problem_number = session.problems_solved + 1 if session.problems_solved < session.total_problems else session.total_problems
-            
-        if 'problem_stages' in data:
-            session.problem_stages = data['problem_stages']
-            
-            # Ensure backward compatibility for stage notes
-            for problem_num, problem_data in session.problem_stages.items():
-                if 'stage_notes' not in problem_data:
-                    # Add empty stage notes for older session files
-                    problem_data['stage_notes'] = {
-                        ProblemStage.SELF_DOING.name: "",
-                        ProblemStage.SEEING_SOLUTION.name: "",
-                        ProblemStage.MAKING_NOTE.name: ""
-                    }
-        else:
-            session.problem_stages = {}
-        
-        # Create stopwatch with restored time
+        session._custom_session_name = data['custom_session_name']
+        session.logs = SessionLog(data['logs'])
+        session.current_problem_stage = ProblemStage(data['current_problem_stage'])
+        session.current_problem_number = data['current_problem_number']
+        session.problem_stages = pairs_to_problem_stages(data['problem_stages'])
+
         stopwatch = Stopwatch()
         stopwatch.time = data['stopwatch_time']
-        
         return session, stopwatch
+
+
+def _read_header(path: str) -> Optional[dict]:
+    """Header fields of a plain-JSON, current-schema file, parsed from its prefix; None if that's not possible"""
+    prefix = b''
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(_HEADER_CHUNK)
+            if not chunk:
+                return None
+            if not prefix and session_codec.detect_format(chunk) != 'json':
+                return None
+            prefix += chunk
+            # A marker split across chunks is found on the next pass
+            cut = min((index for index in (prefix.find(marker) for marker in _BODY_MARKERS) if index != -1),
+                      default=-1)
+            if cut != -1:
+                break
+    head = prefix[:cut].rstrip().rstrip(b',')
+    try:
+        header = json.loads(head + b'}')
+    except ValueError:
+        return None
+    return header if isinstance(header, dict) else None
+
+
+def _read_document(path: str, session_id: str, fields: Optional[tuple]) -> dict:
+    """Worker for load_many - the header prefix when that is enough, a full decode otherwise"""
+    if fields is not None and all(field in HEADER_FIELDS for field in fields):
+        header = _read_header(path)
+        # Older files lack schema_version or keep some header fields after the logs
+        if header is not None and header.get('schema_version') == CURRENT_SCHEMA_VERSION \
+                and all(field in header for field in fields):
+            return {field: header[field] for field in fields}
+
+    with open(path, 'rb') as file:
+        data = session_codec.decode(file.read())
+    data, _ = migrate(data, session_id)
+    if fields is None:
+        return data
+    return {field: data[field] for field in fields if field in data}
@@ -0,0 +1,204 @@
+"""
+Event-Loop Watchdog - Following Single Responsibility Principle (SOLID)
+This module only detects and explains stalls of the Tk main thread.
+
+A root.after() heartbeat runs every few tens of milliseconds on the Tk thread. A
+helper thread checks how long ago it last fired; once that exceeds the stall
+threshold, it samples the main thread's stack via sys._current_frames() until
+the heartbeat returns. Samples are aggregated by stack, so the report ranks the
+code that froze the timer (synchronous saves, mixer loads, dialogs, log
+rebuilds) by total stalled time.
+"""
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WATCHDOG_ENV_VAR = 'TIMER_WATCHDOG'
+STACK_DEPTH = 12  # Innermost frames kept per sample (and used to group them)
+
+StackKey = Tuple[Tuple[str, int, str], ...]
+
+
+class EventLoopWatchdog:
+    """Heartbeat on the Tk thread + stack sampler on a helper thread"""
+    def __init__(self, root, interval_ms: int = 50, stall_threshold_ms: int = 250,
+                 sample_interval_ms: int = 50, max_stalls: int = 500):
+        self._root = root
+        self._interval = interval_ms / 1000
+        self._threshold = stall_threshold_ms / 1000
+        self._sample_interval = sample_interval_ms / 1000
+
+        self._lock = threading.Lock()
+        self._main_ident: Optional[int] = None
+        self._last_beat = 0.0
+        self._heartbeat_job = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # Current stall (helper thread) and history
+        self._stall_start: Optional[float] = None
+        self._stall_samples: Dict[StackKey, int] = {}
+        self._stalls = deque(maxlen=max_stalls)  # (started, duration_ms, innermost stack)
+        self._offenders: Dict[StackKey, dict] = {}
+        self._lags_ms = deque(maxlen=4096)
+        self._heartbeats = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start watching (call from the Tk thread)"""
+        if self.is_running:
+            return
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop_event.clear()
+        self._heartbeat_job = self._root.after(int(self._interval * 1000), self._heartbeat)
+        self._thread = threading.Thread(target=self._watch, name="tk-watchdog", daemon=True)
+        self._thread.start()
+        logger.info("🐕 Event-loop watchdog started (stall threshold %s ms)", int(self._threshold * 1000))
+
+    def stop(self) -> None:
+        if not self.is_running:
+            return
+        self._stop_event.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        if self._heartbeat_job is not None:
+            try:
+                self._root.after_cancel(self._heartbeat_job)
+            except Exception:
+                pass  # Window already destroyed
+            self._heartbeat_job = None
+
+    # Tk thread
+
+    def _heartbeat(self) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            self._lags_ms.append(max(0.0, (now - self._last_beat - self._interval) * 1000))
+            self._last_beat = now
+            self._heartbeats += 1
+            if self._stall_start is not None:
+                self._finish_stall(now)
+        self._heartbeat_job = self._root.after(int(self._interval * 1000), self._heartbeat)
+
+    # Helper thread
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(self._sample_interval):
+            with self._lock:
+                now = time.perf_counter()
+                if now - self._last_beat < self._interval + self._threshold:
+                    continue
+                if self._stall_start is None:
+                    self._stall_start = self._last_beat + self._interval
+                    self._stall_samples = {}
+                key = self._sample_main_stack()
+                if key:
+                    self._stall_samples[key] = self._stall_samples.get(key, 0) + 1
+
+    def _sample_main_stack(self) -> Optional[StackKey]:
+        frame = sys._current_frames().get(self._main_ident)
+        if frame is None:
+            return None
+        summary = traceback.extract_stack(frame, limit=STACK_DEPTH)
+        return tuple((entry.filename, entry.lineno, entry.name) for entry in summary)
+
+    def _finish_stall(self, now: float) -> None:
+        """Fold the stall that just ended into the history (lock held)"""
+        duration_ms = (now - self._stall_start) * 1000
+        samples = self._stall_samples
+        total_samples = sum(samples.values()) or 1
+        for key, count in samples.items():
+            offender = self._offenders.setdefault(key, {'samples': 0, 'stalled_ms': 0.0,
+                                                        'stalls': 0, 'worst_ms': 0.0})
+            offender['samples'] += count
+            offender['stalled_ms'] += duration_ms * count / total_samples
+            offender['stalls'] += 1
+            offender['worst_ms'] = max(offender['worst_ms'], duration_ms)
+        dominant = max(samples, key=samples.get) if samples else ()
+        self._stalls.append((datetime.now(), round(duration_ms, 1), _format_frame(dominant[-1]) if dominant else "?"))
+        self._stall_start = None
+        self._stall_samples = {}
+
+    # Reporting
+
+    def get_summary(self) -> dict:
+        with self._lock:
+            lags = sorted(self._lags_ms)
+            stalls = list(self._stalls)
+        durations = [duration for _, duration, _ in stalls]
+        return {
+            'heartbeats': self._heartbeats,
+            'lag_p50_ms': round(lags[len(lags) // 2], 2) if lags else 0.0,
+            'lag_p95_ms': round(lags[min(len(lags) - 1, int(len(lags) * 0.95))], 2) if lags else 0.0,
+            'lag_max_ms': round(lags[-1], 2) if lags else 0.0,
+            'stalls': len(stalls),
+            'stalled_ms_total': round(sum(durations), 1),
+            'worst_stall_ms': max(durations, default=0.0),
+        }
+
+    def get_offenders(self, limit: int = 10) -> List[dict]:
+        """Sampled stacks ranked by the stall time attributed to them"""
+        with self._lock:
+            ranked = sorted(self._offenders.items(), key=lambda item: item[1]['stalled_ms'], reverse=True)
+        return [{'stack': [_format_frame(frame) for frame in key],
+                 'location': _format_frame(_project_frame(key)),
+                 **{name: round(value, 1) if isinstance(value, float) else value for name, value in stats.items()}}
+                for key, stats in ranked[:limit]]
+
+    def write_report(self, path: str, limit: int = 10) -> str:
+        """Text report of the lag distribution, recent stalls and worst offenders"""
+        summary = self.get_summary()
+        lines = ["Tk event-loop stall report", ""]
+        lines.extend(f"{name}: {value}" for name, value in summary.items())
+        lines.append("")
+        lines.append("== Worst offenders (by stalled time) ==")
+        for rank, offender in enumerate(self.get_offenders(limit), 1):
+            lines.append(f"#{rank} {offender['location']} - {offender['stalled_ms']} ms over "
+                         f"{offender['stalls']} stall(s), worst {offender['worst_ms']} ms, "
+                         f"{offender['samples']} sample(s)")
+            lines.extend(f"    {frame}" for frame in offender['stack'])
+            lines.append("")
+        lines.append("== Recent stalls ==")
+        with self._lock:
+            stalls = list(self._stalls)[-50:]
+        for when, duration_ms, location in stalls:
+            lines.append(f"{when:%H:%M:%S} {duration_ms:8.1f} ms  {location}")
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+
+def _format_frame(frame: Tuple[str, int, str]) -> str:
+    filename, lineno, name = frame
+    try:
+        filename = os.path.relpath(filename)
+    except ValueError:
+        pass  # Different drive on Windows
+    return f"{filename}:{lineno} in {name}"
+
+
+def _project_frame(key: StackKey) -> Tuple[str, int, str]:
+    """Innermost frame in the app's own code, falling back to the innermost frame"""
+    for frame in reversed(key):
+        if 'timer_app' in frame[0] or 'dsa_solo_leveling' in frame[0]:
+            return frame
+    return key[-1]
+
+
+def watchdog_requested() -> bool:
+    return os.environ.get(WATCHDOG_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes', 'on')
@@ -1,10 +1,12 @@
-import webview
+import logging
 import threading
 import tkinter as tk
 from tkinter import messagebox
 import os
 import sys
 
+logger = logging.getLogger(__name__)
+
 class BrowserWidget:
     """Browser widget that opens takeuforward.org with cookie support"""
     
@@ -30,6 +32,7 @@ class BrowserWidget:
         """Create the browser window in a separate thread"""
         try:
             self.is_browser_open = True
+            import webview  # Heavy - only loaded when the browser is first opened
             
             # Create the webview window
             self.window = webview.create_window(
@@ -58,7 +61,7 @@ class BrowserWidget:
             )
             
         except Exception as e:
-            print(f"Browser error: {e}")
+            logger.error("Browser error: %s", e)
             messagebox.showerror("Browser Error", f"Failed to create browser: {str(e)}")
         finally:
             self.is_browser_open = False
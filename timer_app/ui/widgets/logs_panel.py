@@ -1,9 +1,14 @@
+import logging
 import tkinter as tk
 from timer_app.domain.models import ProblemStage
 from .notes_window import NoteViewerWindow
 
+logger = logging.getLogger(__name__)
+
 class LogsPanel:
     """Enhanced logs display panel with improved UI design - SRP"""
+    MAX_RENDERED_ENTRIES = 200  # Older entries stay in the session log, not in the widget
+
     def __init__(self, parent: tk.Widget, bg_color: str = "black"):
         self.bg_color = bg_color
         self.is_visible = False
@@ -13,6 +18,9 @@ class LogsPanel:
         self.current_problem = 0
         self.user_scrolled_manually = False  # Track if user has manually scrolled
         self.last_scroll_position = None  # Track last scroll position
+        self._logs = None  # Last log shown - "load earlier" re-renders it
+        self._session_data = None
+        self._rendered_limit = self.MAX_RENDERED_ENTRIES  # Grows by a page per "load earlier"
 
     def _create_panel(self, parent: tk.Widget):
         # Create the logs frame with gradient-like background
@@ -209,6 +217,18 @@ class LogsPanel:
                                lambda e: self.logs_text.config(cursor="hand2"))
         self.logs_text.tag_bind("note_button", "<Leave>", 
                                lambda e: self.logs_text.config(cursor=""))
+        
+        # "Load earlier" control above the rendered entries
+        self.logs_text.tag_config("load_earlier", 
+                                foreground="#2196F3", 
+                                font=("Segoe UI", 8, "bold"),
+                                underline=True)
+        self.logs_text.tag_bind("load_earlier", "<Enter>", 
+                               lambda e: self.logs_text.config(cursor="hand2"))
+        self.logs_text.tag_bind("load_earlier", "<Leave>", 
+                               lambda e: self.logs_text.config(cursor=""))
+        self.logs_text.tag_bind("load_earlier", "<Button-1>", 
+                               lambda e: self.load_earlier())
 
     def _get_log_style(self, description: str) -> str:
         """Determine the appropriate style tag for a log entry"""
@@ -265,25 +285,54 @@ class LogsPanel:
         else:
             self.show()
 
-    def update_logs(self, logs: list, session_data=None):
-        """Update the logs display with enhanced formatting and notes"""
+    def update_logs(self, logs, session_data=None):
+        """Update the logs display with enhanced formatting and notes (most recent entries only)"""
+        if logs is not self._logs:
+            self._rendered_limit = self.MAX_RENDERED_ENTRIES  # Another session - start from its tail again
+        self._logs = logs
+        self._session_data = session_data
+        self._render(logs, session_data)
+        
+        # Smart auto-scroll: only scroll to bottom if user was already at bottom
+        self._smart_auto_scroll()
+        self.logs_text.config(state=tk.DISABLED)
+
+    def load_earlier(self):
+        """Render another page of older entries above the current ones and keep them in view"""
+        if self._logs is None:
+            return
+        self._rendered_limit += self.MAX_RENDERED_ENTRIES
+        self._render(self._logs, self._session_data)
+        self.user_scrolled_manually = True  # Reading history - don't jump back to the bottom
+        self.logs_text.see("1.0")
+        self.last_scroll_position = self.logs_text.yview()
+        self.logs_text.config(state=tk.DISABLED)
+
+    def _render(self, logs, session_data):
+        """Fill the text widget with the last _rendered_limit entries and refresh the stats"""
         self.logs_text.config(state=tk.NORMAL)
         self.logs_text.delete(1.0, tk.END)
         
+        total_entries = len(logs)
+        self._update_stats(*self._compute_stats(logs, session_data))
+        start = max(0, total_entries - self._rendered_limit)
+        if hasattr(logs, 'page'):  # SessionLog - spilled history is only read once asked for
+            logs = logs.page(start, total_entries - start)
+        else:
+            logs = logs[start:]
+        
         if not logs:
             # Show welcome message
             welcome_text = "🚀 Welcome to your coding session!\n\nStart working on a problem to see your progress tracked here."
             self.logs_text.insert(tk.END, welcome_text, "session")
-            self.logs_text.config(state=tk.DISABLED)
             return
         
-        # Track statistics
-        problems_attempted = set()
-        total_stages = 0
-        completed_problems = 0
-        
         last_problem = 0
         
+        if start > 0:
+            self.logs_text.insert(tk.END, f"⬆️ Load earlier entries ({start} not shown)", "load_earlier")
+            self.logs_text.insert(tk.END, "\n\n")
+        
         for i, log_entry in enumerate(logs):
             if len(log_entry) >= 2:
                 time_str, description = log_entry[0], log_entry[1]
@@ -292,18 +341,11 @@ class LogsPanel:
                 # Check if this is a new problem
                 problem_num = self._extract_problem_number(description)
                 if problem_num > 0:
-                    problems_attempted.add(problem_num)
                     if problem_num != last_problem and last_problem > 0:
                         # Add separator between problems
                         self.logs_text.insert(tk.END, "\n" + "─" * 40 + "\n\n", "separator")
                     last_problem = problem_num
                 
-                # Count activities
-                if "started" in description.lower() and "session" not in description.lower():
-                    total_stages += 1
-                elif "completed" in description.lower() and "all problems" not in description.lower():
-                    completed_problems += 1
-                
                 # Get appropriate styling
                 style_tag = self._get_log_style(description)
                 
@@ -379,13 +421,34 @@ class LogsPanel:
                     self.logs_text.insert(tk.END, "\n\n")
                 else:
                     self.logs_text.insert(tk.END, "\n\n")
+
+    def _compute_stats(self, logs, session_data):
+        """
+        (problems attempted, stages started, problems completed) for the whole session,
+        however many entries are rendered. The session's own problem data is used when
+        given; otherwise the full log is counted.
+        """
+        if session_data is not None:
+            problem_stages = session_data.problem_stages.values()
+            return (len(session_data.problem_stages),
+                    sum(len(data.get('stage_times', {})) for data in problem_stages),
+                    sum(1 for data in problem_stages if data.get('completed')))
         
-        # Update statistics
-        self._update_stats(len(problems_attempted), total_stages, completed_problems)
-        
-        # Smart auto-scroll: only scroll to bottom if user was already at bottom
-        self._smart_auto_scroll()
-        self.logs_text.config(state=tk.DISABLED)
+        problems_attempted = set()
+        total_stages = 0
+        completed_problems = 0
+        for log_entry in logs:
+            if len(log_entry) < 2:
+                continue
+            description = log_entry[1].lower()
+            problem_num = self._extract_problem_number(log_entry[1])
+            if problem_num > 0:
+                problems_attempted.add(problem_num)
+            if "started" in description and "session" not in description:
+                total_stages += 1
+            elif "completed" in description and "all problems" not in description:
+                completed_problems += 1
+        return len(problems_attempted), total_stages, completed_problems
 
     def _update_stats(self, problems_attempted: int, total_stages: int, completed_problems: int):
         """Update the statistics summary"""
@@ -434,4 +497,4 @@ class LogsPanel:
                 note_data['problem_num']
             )
         except Exception as e:
-            print(f"Error showing note viewer: {e}")
+            logger.error("Error showing note viewer: %s", e)
@@ -1,3 +1,4 @@
+import logging
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import os
@@ -5,32 +6,33 @@ import subprocess
 import platform
 import threading
 import time
-import json
-from pathlib import Path
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+from collections import deque
+from timer_app.infrastructure.lazy_import import lazy_import
 
-try:
-    from mutagen import File as MutagenFile
-    from mutagen.id3 import ID3NoHeaderError
-    MUTAGEN_AVAILABLE = True
-except ImportError:
-    MUTAGEN_AVAILABLE = False
+# Heavy dependencies load when the player is first opened, not at app start
+pygame = lazy_import("pygame")
+PYGAME_AVAILABLE = pygame is not None
+mutagen = lazy_import("mutagen")
+MUTAGEN_AVAILABLE = mutagen is not None
 
-try:
-    from PIL import Image, ImageTk
-    import io
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from timer_app.audio.engine import TkSnapshotPump, get_audio_engine
+from timer_app.audio.artwork_cache import ArtworkThumbnailCache, NO_ARTWORK, PIL_AVAILABLE
+from timer_app.audio.library import MusicLibrary, normalize_track_path
+from timer_app.audio.settings_store import get_settings_store
+from timer_app.audio.seek import SeekController
+from timer_app.audio.shuffle import ShuffleOrder
+from timer_app.audio.stream import StreamingPlayback
+from timer_app.audio.loudness import LoudnessAnalyzer, gain_to_scale
+from timer_app.audio.waveform import compute_waveform, decode_peaks
+from timer_app.ui.widgets.virtual_list import VirtualListView
+
+logger = logging.getLogger(__name__)
 
 class SpotifyLikePlayer:
     """Spotify-like media player that runs in background"""
     def __init__(self):
         self.playlist = []
+        self._playlist_paths = set()  # Paths in the playlist, for O(1) duplicate checks
         self.current_track_index = 0
         self.is_playing = False
         self.is_paused = False
@@ -40,31 +42,46 @@ class SpotifyLikePlayer:
         self.start_time = 0  # When playback started
         self.repeat_mode = "off"  # off, track, playlist
         self.shuffle = False
+        self.shuffle_order = ShuffleOrder()  # Shuffled play order keyed by playlist index
         self.current_track = None
         self.player_thread = None
         self.stop_event = threading.Event()
-        self.sound_object = None  # For pygame.mixer.Sound (supports seeking better)
-        self.sound_channel = None
+        self.stream = None  # StreamingPlayback when the streaming engine plays the track
+        self.playback_engine = "music"  # "music" (pygame.mixer.music) or "stream" (chunked Channel playback)
+        self.stream_buffer_seconds = 2.0
+        self.normalize_loudness = True  # Apply per-track gain from loudness analysis
+        self.loudness = LoudnessAnalyzer()
+        self._waveform = None  # (track id, (mins, maxs)) peaks of the current track
+        self.artwork_cache = ArtworkThumbnailCache()
+        self._artwork_results = deque()  # (track, hash or None) from the artwork worker, applied on the Tk thread
+        self._artwork_failures = set()  # Paths whose artwork could not be read or cached - not retried
+        self.seeker = SeekController()
+        self.library = MusicLibrary()
+        self.settings = get_settings_store("media_player_settings.json")
+        self.engine = get_audio_engine()  # Owns pygame.mixer - all mixer calls run on its thread
         
         # Initialize pygame mixer if available
         if PYGAME_AVAILABLE:
             try:
-                # Initialize pygame mixer with better settings for audio playback
-                pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
-                pygame.mixer.init()
-                pygame.mixer.music.set_volume(self.volume)
+                self.engine.run_sync('init', self._init_mixer)
                 self.pygame_ready = True
-                print("Pygame mixer initialized successfully")
+                logger.info("Pygame mixer initialized successfully")
             except Exception as e:
-                print(f"Pygame mixer initialization failed: {e}")
+                logger.error("Pygame mixer initialization failed: %s", e)
                 self.pygame_ready = False
         else:
-            print("Pygame not available - please install pygame: pip install pygame")
+            logger.warning("Pygame not available - please install pygame: pip install pygame")
             self.pygame_ready = False
         
         # Load saved playlist and settings
         self._load_settings()
     
+    def _init_mixer(self):
+        """Initialize pygame mixer with better settings for audio playback (engine thread)"""
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
+        pygame.mixer.init()
+        pygame.mixer.music.set_volume(self.volume)
+    
     def _extract_metadata(self, file_path):
         """Extract metadata from audio file"""
         if not MUTAGEN_AVAILABLE:
@@ -78,7 +95,7 @@ class SpotifyLikePlayer:
             }
         
         try:
-            audiofile = MutagenFile(file_path)
+            audiofile = mutagen.File(file_path)
             if audiofile is None:
                 raise Exception("Could not read file")
             
@@ -97,8 +114,9 @@ class SpotifyLikePlayer:
                 seconds = int(length % 60)
                 duration = f"{minutes}:{seconds:02d}"
             
-            # Extract album artwork
+            # Cache album artwork thumbnails in the background (only the hash is kept)
             artwork_data = self._extract_artwork(audiofile)
+            artwork_hash = self.artwork_cache.store_async(artwork_data) if artwork_data else NO_ARTWORK
             
             return {
                 'title': str(title).strip(),
@@ -107,10 +125,10 @@ class SpotifyLikePlayer:
                 'duration': duration,
                 'genre': str(genre).strip(),
                 'year': str(year).strip()[:4],  # Just the year part
-                'artwork': artwork_data
+                'artwork_hash': artwork_hash
             }
         except Exception as e:
-            print(f"Error reading metadata from {file_path}: {e}")
+            logger.error("Error reading metadata from %s: %s", file_path, e)
             return {
                 'title': os.path.splitext(os.path.basename(file_path))[0],
                 'artist': 'Unknown Artist',
@@ -118,7 +136,7 @@ class SpotifyLikePlayer:
                 'duration': '0:00',
                 'genre': 'Unknown',
                 'year': '',
-                'artwork': None
+                'artwork_hash': None
             }
     
     def _get_tag_value(self, audiofile, tag_keys):
@@ -133,7 +151,7 @@ class SpotifyLikePlayer:
         return None
     
     def _extract_artwork(self, audiofile):
-        """Extract album artwork from audio file"""
+        """Extract raw album artwork bytes from audio file"""
         if not MUTAGEN_AVAILABLE or not PIL_AVAILABLE:
             return None
             
@@ -163,39 +181,62 @@ class SpotifyLikePlayer:
             elif hasattr(audiofile, 'pictures') and audiofile.pictures:
                 artwork_data = audiofile.pictures[0].data
             
-            if artwork_data:
-                # Convert to PIL Image
-                image = Image.open(io.BytesIO(artwork_data))
-                # Resize to fit in the UI (80x80 pixels)
-                image = image.resize((80, 80), Image.Resampling.LANCZOS)
-                # Convert to PhotoImage for tkinter
-                return ImageTk.PhotoImage(image)
+            return artwork_data
             
         except Exception as e:
-            print(f"Error extracting artwork: {e}")
+            logger.error("Error extracting artwork: %s", e)
         
         return None
     
     def _extract_artwork_for_track(self, track):
-        """Extract artwork for a specific track when UI is ready"""
+        """Queue background artwork extraction for a track missing cached thumbnails"""
         if not isinstance(track, dict) or not track.get('path'):
-            return None
+            return False
             
-        if not os.path.exists(track['path']):
+        if not os.path.exists(track['path']) or not (MUTAGEN_AVAILABLE and PIL_AVAILABLE):
+            return False
+        
+        def load_artwork():
+            audiofile = mutagen.File(track['path'])
+            return self._extract_artwork(audiofile) if audiofile else None
+        
+        def on_cached(artwork_hash):
+            # Artwork worker thread - the track dict is only touched on the Tk thread
+            if artwork_hash is not None and track.get('id') is not None:
+                self.library.update_field(track['id'], 'artwork_hash', artwork_hash)
+            self._artwork_results.append((track, artwork_hash))
+        
+        return self.artwork_cache.submit(load_artwork, on_cached, key=track['path'])
+    
+    def _apply_artwork_results(self):
+        """Record finished artwork jobs on their tracks (Tk thread)"""
+        while self._artwork_results:
+            track, artwork_hash = self._artwork_results.popleft()
+            if artwork_hash is None:
+                self._artwork_failures.add(track['path'])  # Already logged by the worker
+            else:
+                track['artwork_hash'] = artwork_hash
+    
+    def get_artwork_image(self, track):
+        """Get the artwork thumbnail for a track from the cache (call from the Tk thread)"""
+        if not isinstance(track, dict):
             return None
-            
-        try:
-            if MUTAGEN_AVAILABLE and PIL_AVAILABLE:
-                audiofile = MutagenFile(track['path'])
-                if audiofile:
-                    return self._extract_artwork(audiofile)
-        except Exception as e:
-            print(f"Error extracting artwork for {track.get('title', 'Unknown')}: {e}")
         
-        return None
+        self._apply_artwork_results()
+        artwork_hash = track.get('artwork_hash')
+        if artwork_hash == NO_ARTWORK or track.get('path') in self._artwork_failures:
+            return None
+        
+        photo = self.artwork_cache.get_photo(artwork_hash)
+        if photo is None and (artwork_hash is None or not self.artwork_cache.has_thumbnails(artwork_hash)):
+            # Not cached yet - populate in the background, next UI refresh picks it up
+            self._extract_artwork_for_track(track)
+        return photo
     
     def get_position(self):
         """Get current playback position in seconds"""
+        if self.stream:
+            return min(self.stream.get_position(), self.duration) if self.duration else self.stream.get_position()
         if self.is_playing and not self.is_paused:
             elapsed = time.time() - self.start_time
             return min(self.position + elapsed, self.duration)
@@ -205,39 +246,56 @@ class SpotifyLikePlayer:
         """Get total track duration in seconds"""
         return self.duration
     
+    def _current_track_path(self):
+        """Path of the loaded track, None if nothing is loaded"""
+        if not self.current_track:
+            return None
+        return self.current_track['path'] if isinstance(self.current_track, dict) else self.current_track
+    
     def seek_to(self, position):
-        """Seek to specific position in seconds"""
-        if not self.pygame_ready:
+        """Seek to specific position in seconds (queued on the audio engine, stream stays open)"""
+        track_path = self._current_track_path()
+        if not self.pygame_ready or not track_path:
             return False
         
-        try:
-            # Clamp position to valid range
-            position = max(0, min(position, self.duration))
-            
-            # Stop current playback
-            pygame.mixer.music.stop()
-            
-            # Restart the track
-            if self.current_track:
-                track_path = self.current_track['path'] if isinstance(self.current_track, dict) else self.current_track
-                pygame.mixer.music.load(track_path)
-                pygame.mixer.music.set_volume(self.volume)
-                pygame.mixer.music.play(start=position)  # Try to start at position
-                
-                # Update position tracking
-                self.position = position
-                self.start_time = time.time()
-                self.is_playing = True
-                self.is_paused = False
-                
-                print(f"Seeking to {self._format_time(position)} / {self._format_time(self.duration)}")
-                return True
-        except Exception as e:
-            print(f"Seek error: {e}")
+        # Clamp position to valid range
+        position = max(0, min(position, self.duration))
+        if self.stream:
+            # The stream applies only the latest pending target
+            self.stream.seek(position)
+            return True
+        
+        # Update position tracking right away for visual feedback
+        self.position = position
+        self.start_time = time.time()
+        paused = self.is_paused
+        self.engine.seek(position,
+                         seek_func=lambda target: self.seeker.seek(track_path, target, paused=paused),
+                         on_done=lambda reached: self._on_seek_applied(reached, position))
+        return True
+    
+    def request_seek(self, position):
+        """Seek for rapid updates (e.g. dragging) - the engine only applies the latest queued target"""
+        return self.seek_to(position)
+    
+    def _on_seek_applied(self, reached, requested):
+        """Update position tracking after a seek was applied to the mixer (engine thread)"""
+        if reached is None:
             # Fallback: just update position tracking for visual feedback
-            self.position = position
+            self.position = requested
             self.start_time = time.time()
             return False
+        
+        try:
+            pygame.mixer.music.set_volume(self._effective_volume())
+        except Exception:
+            pass
+        
+        self.position = reached
+        self.start_time = time.time()
+        if not self.is_paused:
+            self.is_playing = True
+        return True
     
     def _parse_duration(self, duration_str):
         """Parse duration string (e.g., '3:45') to seconds"""
@@ -263,22 +321,24 @@ class SpotifyLikePlayer:
     def _load_settings(self):
         """Load saved settings and playlist"""
         try:
-            settings_file = Path("media_player_settings.json")
-            if settings_file.exists():
-                with open(settings_file, 'r') as f:
-                    data = json.load(f)
-                    self.playlist = data.get('playlist', [])
-                    self.volume = data.get('volume', 0.7)
-                    self.repeat_mode = data.get('repeat_mode', 'off')
-                    self.shuffle = data.get('shuffle', False)
-                    
-                    # Migrate old playlist format to new metadata format
-                    self._migrate_playlist_format()
-                    
-                    # Re-extract artwork for existing tracks (since artwork isn't saved to JSON)
-                    self._refresh_artwork()
+            self.volume = self.settings.get('volume', 0.7)
+            self.playback_engine = self.settings.get('playback_engine', 'music')
+            self.stream_buffer_seconds = self.settings.get('stream_buffer_seconds', 2.0)
+            self.normalize_loudness = self.settings.get('normalize_loudness', True)
+            self.repeat_mode = self.settings.get('repeat_mode', 'off')
+            self.shuffle = self.settings.get('shuffle', False)
+            
+            if 'playlist_ids' in self.settings:
+                # Playlist stores library track ids only
+                self.playlist = self.library.get_tracks(self.settings.get('playlist_ids'))
+            elif 'playlist' in self.settings:
+                # Migrate old playlist format to new metadata format
+                self.playlist = self.settings.get('playlist', [])
+                self._migrate_playlist_format()
+                self._migrate_playlist_to_library()
+            self._rebuild_path_index()
         except Exception as e:
-            print(f"Could not load media player settings: {e}")
+            logger.warning("Could not load media player settings: %s", e)
     
     def _migrate_playlist_format(self):
         """Migrate old string-based playlist to new metadata format"""
@@ -288,7 +348,7 @@ class SpotifyLikePlayer:
         for track in self.playlist:
             if isinstance(track, str):
                 # Old format - convert to new metadata format
-                print(f"Migrating track: {os.path.basename(track)}")
+                logger.debug("Migrating track: %s", os.path.basename(track))
                 if os.path.exists(track):
                     metadata = self._extract_metadata(track)
                     track_info = {
@@ -299,101 +359,169 @@ class SpotifyLikePlayer:
                         'duration': metadata['duration'],
                         'genre': metadata['genre'],
                         'year': metadata['year'],
-                        'artwork': metadata.get('artwork')
+                        'artwork_hash': metadata.get('artwork_hash')
                     }
                     new_playlist.append(track_info)
                     migrated = True
-                    print(f"Migrated: {metadata['artist']} - {metadata['title']}")
+                    logger.debug("Migrated: %s - %s", metadata['artist'], metadata['title'])
                 else:
-                    print(f"Skipping missing file: {track}")
+                    logger.warning("Skipping missing file: %s", track)
             else:
                 # Already in new format
                 new_playlist.append(track)
         
         if migrated:
             self.playlist = new_playlist
-            self._save_settings()
-            print(f"Playlist migration completed - {len(new_playlist)} tracks")
+            logger.info("Playlist migration completed - %s tracks", len(new_playlist))
     
-    def _refresh_artwork(self):
-        """Re-extract artwork for all tracks in playlist (only when UI is ready)"""
-        # Skip artwork extraction during initialization - will be done when UI is created
-        pass
+    def _migrate_playlist_to_library(self):
+        """Move metadata of an inline (pre-library) playlist into the library database"""
+        tracks = [track for track in self.playlist if isinstance(track, dict) and track.get('path')]
+        ids = self.library.add_tracks(tracks)
+        for track, track_id in zip(tracks, ids):
+            track['id'] = track_id
+        self.playlist = tracks
+        self.settings.remove('playlist')
+        self._save_settings()
+        logger.info("Playlist moved to music library - %s tracks", len(tracks))
+    
+    def _rebuild_path_index(self):
+        """Rebuild the set of playlist paths used for duplicate checks"""
+        self._playlist_paths = {track['path'] if isinstance(track, dict) else track for track in self.playlist}
     
     def _save_settings(self):
-        """Save current settings and playlist (excluding artwork)"""
+        """
+        Save current settings and playlist (track metadata lives in the music library).
+        Only updates the shared settings store; the file is written in the background.
+        """
         try:
-            # Create a copy of playlist without artwork for JSON serialization
-            playlist_for_save = []
-            for track in self.playlist:
-                if isinstance(track, dict):
-                    track_copy = track.copy()
-                    track_copy.pop('artwork', None)  # Remove artwork as it's not JSON serializable
-                    playlist_for_save.append(track_copy)
-                else:
-                    playlist_for_save.append(track)
-            
-            settings_data = {
-                'playlist': playlist_for_save,
+            self.settings.update({
+                'playlist_ids': [track['id'] for track in self.playlist
+                                 if isinstance(track, dict) and track.get('id') is not None],
                 'volume': self.volume,
                 'repeat_mode': self.repeat_mode,
-                'shuffle': self.shuffle
-            }
-            with open("media_player_settings.json", 'w') as f:
-                json.dump(settings_data, f, indent=2)
+                'shuffle': self.shuffle,
+                'playback_engine': self.playback_engine,
+                'stream_buffer_seconds': self.stream_buffer_seconds,
+                'normalize_loudness': self.normalize_loudness
+            })
         except Exception as e:
-            print(f"Could not save media player settings: {e}")
+            logger.warning("Could not save media player settings: %s", e)
     
     def add_track(self, file_path):
         """Add track to playlist with metadata"""
+        # Same spelling as folder imports, so the library and playlist see one file once
+        file_path = normalize_track_path(file_path)
+        
         # Check if file exists and is a supported audio format
         if not os.path.exists(file_path):
-            print(f"File not found: {file_path}")
+            logger.warning("File not found: %s", file_path)
             return False
             
         # Check if it's a supported audio format
         supported_formats = ['.mp3', '.wav', '.ogg', '.m4a', '.flac', '.aac']
         file_ext = os.path.splitext(file_path)[1].lower()
         if file_ext not in supported_formats:
-            print(f"Unsupported audio format: {file_ext}")
+            logger.info("Unsupported audio format: %s", file_ext)
             return False
         
         # Check if track already exists (by file path)
-        existing_paths = [track['path'] if isinstance(track, dict) else track for track in self.playlist]
-        if file_path in existing_paths:
-            print(f"Track already in playlist: {os.path.basename(file_path)}")
+        if file_path in self._playlist_paths:
+            logger.info("Track already in playlist: %s", os.path.basename(file_path))
             return False
         
-        # Extract metadata
-        metadata = self._extract_metadata(file_path)
-        track_info = {
-            'path': file_path,
-            'title': metadata['title'],
-            'artist': metadata['artist'],
-            'album': metadata['album'],
-            'duration': metadata['duration'],
-            'genre': metadata['genre'],
-            'year': metadata['year'],
-            'artwork': metadata.get('artwork')
-        }
+        # Reuse library metadata when the file is already known, otherwise extract it
+        track_id = self.library.find_id(file_path)
+        track_info = self.library.get_track(track_id) if track_id is not None else None
+        if track_info is None:
+            metadata = self._extract_metadata(file_path)
+            track_info = {
+                'path': file_path,
+                'title': metadata['title'],
+                'artist': metadata['artist'],
+                'album': metadata['album'],
+                'duration': metadata['duration'],
+                'genre': metadata['genre'],
+                'year': metadata['year'],
+                'artwork_hash': metadata.get('artwork_hash')
+            }
+            track_info['id'] = self.library.add_track(track_info)
+        self._request_loudness_analysis(track_info)
         
         self.playlist.append(track_info)
+        self._playlist_paths.add(file_path)
+        if self.shuffle:
+            self.shuffle_order.add(len(self.playlist) - 1)
         self._save_settings()
-        print(f"Added to playlist: {metadata['artist']} - {metadata['title']}")
+        logger.debug("Added to playlist: %s - %s", track_info['artist'], track_info['title'])
         return True
     
+    def search_library(self, query, limit=200):
+        """Full-text search over the music library (title/artist/album/genre)"""
+        return self.library.search(query, limit=limit)
+    
+    def add_library_tracks(self, track_ids):
+        """Append library tracks to the playlist by id, returns how many were added"""
+        added = 0
+        for track in self.library.get_tracks(track_ids):
+            if track['path'] in self._playlist_paths:
+                continue
+            self.playlist.append(track)
+            self._playlist_paths.add(track['path'])
+            if self.shuffle:
+                self.shuffle_order.add(len(self.playlist) - 1)
+            added += 1
+        if added:
+            self._save_settings()
+        return added
+    
+    def import_folder(self, folder, on_done=None):
+        """Scan a folder into the music library on a background thread"""
+        supported_formats = ('.mp3', '.wav', '.ogg', '.m4a', '.flac', '.aac')
+        
+        def scan():
+            try:
+                tracks = []
+                for root_dir, _, files in os.walk(folder):
+                    for name in files:
+                        if not name.lower().endswith(supported_formats):
+                            continue
+                        path = normalize_track_path(os.path.join(root_dir, name))
+                        if self.library.find_id(path) is not None:
+                            continue
+                        metadata = self._extract_metadata(path)
+                        tracks.append({'path': path, **metadata})
+                        # Commit in batches so searches see progress on large folders
+                        if len(tracks) >= 200:
+                            self.library.add_tracks(tracks)
+                            tracks = []
+                if tracks:
+                    self.library.add_tracks(tracks)
+                logger.info("Library import finished: %s tracks in library", self.library.count())
+            except Exception as e:
+                logger.error("❌ Library import failed: %s", e)
+            finally:
+                if on_done:
+                    on_done()  # Always - the UI waits for it
+        
+        threading.Thread(target=scan, daemon=True).start()
+    
     def remove_track(self, index):
         """Remove track from playlist"""
         if 0 <= index < len(self.playlist):
-            self.playlist.pop(index)
+            removed = self.playlist.pop(index)
+            self._playlist_paths.discard(removed['path'] if isinstance(removed, dict) else removed)
             if self.current_track_index >= len(self.playlist) and self.playlist:
                 self.current_track_index = 0
+            if self.shuffle:
+                # Indices after the removed track shift down by one
+                self.shuffle_order.remap(lambda i: None if i == index else (i - 1 if i > index else i))
             self._save_settings()
     
     def play(self, track_index=None):
         """Play track using pygame mixer"""
         if not self.playlist:
-            print("No tracks in playlist")
+            logger.info("No tracks in playlist")
             return False
         
         if track_index is not None:
@@ -403,8 +531,13 @@ class SpotifyLikePlayer:
         if self.current_track_index >= len(self.playlist):
             self.current_track_index = 0
         
+        if self.shuffle:
+            # Keep shuffle history in step with tracks picked directly
+            self._sync_shuffle_order()
+            self.shuffle_order.select(self.current_track_index)
+        
         if not self.pygame_ready:
-            print("Pygame mixer not ready - cannot play audio internally")
+            logger.warning("Pygame mixer not ready - cannot play audio internally")
             return False
         
         try:
@@ -417,14 +550,16 @@ class SpotifyLikePlayer:
                 track_path = track_item
                 self.current_track = track_item
             
-            # Stop any currently playing music
-            pygame.mixer.music.stop()
-            
-            # Load and play the track
-            print(f"Loading track: {os.path.basename(track_path)}")
-            pygame.mixer.music.load(track_path)
-            pygame.mixer.music.set_volume(self.volume)
-            pygame.mixer.music.play()
+            # Stop whatever plays, then load and play the track - queued in order on the engine
+            logger.debug("Loading track: %s", os.path.basename(track_path))
+            use_stream = self.playback_engine == "stream" and StreamingPlayback.can_stream(track_path)
+            self.engine.stop(on_done=self._release_outputs)
+            if use_stream:
+                # Chunked decode into a bounded ring buffer - constant memory for long tracks
+                self.engine.call('load', self._start_stream, track_path)
+            else:
+                self.engine.load_and_play(track_path, volume=self._effective_volume(),
+                                          on_done=lambda played: played or self._on_load_failed(track_path))
             
             self.is_playing = True
             self.is_paused = False
@@ -438,6 +573,14 @@ class SpotifyLikePlayer:
             else:
                 self.duration = 0.0
             
+            # Measure loudness off the UI once per track; the gain is applied when it arrives
+            self._request_loudness_analysis(self.current_track)
+            self._load_waveform(self.current_track)
+            
+            # Build the MP3 seek index in the background for fast fallback seeks
+            if not use_stream:
+                self.seeker.prepare_index(track_path)
+            
             # Start background thread to track playback
             self.stop_event.clear()
             if self.player_thread and self.player_thread.is_alive():
@@ -449,34 +592,143 @@ class SpotifyLikePlayer:
             self.player_thread = threading.Thread(target=self._playback_monitor, daemon=True)
             self.player_thread.start()
             
-            print(f"Now playing: {os.path.basename(track_path)}")
+            logger.info("Now playing: %s", os.path.basename(track_path))
             return True
         except Exception as e:
-            print(f"Playback error: {e}")
+            logger.error("Playback error: %s", e)
             # Don't fall back to system player - keep it internal
             return False
     
     def pause(self):
         """Pause playback"""
         if self.pygame_ready and self.is_playing:
-            pygame.mixer.music.pause()
+            self.engine.pause(on_done=lambda _: self.stream and self.stream.pause())
+            self.position = self.get_position()
             self.is_paused = True
     
     def resume(self):
         """Resume playback"""
         if self.pygame_ready and self.is_paused:
-            pygame.mixer.music.unpause()
+            self.engine.resume(on_done=lambda _: self.stream and self.stream.resume())
+            self.start_time = time.time()
             self.is_paused = False
     
     def stop(self):
         """Stop playback"""
         if self.pygame_ready:
-            pygame.mixer.music.stop()
+            self.engine.stop(on_done=self._release_outputs)
         self.is_playing = False
         self.is_paused = False
         self.position = 0
         self.stop_event.set()
     
+    def _effective_volume(self):
+        """User volume scaled by the current track's normalization gain (mixer caps at 1.0)"""
+        volume = self.volume
+        if self.normalize_loudness and isinstance(self.current_track, dict):
+            volume *= gain_to_scale(self.current_track.get('gain_db'))
+        return max(0.0, min(1.0, volume))
+    
+    def _apply_volume(self):
+        """Push the effective volume to whichever output is playing (coalesced on the engine)"""
+        if not self.pygame_ready:
+            return
+        self.engine.set_volume(self._effective_volume(),
+                               on_done=lambda volume: self.stream and self.stream.set_volume(volume))
+    
+    def _request_loudness_analysis(self, track):
+        """Queue background loudness analysis for a library track without a cached gain"""
+        if not isinstance(track, dict) or track.get('id') is None or track.get('gain_db') is not None:
+            return False
+        
+        def on_analyzed(track_id, result):
+            # Runs on a pool thread of this process
+            if not result:
+                return
+            self.library.set_analysis(track_id, result)
+            for item in self.playlist:
+                if isinstance(item, dict) and item.get('id') == track_id:
+                    item.update(result)
+            if isinstance(self.current_track, dict) and self.current_track.get('id') == track_id:
+                logger.debug("Loudness %s LUFS - applying %+.1f dB", result['loudness_lufs'], result['gain_db'])
+                self._apply_volume()
+        
+        return self.loudness.analyze_async(track['id'], track['path'], on_analyzed)
+    
+    def _load_waveform(self, track):
+        """Use cached waveform peaks for a library track, or compute them in the background"""
+        self._waveform = None
+        if not isinstance(track, dict) or track.get('id') is None:
+            return False
+        try:
+            source_mtime = os.path.getmtime(track['path'])
+        except OSError:
+            return False
+        
+        peaks = decode_peaks(self.library.get_waveform(track['id'], source_mtime))
+        if peaks:
+            self._waveform = (track['id'], peaks)
+            return True
+        
+        def on_computed(track_id, blob):
+            # Runs on a pool thread of this process
+            if not blob:
+                return
+            self.library.set_waveform(track_id, blob, source_mtime)
+            if isinstance(self.current_track, dict) and self.current_track.get('id') == track_id:
+                self._waveform = (track_id, decode_peaks(blob))
+        
+        return self.loudness.analyze_async(track['id'], track['path'], on_computed, func=compute_waveform)
+    
+    def get_waveform(self):
+        """(mins, maxs) peaks of the current track, None until they are available"""
+        waveform = self._waveform
+        if waveform and isinstance(self.current_track, dict) and self.current_track.get('id') == waveform[0]:
+            return waveform[1]
+        return None
+    
+    def set_loudness_normalization(self, enabled):
+        """Turn per-track loudness normalization on/off"""
+        self.normalize_loudness = enabled
+        self._apply_volume()
+        self._save_settings()
+    
+    def _close_stream(self):
+        """Stop the streaming engine and release its decoder"""
+        if self.stream:
+            self.engine.remove_tick_hook(self.stream.feed)
+            self.stream.stop()
+            self.stream = None
+    
+    def _release_outputs(self, _result=None):
+        """Close the stream and the seek file of the previous track (engine thread)"""
+        self._close_stream()
+        self.seeker.release()
+    
+    def _start_stream(self, track_path):
+        """Start streaming playback of a track (engine thread)"""
+        self.stream = StreamingPlayback(track_path, buffer_seconds=self.stream_buffer_seconds)
+        self.stream.set_volume(self._effective_volume())
+        self.stream.start()
+        self.engine.add_tick_hook(self.stream.feed, self.stream.feed_interval)
+        return True
+    
+    def _on_load_failed(self, track_path):
+        """The engine could not load a track - stop instead of waiting for it to finish"""
+        logger.error("Playback error: could not load %s", os.path.basename(track_path))
+        self.is_playing = False
+        self.is_paused = False
+        self.stop_event.set()
+    
+    def set_playback_engine(self, engine, buffer_seconds=None):
+        """Choose "music" or "stream" playback (applies from the next track)"""
+        if engine not in ("music", "stream"):
+            raise ValueError(f"Unknown playback engine: {engine}")
+        self.playback_engine = engine
+        if buffer_seconds is not None:
+            self.stream_buffer_seconds = max(0.2, float(buffer_seconds))
+        self._save_settings()
+    
     def next_track(self):
         """Play next track"""
         if not self.playlist:
@@ -485,36 +737,55 @@ class SpotifyLikePlayer:
         old_index = self.current_track_index
         
         if self.shuffle:
-            import random
-            self.current_track_index = random.randint(0, len(self.playlist) - 1)
-            print(f"Shuffle: Moving from track {old_index} to {self.current_track_index}")
+            self._sync_shuffle_order()
+            self.current_track_index = self.shuffle_order.next()
+            logger.debug("Shuffle: Moving from track %s to %s", old_index, self.current_track_index)
         else:
             self.current_track_index = (self.current_track_index + 1) % len(self.playlist)
-            print(f"Next track: Moving from track {old_index} to {self.current_track_index} (total: {len(self.playlist)})")
+            logger.debug("Next track: Moving from track %s to %s (total: %s)", old_index, self.current_track_index, len(self.playlist))
             
             # If we looped back to 0, it means we reached the end
             if old_index == len(self.playlist) - 1 and self.current_track_index == 0:
-                print("Playlist looped back to first track!")
+                logger.debug("Playlist looped back to first track!")
         
         self.play()
     
     def previous_track(self):
-        """Play previous track"""
+        """Play previous track (walks back through shuffle history when shuffling)"""
         if not self.playlist:
             return
         
-        self.current_track_index = (self.current_track_index - 1) % len(self.playlist)
+        previous_index = None
+        if self.shuffle:
+            self._sync_shuffle_order()
+            previous_index = self.shuffle_order.previous()
+        
+        if previous_index is None:
+            previous_index = (self.current_track_index - 1) % len(self.playlist)
+        
+        self.current_track_index = previous_index
         self.play()
     
+    def set_shuffle(self, enabled):
+        """Turn shuffle on/off; a fresh shuffle order starts from the current track"""
+        self.shuffle = enabled
+        if enabled:
+            self.shuffle_order.reset(range(len(self.playlist)), current=self.current_track_index if self.playlist else None)
+        else:
+            self.shuffle_order.reset(())
+        self._save_settings()
+    
+    def _sync_shuffle_order(self):
+        """Rebuild the shuffle order if it no longer matches the playlist"""
+        if len(self.shuffle_order) != len(self.playlist):
+            self.shuffle_order.reset(range(len(self.playlist)), current=self.current_track_index)
+    
     def set_volume(self, volume):
         """Set volume (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
         if self.pygame_ready:
-            try:
-                pygame.mixer.music.set_volume(self.volume)
-                print(f"Volume set to: {int(self.volume * 100)}%")
-            except Exception as e:
-                print(f"Error setting volume: {e}")
+            self._apply_volume()
+            logger.debug("Volume set to: %s%%", int(self.volume * 100))
         self._save_settings()
     
     def _playback_monitor(self):
@@ -522,42 +793,57 @@ class SpotifyLikePlayer:
         while not self.stop_event.is_set() and self.is_playing:
             if self.pygame_ready:
                 try:
-                    # Check if music is still playing
-                    if not pygame.mixer.music.get_busy() and not self.is_paused:
-                        print(f"Track finished - Current mode: {self.repeat_mode}, Track: {self.current_track_index}/{len(self.playlist)-1}")
+                    # The engine detects the end of the track; queued commands (a new track,
+                    # a seek) mean the finished state is about to change
+                    if self.stream:
+                        finished = self.stream.is_finished()
+                    else:
+                        snapshot = self.engine.snapshot()
+                        finished = snapshot['state'] == 'finished' and not snapshot['pending']
+                    if finished and not self.is_paused:
+                        logger.debug("Track finished - Current mode: %s, Track: %s/%s", self.repeat_mode, self.current_track_index, len(self.playlist) - 1)
                         self._handle_track_finished()
                         
                         # Continue monitoring if we're still playing
                         if not self.is_playing:
                             break
                 except Exception as e:
-                    print(f"Playback monitor error: {e}")
+                    logger.error("Playback monitor error: %s", e)
                     break
             time.sleep(0.5)
     
     def _handle_track_finished(self):
         """Handle what happens when a track finishes playing"""
         if self.repeat_mode == "track":
-            print("🔂 Repeating current track")
+            logger.debug("🔂 Repeating current track")
             self.play(self.current_track_index)
+        elif self.shuffle and len(self.playlist) > 1:
+            self._sync_shuffle_order()
+            if self.repeat_mode == "playlist" or self.shuffle_order.has_next_in_cycle():
+                logger.debug("🔀 Playing next shuffled track")
+                self.current_track_index = self.shuffle_order.next()
+                self.play(self.current_track_index)
+            else:
+                logger.debug("⏹️ All shuffled tracks played - stopping (repeat OFF)")
+                self.stop()
         elif self.repeat_mode == "playlist":
-            print("🔁 Playlist repeat mode")
+            logger.debug("🔁 Playlist repeat mode")
             # Check if we're at the last track
             if self.current_track_index >= len(self.playlist) - 1:
-                print("🔄 End of playlist - looping back to first track")
+                logger.debug("🔄 End of playlist - looping back to first track")
                 self.current_track_index = 0
                 self.play(0)
             else:
-                print("▶️ Moving to next track in playlist")
+                logger.debug("▶️ Moving to next track in playlist")
                 self.current_track_index += 1
                 self.play(self.current_track_index)
         else:  # repeat_mode == "off"
             if self.current_track_index < len(self.playlist) - 1:
-                print("▶️ Playing next track (repeat OFF)")
+                logger.debug("▶️ Playing next track (repeat OFF)")
                 self.current_track_index += 1
                 self.play(self.current_track_index)
             else:
-                print("⏹️ End of playlist - stopping (repeat OFF)")
+                logger.debug("⏹️ End of playlist - stopping (repeat OFF)")
                 self.stop()
     
     def get_current_track_info(self):
@@ -574,7 +860,7 @@ class SpotifyLikePlayer:
                     'duration': track_item.get('duration', '0:00'),
                     'genre': track_item.get('genre', 'Unknown'),
                     'year': track_item.get('year', ''),
-                    'artwork': track_item.get('artwork'),
+                    'artwork': self.get_artwork_image(track_item),
                     'filename': os.path.basename(track_item['path']),
                     'path': track_item['path'],
                     'index': self.current_track_index,
@@ -606,7 +892,7 @@ class SpotifyLikePlayer:
                     'duration': track_item.get('duration', '0:00'),
                     'genre': track_item.get('genre', 'Unknown'),
                     'year': track_item.get('year', ''),
-                    'artwork': track_item.get('artwork'),
+                    'artwork': self.get_artwork_image(track_item),
                     'filename': os.path.basename(track_item['path']),
                     'path': track_item['path'],
                     'index': 0,
@@ -630,7 +916,15 @@ class SpotifyLikePlayer:
 
 
 # Global player instance that persists across window closures
-_global_player = SpotifyLikePlayer()
+_global_player = None
+
+
+def get_global_player():
+    """The shared player, created on first use (mixer init, settings and library load)"""
+    global _global_player
+    if _global_player is None:
+        _global_player = SpotifyLikePlayer()
+    return _global_player
 
 
 class MediaPlayerButton:
@@ -639,9 +933,23 @@ class MediaPlayerButton:
         self.parent_root = parent_root
         self.bg_color = bg_color
         self.player_window = None
-        self.player = _global_player  # Use global player instance
+        self.player = None  # Global player instance, created when the player is first opened
         self.update_timer = None
+        self.progress_timer = None  # Fast progress bar loop, only runs while visible and playing
+        self._progress_items = None  # (background, waveform, played waveform, fill, handle) canvas item ids
+        self._progress_drawn = None  # Last drawn (width, height, fill width, peaks) - skips no-op updates
+        self._waveform_shape = None  # (peaks, width, height, top points, bottom points) for the drawn waveform
+        self._engine_state = None  # Last (state, path) seen from the audio engine
+        self._snapshot_pump = None
         self._create_floating_button()
+    
+    def _ensure_player(self):
+        """Create (or attach to) the global player - defers pygame/mutagen/PIL until first use"""
+        if self.player is None:
+            self.player = get_global_player()
+            # Engine state changes (track ended, paused, next track) reach the UI without polling pygame
+            self._snapshot_pump = TkSnapshotPump(self.parent_root, self.player.engine, self._on_engine_snapshot)
+        return self.player
 
     def _create_floating_button(self):
         # Create a Toplevel window for the media player button
@@ -673,8 +981,7 @@ class MediaPlayerButton:
     def _on_click(self, event):
         """Handle button click - show media player menu"""
         if self.player_window and self.player_window.winfo_exists():
-            self.player_window.destroy()
-            self.player_window = None
+            self._close_player()
         else:
             self._show_media_player()
 
@@ -695,6 +1002,7 @@ class MediaPlayerButton:
 
     def _show_media_player(self):
         """Show the Framer-style linear design media player"""
+        self._ensure_player()
         self.player_window = tk.Toplevel(self.parent_root)
         self.player_window.title("🎵 Linear Music Player")
         self.player_window.geometry("420x700")  # Larger window
@@ -767,19 +1075,9 @@ class MediaPlayerButton:
         art_frame.place(relx=0.5, rely=0.5, anchor="center")
         art_frame.pack_propagate(False)
         
-        # Album artwork display
+        # Album artwork display (thumbnails come from the artwork cache)
         track_info = self.player.get_current_track_info()
-        artwork = None
-        
-        # Extract artwork for current track if not already available
-        if track_info and not track_info.get('artwork'):
-            current_track = self.player.playlist[self.player.current_track_index] if self.player.playlist else None
-            if current_track:
-                artwork = self.player._extract_artwork_for_track(current_track)
-                if artwork and isinstance(current_track, dict):
-                    current_track['artwork'] = artwork
-        elif track_info:
-            artwork = track_info.get('artwork')
+        artwork = track_info.get('artwork') if track_info else None
         
         if artwork:
             # Display actual album artwork
@@ -886,10 +1184,16 @@ class MediaPlayerButton:
         self.progress_canvas = tk.Canvas(progress_bar_container, height=6, bg="#1A1A1C", 
                                         highlightthickness=0, relief="flat")
         self.progress_canvas.pack(fill="x")
+        self._progress_items = None
+        self._progress_drawn = None
         
         # Bind click events for seeking
         self.progress_canvas.bind("<Button-1>", self._on_progress_click)
         self.progress_canvas.bind("<B1-Motion>", self._on_progress_drag)
+        self.progress_canvas.bind("<Configure>", lambda e: self._update_progress_bar())
+        
+        # Progress animation only runs while the window is shown
+        self.player_window.bind("<Map>", lambda e: self._ensure_progress_updates(), add="+")
         
         # Linear control panel with modern design
         controls_card = tk.Frame(self.player_window, bg="#0F0F11", height=80)
@@ -1020,6 +1324,14 @@ class MediaPlayerButton:
                            padx=15, pady=6)
         add_btn.pack(side="right")
         
+        library_btn = tk.Button(header_content, text="🔍 Library", command=self._show_library_search,
+                               font=("Inter", 10, "bold"),
+                               bg="#1A1A1C", fg="#FFFFFF",
+                               activebackground="#333335", activeforeground="#00FF88",
+                               relief="flat", bd=0, highlightthickness=0,
+                               padx=12, pady=6)
+        library_btn.pack(side="right", padx=(0, 8))
+        
         # Linear playlist container
         playlist_container = tk.Frame(playlist_card, bg="#0B0B0D")
         playlist_container.pack(fill="both", expand=True, padx=20, pady=(0, 20))
@@ -1032,12 +1344,12 @@ class MediaPlayerButton:
                                 activebackground="#333335", width=6, relief="flat", bd=0)
         scrollbar.pack(fill="y")
         
-        # Modern listbox design
-        self.playlist_listbox = tk.Listbox(playlist_container, yscrollcommand=scrollbar.set,
-                                          bg="#0B0B0D", fg="#FFFFFF", 
-                                          selectbackground="#333335", selectforeground="#00FF88",
-                                          font=("Inter", 10), bd=0, highlightthickness=0,
-                                          activestyle="none")
+        # Virtualized list - only visible rows exist as canvas items
+        self.playlist_listbox = VirtualListView(playlist_container, row_text=self._playlist_row_text,
+                                                yscrollcommand=scrollbar.set,
+                                                bg="#0B0B0D", fg="#FFFFFF",
+                                                select_bg="#333335", select_fg="#00FF88",
+                                                font=("Inter", 10))
         self.playlist_listbox.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=self.playlist_listbox.yview)
         
@@ -1066,35 +1378,116 @@ class MediaPlayerButton:
         # Don't auto-close on focus out for Spotify-like experience
         self.player_window.focus_set()
 
+    def _position_from_event(self, event):
+        """Convert a progress bar mouse event to a track position, None if not seekable"""
+        if not self.player.playlist or self.player.duration <= 0:
+            return None
+        
+        canvas_width = self.progress_canvas.winfo_width()
+        if canvas_width <= 0:
+            return None
+        
+        # Ensure click is within bounds
+        click_x = max(0, min(event.x, canvas_width))
+        return (click_x / canvas_width) * self.player.duration
+    
     def _on_progress_click(self, event):
         """Handle click on progress bar for seeking"""
-        if not self.player.playlist or self.player.duration <= 0:
+        seek_position = self._position_from_event(event)
+        if seek_position is None:
             return
         
-        # Calculate position based on click
-        canvas_width = self.progress_canvas.winfo_width()
-        if canvas_width > 0:
-            # Ensure click is within bounds
-            click_x = max(0, min(event.x, canvas_width))
-            click_ratio = click_x / canvas_width
-            seek_position = click_ratio * self.player.duration
-            
-            # Only seek if it's a reasonable position
-            if 0 <= seek_position <= self.player.duration:
-                success = self.player.seek_to(seek_position)
-                if success:
-                    self._update_progress_bar()
-                    # Update time display immediately
-                    if hasattr(self, 'current_time_label'):
-                        self.current_time_label.config(text=self.player._format_time(seek_position))
+        if self.player.seek_to(seek_position):
+            self._update_progress_bar()
+            # Update time display immediately
+            if hasattr(self, 'current_time_label'):
+                self.current_time_label.config(text=self.player._format_time(seek_position))
     
     def _on_progress_drag(self, event):
-        """Handle dragging on progress bar for seeking"""
-        self._on_progress_click(event)  # Same logic as click
+        """Handle dragging on progress bar - seeks are coalesced to the latest target"""
+        seek_position = self._position_from_event(event)
+        if seek_position is None:
+            return
+        
+        if self.player.request_seek(seek_position):
+            self._update_progress_bar()
+            if hasattr(self, 'current_time_label'):
+                self.current_time_label.config(text=self.player._format_time(seek_position))
+    
+    def _is_player_visible(self):
+        """True if the player window exists and is mapped (not withdrawn or minimized)"""
+        try:
+            return bool(self.player_window and self.player_window.winfo_viewable())
+        except tk.TclError:
+            return False
+    
+    def _ensure_progress_updates(self):
+        """Start the fast progress loop if it should run and is not already running"""
+        if self.progress_timer is None and self._is_player_visible() \
+                and self.player.is_playing and not self.player.is_paused:
+            self._progress_tick()
+    
+    def _progress_tick(self):
+        """Adaptive progress loop: ~30 Hz while visible and playing, stops otherwise"""
+        self.progress_timer = None
+        if not self._is_player_visible():
+            return
+        
+        self._update_progress_bar()
+        if hasattr(self, 'current_time_label'):
+            current_time = self.player._format_time(self.player.get_position())
+            if self.current_time_label.cget("text") != current_time:
+                self.current_time_label.config(text=current_time)
+        
+        if self.player.is_playing and not self.player.is_paused:
+            self.progress_timer = self.player_window.after(33, self._progress_tick)
+    
+    def _create_progress_items(self):
+        """Create the progress bar canvas items once; updates only move them"""
+        canvas = self.progress_canvas
+        background = canvas.create_rectangle(0, 0, 0, 0, fill="#1A1A1C", outline="")
+        waveform = canvas.create_polygon(0, 0, 0, 0, fill="#3A3A3C", outline="", state="hidden")
+        played = canvas.create_polygon(0, 0, 0, 0, fill="#00FF88", outline="", state="hidden")
+        fill = canvas.create_rectangle(0, 0, 0, 0, fill="#00FF88", outline="", state="hidden")
+        handle = canvas.create_oval(0, 0, 0, 0, fill="#FFFFFF", outline="#00FF88", width=2, state="hidden")
+        self._progress_items = (background, waveform, played, fill, handle)
+        self._progress_drawn = None
+        self._waveform_shape = None
+    
+    def _waveform_points(self, peaks, width, height):
+        """Top and bottom outline y per pixel column for the peaks, cached per size"""
+        shape = self._waveform_shape
+        if shape and shape[0] is peaks and shape[1:3] == (width, height):
+            return shape[3], shape[4]
+        
+        mins, maxs = peaks
+        count = len(maxs)
+        middle = height / 2
+        half = max(1.0, height / 2 - 1)
+        tops, bottoms = [], []
+        for x in range(width + 1):
+            bucket = min(count - 1, x * count // width)
+            top = middle - maxs[bucket] * half
+            bottom = middle - mins[bucket] * half
+            # Keep silent passages visible as a 1px line
+            tops.append(min(top, middle - 0.5))
+            bottoms.append(max(bottom, middle + 0.5))
+        self._waveform_shape = (peaks, width, height, tops, bottoms)
+        return tops, bottoms
+    
+    @staticmethod
+    def _waveform_polygon(tops, bottoms, end):
+        """Flat polygon coords outlining columns 0..end (top edge, then bottom edge back)"""
+        coords = []
+        for x in range(end + 1):
+            coords.extend((x, tops[x]))
+        for x in range(end, -1, -1):
+            coords.extend((x, bottoms[x]))
+        return coords
     
     def _update_progress_bar(self):
-        """Update the visual progress bar"""
-        if not hasattr(self, 'progress_canvas'):
+        """Update the visual progress bar by moving persistent items"""
+        if not hasattr(self, 'progress_canvas') or not self._is_player_visible():
             return
         
         try:
@@ -1104,32 +1497,56 @@ class MediaPlayerButton:
             if canvas_width <= 0 or canvas_height <= 0:
                 return
             
-            # Clear canvas
-            self.progress_canvas.delete("all")
-            
-            # Draw background
-            self.progress_canvas.create_rectangle(0, 0, canvas_width, canvas_height, 
-                                                 fill="#1A1A1C", outline="")
+            if self._progress_items is None:
+                self._create_progress_items()
             
-            # Draw progress if playing
+            progress_width = 0
             if self.player.duration > 0:
                 current_pos = self.player.get_position()
                 progress_ratio = min(current_pos / self.player.duration, 1.0)
                 progress_width = int(canvas_width * progress_ratio)
-                
+            
+            # Nothing moved by a whole pixel - leave the canvas alone
+            peaks = self.player.get_waveform()
+            previous = self._progress_drawn
+            drawn = (canvas_width, canvas_height, progress_width, peaks)
+            if previous and previous[:3] == drawn[:3] and previous[3] is peaks:
+                return
+            self._progress_drawn = drawn
+            
+            background, waveform, played, fill, handle = self._progress_items
+            canvas = self.progress_canvas
+            canvas.coords(background, 0, 0, canvas_width, canvas_height)
+            
+            if peaks:
+                # Precomputed peaks: one polygon for the track, one for the played part
+                tops, bottoms = self._waveform_points(peaks, canvas_width, canvas_height)
+                if not previous or previous[:2] != drawn[:2] or previous[3] is not peaks:
+                    canvas.coords(waveform, *self._waveform_polygon(tops, bottoms, canvas_width))
+                    canvas.itemconfigure(waveform, state="normal")
+                canvas.itemconfigure(fill, state="hidden")
+                if progress_width > 0:
+                    canvas.coords(played, *self._waveform_polygon(tops, bottoms, progress_width))
+                    canvas.itemconfigure(played, state="normal")
+                else:
+                    canvas.itemconfigure(played, state="hidden")
+            else:
+                canvas.itemconfigure(waveform, state="hidden")
+                canvas.itemconfigure(played, state="hidden")
                 if progress_width > 0:
-                    # Draw progress bar
-                    self.progress_canvas.create_rectangle(0, 0, progress_width, canvas_height, 
-                                                         fill="#00FF88", outline="")
-                    
-                    # Draw progress handle
-                    if progress_width > 2:
-                        handle_x = progress_width
-                        self.progress_canvas.create_oval(handle_x-4, canvas_height//2-4, 
-                                                        handle_x+4, canvas_height//2+4, 
-                                                        fill="#FFFFFF", outline="#00FF88", width=2)
+                    canvas.coords(fill, 0, 0, progress_width, canvas_height)
+                    canvas.itemconfigure(fill, state="normal")
+                else:
+                    canvas.itemconfigure(fill, state="hidden")
+            
+            if progress_width > 2:
+                canvas.coords(handle, progress_width - 4, canvas_height // 2 - 4,
+                              progress_width + 4, canvas_height // 2 + 4)
+                canvas.itemconfigure(handle, state="normal")
+            else:
+                canvas.itemconfigure(handle, state="hidden")
         except Exception as e:
-            print(f"Error updating progress bar: {e}")
+            logger.error("Error updating progress bar: %s", e)
 
     def _add_track(self):
         """Add track to playlist"""
@@ -1148,29 +1565,136 @@ class MediaPlayerButton:
         
         self._update_playlist_display()
 
+    def _show_library_search(self):
+        """Open the library search window (search as you type, add results to the queue)"""
+        if getattr(self, 'library_window', None) and self.library_window.winfo_exists():
+            self.library_window.lift()
+            return
+        
+        self.library_window = tk.Toplevel(self.player_window)
+        self.library_window.title("Music Library")
+        self.library_window.geometry("420x460")
+        self.library_window.configure(bg="#0B0B0D")
+        self.library_window.attributes('-topmost', True)
+        
+        top = tk.Frame(self.library_window, bg="#0B0B0D")
+        top.pack(fill="x", padx=12, pady=12)
+        
+        search_var = tk.StringVar()
+        search_entry = tk.Entry(top, textvariable=search_var, font=("Inter", 11),
+                                bg="#1A1A1C", fg="#FFFFFF", insertbackground="#00FF88",
+                                relief="flat", bd=0, highlightthickness=1,
+                                highlightbackground="#222224", highlightcolor="#00FF88")
+        search_entry.pack(side="left", fill="x", expand=True, ipady=6)
+        
+        import_btn = tk.Button(top, text="+ Folder", font=("Inter", 9, "bold"),
+                               bg="#1A1A1C", fg="#FFFFFF", relief="flat", bd=0,
+                               activebackground="#333335", activeforeground="#00FF88", padx=10,
+                               command=lambda: self._import_library_folder(status_label, search_var))
+        import_btn.pack(side="right", padx=(8, 0), ipady=4)
+        
+        results_listbox = tk.Listbox(self.library_window, bg="#0B0B0D", fg="#FFFFFF",
+                                     selectbackground="#333335", selectforeground="#00FF88",
+                                     font=("Inter", 10), bd=0, highlightthickness=0,
+                                     activestyle="none", selectmode="extended")
+        results_listbox.pack(fill="both", expand=True, padx=12)
+        
+        bottom = tk.Frame(self.library_window, bg="#0B0B0D")
+        bottom.pack(fill="x", padx=12, pady=12)
+        
+        status_label = tk.Label(bottom, text=f"{self.player.library.count()} tracks in library",
+                                font=("Inter", 9), bg="#0B0B0D", fg="#888888")
+        status_label.pack(side="left")
+        
+        results = []
+        
+        def run_search(*_):
+            results[:] = self.player.search_library(search_var.get())
+            results_listbox.delete(0, tk.END)
+            for track in results:
+                results_listbox.insert(tk.END, f"{track['artist']} - {track['title']} [{track['duration']}]")
+            if search_var.get().strip():
+                status_label.config(text=f"{len(results)} matches")
+        
+        def add_selected(*_):
+            selected = results_listbox.curselection() or range(len(results))
+            added = self.player.add_library_tracks([results[i]['id'] for i in selected])
+            status_label.config(text=f"Added {added} to queue")
+            self._update_playlist_display()
+        
+        add_btn = tk.Button(bottom, text="Add to Queue", command=add_selected,
+                            font=("Inter", 10, "bold"), bg="#00FF88", fg="#000000",
+                            activebackground="#00DD77", activeforeground="#000000",
+                            relief="flat", bd=0, highlightthickness=0, padx=15, pady=6)
+        add_btn.pack(side="right")
+        
+        search_var.trace_add("write", run_search)
+        results_listbox.bind("<Double-Button-1>", add_selected)
+        results_listbox.bind("<Return>", add_selected)
+        search_entry.focus_set()
+    
+    def _import_library_folder(self, status_label, search_var):
+        """Pick a folder and scan it into the music library in the background"""
+        folder = filedialog.askdirectory(title="Import Music Folder")
+        if not folder:
+            return
+        
+        status_label.config(text="Importing...")
+        
+        # The scan thread only sets the event; Tk polls it, so no Tk call leaves the Tk thread
+        done = threading.Event()
+        
+        def check_done():
+            try:
+                if not status_label.winfo_exists():
+                    return  # Search window closed
+                if not done.is_set():
+                    status_label.after(250, check_done)
+                    return
+                status_label.config(text=f"{self.player.library.count()} tracks in library")
+                search_var.set(search_var.get())
+            except tk.TclError:
+                pass  # Application is closing
+        
+        self.player.import_folder(folder, on_done=done.set)
+        status_label.after(250, check_done)
+
+    def _playlist_row_text(self, index):
+        """Display text for one playlist row (called only for visible rows)"""
+        track = self.player.playlist[index]
+        # Handle both old format (string) and new format (dict)
+        if isinstance(track, dict):
+            artist = track.get('artist', 'Unknown Artist')
+            title = track.get('title', 'Unknown Title')
+            duration = track.get('duration', '0:00')
+            # Format like SpotiDownloader: "Artist - Title [Duration]"
+            display_text = f"{artist} - {title} [{duration}]"
+        else:
+            # Old format - just filename
+            display_text = os.path.basename(track)
+        
+        # Add playing indicator
+        prefix = "♪ " if index == self.player.current_track_index and self.player.is_playing else "  "
+        return f"{prefix}{display_text}"
+    
     def _update_playlist_display(self):
-        """Update the playlist display with rich metadata"""
+        """Refresh the playlist view after tracks were added, removed or reordered"""
         if hasattr(self, 'playlist_listbox'):
-            self.playlist_listbox.delete(0, tk.END)
-            for i, track in enumerate(self.player.playlist):
-                # Handle both old format (string) and new format (dict)
-                if isinstance(track, dict):
-                    artist = track.get('artist', 'Unknown Artist')
-                    title = track.get('title', 'Unknown Title')
-                    duration = track.get('duration', '0:00')
-                    # Format like SpotiDownloader: "Artist - Title [Duration]"
-                    display_text = f"{artist} - {title} [{duration}]"
-                else:
-                    # Old format - just filename
-                    display_text = os.path.basename(track)
-                
-                # Add playing indicator
-                prefix = "♪ " if i == self.player.current_track_index and self.player.is_playing else "  "
-                self.playlist_listbox.insert(tk.END, f"{prefix}{display_text}")
-            
-            # Highlight current track
-            if self.player.playlist and self.player.current_track_index < len(self.player.playlist):
-                self.playlist_listbox.selection_set(self.player.current_track_index)
+            self.playlist_listbox.set_count(len(self.player.playlist))
+            self._update_playlist_highlight()
+    
+    def _update_playlist_highlight(self):
+        """Move the current-track highlight in place (no rebuild)"""
+        if not hasattr(self, 'playlist_listbox'):
+            return
+        
+        if self.player.playlist and self.player.current_track_index < len(self.player.playlist):
+            current = self.player.current_track_index
+            self.playlist_listbox.set_current(current)
+            # The playing indicator depends on play state as well as the index
+            self.playlist_listbox.refresh_row(current)
+        else:
+            self.playlist_listbox.set_current(None)
 
     def _on_track_double_click(self, event):
         """Handle double-click on playlist track"""
@@ -1235,8 +1759,7 @@ class MediaPlayerButton:
 
     def _toggle_shuffle(self):
         """Toggle shuffle mode"""
-        self.player.shuffle = not self.player.shuffle
-        self.player._save_settings()
+        self.player.set_shuffle(not self.player.shuffle)
         
         # Update button appearance with linear design
         if hasattr(self, 'shuffle_btn'):
@@ -1245,7 +1768,7 @@ class MediaPlayerButton:
             else:
                 self.shuffle_btn.config(bg="#1A1A1C", fg="#FFFFFF")
         
-        print(f"Shuffle mode: {'ON' if self.player.shuffle else 'OFF'}")
+        logger.info("Shuffle mode: %s", 'ON' if self.player.shuffle else 'OFF')
 
     def _toggle_repeat(self):
         """Toggle repeat mode"""
@@ -1273,7 +1796,7 @@ class MediaPlayerButton:
             "playlist": "🔁 Repeat PLAYLIST - Loop entire playlist",
             "track": "🔂 Repeat TRACK - Loop current song"
         }
-        print(mode_descriptions[self.player.repeat_mode])
+        logger.info("%s", mode_descriptions[self.player.repeat_mode])
 
     def _on_volume_change(self, value):
         """Handle volume slider change"""
@@ -1286,7 +1809,11 @@ class MediaPlayerButton:
     def _start_ui_updates(self):
         """Start periodic UI updates"""
         if self.player_window:
-            self._update_ui_elements()
+            if self._is_player_visible():
+                self._update_ui_elements()
+            else:
+                # Withdrawn/minimized: only the floating button is on screen
+                self._update_main_button_icon()
             self.update_timer = self.player_window.after(1000, self._start_ui_updates)
 
     def _update_ui_elements(self):
@@ -1323,14 +1850,6 @@ class MediaPlayerButton:
             if hasattr(self, 'art_label'):
                 artwork = track_info.get('artwork')
                 
-                # Extract artwork if not available
-                if not artwork and self.player.playlist:
-                    current_track = self.player.playlist[self.player.current_track_index]
-                    if isinstance(current_track, dict):
-                        artwork = self.player._extract_artwork_for_track(current_track)
-                        if artwork:
-                            current_track['artwork'] = artwork
-                
                 if artwork:
                     self.art_label.config(image=artwork, text="")
                     self.art_label.image = artwork  # Keep reference
@@ -1381,8 +1900,9 @@ class MediaPlayerButton:
                 self.repeat_btn.config(text=repeat_icons[self.player.repeat_mode], 
                                       bg="#1A1A1C", fg="#FFFFFF")
         
-        # Update progress bar and time display
+        # Update progress bar and time display (fast loop takes over while playing)
         self._update_progress_bar()
+        self._ensure_progress_updates()
         if hasattr(self, 'current_time_label'):
             current_time = self.player._format_time(self.player.get_position())
             self.current_time_label.config(text=current_time)
@@ -1390,13 +1910,24 @@ class MediaPlayerButton:
         if hasattr(self, 'total_time_label') and track_info:
             self.total_time_label.config(text=track_info.get('duration', '0:00'))
         
-        # Update playlist display
-        self._update_playlist_display()
+        # Update current track highlight
+        self._update_playlist_highlight()
+
+    def _on_engine_snapshot(self, snapshot):
+        """Refresh the play state right after the audio engine changed state (Tk thread)"""
+        engine_state = (snapshot['state'], snapshot['path'])
+        if engine_state == self._engine_state:
+            return
+        self._engine_state = engine_state
+        if self.player_window and self._is_player_visible():
+            self._update_ui_elements()
+        else:
+            self._update_main_button_icon()
 
     def _update_main_button_icon(self):
         """Update main button icon based on playback state"""
         try:
-            if self.player.is_playing and not self.player.is_paused:
+            if self.player and self.player.is_playing and not self.player.is_paused:
                 # Change to pause icon (two vertical bars)
                 self.media_canvas.delete(self.play_icon)
                 self.play_icon = [
@@ -1418,6 +1949,10 @@ class MediaPlayerButton:
             self.player_window.after_cancel(self.update_timer)
             self.update_timer = None
         
+        if self.progress_timer:
+            self.player_window.after_cancel(self.progress_timer)
+            self.progress_timer = None
+        
         if self.player_window:
             self.player_window.destroy()
             self.player_window = None
\ No newline at end of file
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox
 from timer_app.ui.widgets.browser_widget import BrowserManager
+from timer_app.infrastructure.profiling import get_profiler
+from timer_app.infrastructure.app_logging import get_recent_logs
 
 class MenuButton:
     """Handles menu button functionality as floating window - SRP"""
@@ -64,7 +66,7 @@ class MenuButton:
         """Show the menu window"""
         self.menu_window = tk.Toplevel(self.parent_root)
         self.menu_window.title("Timer Menu")
-        self.menu_window.geometry("200x300")
+        self.menu_window.geometry("200x380")
         self.menu_window.configure(bg="#2b2b2b")
         self.menu_window.resizable(False, False)
         self.menu_window.attributes('-topmost', True)
@@ -75,7 +77,7 @@ class MenuButton:
             button_y = self.menu_win.winfo_y()
             menu_x = button_x + 35  # Offset from button
             menu_y = button_y
-            self.menu_window.geometry(f"200x300+{menu_x}+{menu_y}")
+            self.menu_window.geometry(f"200x380+{menu_x}+{menu_y}")
         except:
             pass
         
@@ -99,6 +101,10 @@ class MenuButton:
         self._create_menu_item(menu_frame, "⚙️ Settings", self._show_settings)
         self._create_menu_item(menu_frame, "📝 Export Session", self._export_session)
         self._create_menu_item(menu_frame, "🔄 Reset All Data", self._reset_all_data)
+        profiler = get_profiler()
+        profiling_label = "⏹️ Stop Profiling" if profiler and profiler.is_active else "⏱️ Start Profiling"
+        self._create_menu_item(menu_frame, profiling_label, self._toggle_profiling)
+        self._create_menu_item(menu_frame, "📜 View Logs", self._show_logs)
         self._create_menu_item(menu_frame, "❓ Help & Shortcuts", self._show_help)
         self._create_menu_item(menu_frame, "ℹ️ About", self._show_about)
         
@@ -190,6 +196,51 @@ class MenuButton:
                                "All session data has been reset.\n"
                                "The application will restart with fresh data.")
 
+    def _toggle_profiling(self):
+        """Start profiling, or stop it and write the report to profiles/"""
+        self._close_menu()
+        profiler = get_profiler(self.parent_root)
+        if profiler.is_active:
+            report_path = profiler.stop()
+            messagebox.showinfo("Profiling",
+                               f"Profiling stopped.\n\nReport written to:\n{report_path}")
+        else:
+            profiler.start()
+            messagebox.showinfo("Profiling",
+                               "Profiling started.\n\n"
+                               "Stop it from this menu, or stop the session,\n"
+                               "to write a report into the profiles folder.")
+
+    def _show_logs(self):
+        """Show the most recent log records from the in-memory buffer"""
+        self._close_menu()
+        logs_window = tk.Toplevel(self.parent_root)
+        logs_window.title("Recent Logs")
+        logs_window.geometry("640x360")
+        logs_window.configure(bg="#2b2b2b")
+        logs_window.attributes('-topmost', True)
+
+        logs_text = tk.Text(logs_window, bg="#1a1a1a", fg="#e0e0e0", font=("Consolas", 9),
+                            wrap=tk.NONE, relief="flat", highlightthickness=0)
+        scrollbar = tk.Scrollbar(logs_window, command=logs_text.yview)
+        logs_text.config(yscrollcommand=scrollbar.set)
+
+        def refresh():
+            logs_text.config(state=tk.NORMAL)
+            logs_text.delete("1.0", tk.END)
+            logs_text.insert(tk.END, "\n".join(get_recent_logs(limit=500)) or "No log records yet.")
+            logs_text.see(tk.END)
+            logs_text.config(state=tk.DISABLED)
+
+        refresh_btn = tk.Button(logs_window, text="⟳ Refresh", command=refresh,
+                                font=("Segoe UI", 9), bg="#404040", fg="white",
+                                activebackground="#505050", activeforeground="white",
+                                relief="flat", bd=0, padx=10, pady=4)
+        refresh_btn.pack(side="bottom", fill="x")
+        scrollbar.pack(side="right", fill="y")
+        logs_text.pack(side="left", fill="both", expand=True)
+        refresh()
+
     def _show_help(self):
         """Show help and keyboard shortcuts"""
         self._close_menu()
@@ -0,0 +1,242 @@
+import tkinter as tk
+from typing import Callable, List, Optional
+
+
+class VirtualListView:
+    """
+    Canvas-based list that only draws the visible rows - SRP.
+    A small pool of row items is recycled while scrolling, so the cost of a redraw
+    depends on the window height, not on the number of rows.
+    Mirrors the parts of the Listbox API the media player uses (yview, yscrollcommand,
+    curselection, bind).
+    """
+    def __init__(self, parent: tk.Widget,
+                 row_text: Callable[[int], str],
+                 row_height: int = 24,
+                 bg: str = "#0B0B0D", fg: str = "#FFFFFF",
+                 select_bg: str = "#333335", select_fg: str = "#00FF88",
+                 current_fg: str = "#00FF88",
+                 font=("Inter", 10),
+                 yscrollcommand: Optional[Callable[[str, str], None]] = None):
+        self.row_text = row_text
+        self.row_height = row_height
+        self.colors = {'bg': bg, 'fg': fg, 'select_bg': select_bg,
+                       'select_fg': select_fg, 'current_fg': current_fg}
+        self.font = font
+        self.yscrollcommand = yscrollcommand
+
+        self.canvas = tk.Canvas(parent, bg=bg, bd=0, highlightthickness=0, takefocus=1)
+
+        self._count = 0
+        self._offset = 0  # Scroll position in pixels
+        self._selected: Optional[int] = None
+        self._current: Optional[int] = None
+        # Row pool: each slot is [background id, text id, row shown, text shown, style shown]
+        self._slots: List[list] = []
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Button-3>", self._on_click, add="+")
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_pixels(-3 * self.row_height))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_pixels(3 * self.row_height))
+        self.canvas.bind("<Up>", lambda e: self._move_selection(-1))
+        self.canvas.bind("<Down>", lambda e: self._move_selection(1))
+
+    # Geometry / Listbox-like API -------------------------------------------------
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def bind(self, sequence: str, func, add: Optional[str] = "+"):
+        """Bind on the canvas; handlers run after the row under the pointer is selected"""
+        return self.canvas.bind(sequence, func, add)
+
+    def config(self, **kwargs):
+        if 'yscrollcommand' in kwargs:
+            self.yscrollcommand = kwargs.pop('yscrollcommand')
+            self._update_scrollbar()
+        if kwargs:
+            self.canvas.config(**kwargs)
+
+    def curselection(self):
+        return (self._selected,) if self._selected is not None else ()
+
+    def selection_set(self, index: int):
+        self._set_selected(index)
+
+    def nearest(self, y: int) -> int:
+        """Row index under a canvas y coordinate"""
+        return int((self._offset + y) // self.row_height)
+
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        if not args:
+            return self._fractions()
+        if args[0] == 'moveto':
+            self._scroll_to_offset(float(args[1]) * self._content_height())
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            step = self.row_height if args[2] == 'units' else max(self.row_height, self._view_height() - self.row_height)
+            self._scroll_pixels(amount * step)
+
+    def see(self, index: int):
+        """Scroll the minimum amount needed to make a row visible"""
+        top = index * self.row_height
+        bottom = top + self.row_height
+        if top < self._offset:
+            self._scroll_to_offset(top)
+        elif bottom > self._offset + self._view_height():
+            self._scroll_to_offset(bottom - self._view_height())
+
+    # Content updates ---------------------------------------------------------------
+
+    def set_count(self, count: int):
+        """Set the number of rows (after tracks were added/removed) and redraw visible rows"""
+        self._count = count
+        if self._selected is not None and self._selected >= count:
+            self._selected = None
+        if self._current is not None and self._current >= count:
+            self._current = None
+        self._scroll_to_offset(self._offset)  # Re-clamp and redraw
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the text of the visible rows (rows whose text is unchanged are not touched)"""
+        for slot in self._slots:
+            slot[3] = None
+        self._render()
+
+    def set_current(self, index: Optional[int]):
+        """Move the current-track highlight, updating only the affected rows"""
+        if index == self._current:
+            return
+        previous, self._current = self._current, index
+        self._refresh_rows(previous, index)
+
+    def refresh_row(self, index: Optional[int]):
+        """Re-read the text of a single row if it is visible"""
+        self._refresh_rows(index)
+
+    # Rendering ---------------------------------------------------------------------
+
+    def _view_height(self) -> int:
+        return max(self.canvas.winfo_height(), 1)
+
+    def _content_height(self) -> int:
+        return self._count * self.row_height
+
+    def _fractions(self):
+        total = self._content_height()
+        if total <= 0:
+            return 0.0, 1.0
+        return self._offset / total, min(1.0, (self._offset + self._view_height()) / total)
+
+    def _update_scrollbar(self):
+        if self.yscrollcommand:
+            first, last = self._fractions()
+            self.yscrollcommand(str(first), str(last))
+
+    def _scroll_pixels(self, delta: int):
+        self._scroll_to_offset(self._offset + delta)
+
+    def _scroll_to_offset(self, offset: float):
+        max_offset = max(0, self._content_height() - self._view_height())
+        offset = int(max(0, min(offset, max_offset)))
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+        self._update_scrollbar()
+
+    def _on_configure(self, event):
+        """Resize the row pool to cover the visible area"""
+        needed = event.height // self.row_height + 2
+        while len(self._slots) < needed:
+            background = self.canvas.create_rectangle(0, 0, 0, 0, outline="", fill=self.colors['bg'])
+            text = self.canvas.create_text(8, 0, anchor="w", text="", font=self.font, fill=self.colors['fg'])
+            self._slots.append([background, text, None, None, None])
+        while len(self._slots) > needed:
+            background, text = self._slots.pop()[:2]
+            self.canvas.delete(background, text)
+        for slot in self._slots:
+            slot[2] = None  # Width may have changed - force coords update
+        self._scroll_to_offset(self._offset)
+        self._render()
+
+    def _render(self):
+        """Position pooled items for the rows in view; only changed rows are reconfigured"""
+        if not self._slots:
+            return
+        width = self.canvas.winfo_width()
+        first = self._offset // self.row_height
+        for k, slot in enumerate(self._slots):
+            row = first + k
+            background, text, shown_row, shown_text = slot[:4]
+            if row >= self._count:
+                if shown_row is not None or shown_text != "":
+                    self.canvas.itemconfigure(background, state="hidden")
+                    self.canvas.itemconfigure(text, state="hidden")
+                    slot[2], slot[3] = None, ""
+                continue
+
+            y = row * self.row_height - self._offset
+            self.canvas.coords(background, 0, y, width, y + self.row_height)
+            self.canvas.coords(text, 8, y + self.row_height // 2)
+            if shown_row != row or shown_text is None:
+                label = self.row_text(row)
+                self.canvas.itemconfigure(text, text=label, state="normal")
+                self.canvas.itemconfigure(background, state="normal")
+                slot[2], slot[3] = row, label
+            self._style_slot(slot, row)
+
+    def _style_slot(self, slot: list, row: int):
+        """Apply the row's colours unless the slot already shows that style"""
+        style = 'selected' if row == self._selected else 'current' if row == self._current else 'normal'
+        if slot[4] == style:
+            return
+        background, text = slot[0], slot[1]
+        if style == 'selected':
+            self.canvas.itemconfigure(background, fill=self.colors['select_bg'])
+            self.canvas.itemconfigure(text, fill=self.colors['select_fg'])
+        else:
+            self.canvas.itemconfigure(background, fill=self.colors['bg'])
+            self.canvas.itemconfigure(text, fill=self.colors['current_fg'] if style == 'current' else self.colors['fg'])
+        slot[4] = style
+
+    def _refresh_rows(self, *rows):
+        first = self._offset // self.row_height
+        for row in rows:
+            if row is None:
+                continue
+            k = row - first
+            if 0 <= k < len(self._slots) and row < self._count:
+                slot = self._slots[k]
+                label = self.row_text(row)
+                if label != slot[3]:
+                    self.canvas.itemconfigure(slot[1], text=label)
+                    slot[3] = label
+                self._style_slot(slot, row)
+
+    # Interaction -------------------------------------------------------------------
+
+    def _set_selected(self, index: Optional[int]):
+        if index is not None and not 0 <= index < self._count:
+            index = None
+        previous, self._selected = self._selected, index
+        self._refresh_rows(previous, index)
+
+    def _move_selection(self, step: int):
+        if not self._count:
+            return
+        index = 0 if self._selected is None else max(0, min(self._selected + step, self._count - 1))
+        self._set_selected(index)
+        self.see(index)
+
+    def _on_click(self, event):
+        self.canvas.focus_set()
+        self._set_selected(self.nearest(event.y))
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        steps = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+        self._scroll_pixels(steps * 3 * self.row_height)